@@ -0,0 +1,56 @@
+"""Compares decoding a 1000-item page with the default JSON path against the schema-driven decoder.
+
+Usage: python benchmarks/decoding.py [--items N] [--repeat N]
+
+The "decode + build" rows include building the models, which convert the decoded strings the same
+way for both decoders. The StructDecoder rows are skipped when msgspec is not installed.
+"""
+
+from typing import Any, Callable
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lastfm.decoding import JSONDecoder, StructDecoder
+from lastfm.track import UserTrack
+
+from serialization import make_response
+
+METHOD = 'user.getRecentTracks'
+
+def bench(name: str, fn: Callable[[], Any], repeat: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f'{name:<32} {best * 1000:>10.3f} ms')
+
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+
+    args = parser.parse_args()
+    body = make_response(args.items)
+
+    print(f'{args.items} tracks, {len(body)} bytes')
+
+    decoders = [('json', JSONDecoder())]
+    try:
+        decoders.append(('msgspec', StructDecoder()))
+    except RuntimeError:
+        print('msgspec is not installed, skipping StructDecoder')
+
+    for name, decoder in decoders:
+        bench(f'{name}: decode', lambda: decoder.decode(METHOD, body), args.repeat)
+        bench(
+            f'{name}: decode + build',
+            lambda: [UserTrack(track, None) for track in decoder.decode(METHOD, body)['recenttracks']['track']], # type: ignore
+            args.repeat
+        )
+
+if __name__ == '__main__':
+    main()
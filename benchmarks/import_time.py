@@ -0,0 +1,80 @@
+"""Guards the cost of ``import lastfm`` using ``python -X importtime``.
+
+Usage: python benchmarks/import_time.py [--max-us MICROSECONDS] [--statement CODE]
+
+Exits with a non-zero status if the statement pulls in aiohttp, or if the time spent importing
+modules on top of interpreter startup goes over the given budget.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(statement: str) -> Dict[str, Tuple[int, int, int]]:
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([ROOT, os.environ.get('PYTHONPATH', '')])}
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        env=env,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True
+    )
+
+    modules: Dict[str, Tuple[int, int, int]] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+
+    return modules
+
+def total(modules: Dict[str, Tuple[int, int, int]], baseline: Iterable[str]) -> int:
+    # Everything the statement imported on top of interpreter startup, counted once through the
+    # top-level entries since their cumulative times already include nested imports.
+    skip = set(baseline)
+    return sum(cumulative for name, (_, cumulative, depth) in modules.items() if depth == 0 and name not in skip)
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--max-us', type=int, default=50_000, help='Budget for the total import time of the statement')
+    parser.add_argument('--statement', default='import lastfm; lastfm.Period, lastfm.ImageSize')
+    parser.add_argument('--runs', type=int, default=5)
+
+    args = parser.parse_args()
+    failures: List[str] = []
+
+    baseline = measure('pass')
+
+    timings = []
+    for _ in range(args.runs):
+        modules = measure(args.statement)
+        timings.append(total(modules, baseline))
+
+        eager = sorted(name for name in modules if name == 'aiohttp' or name.startswith('aiohttp.'))
+        if eager:
+            failures.append(f'aiohttp was imported eagerly: {", ".join(eager[:5])}')
+            break
+
+    best = min(timings)
+    print(f'{args.statement}: best of {len(timings)} = {best} us (budget {args.max_us} us)')
+
+    if best > args.max_us:
+        failures.append(f'cumulative import time {best} us is over the {args.max_us} us budget')
+
+    for failure in failures:
+        print(f'FAIL: {failure}', file=sys.stderr)
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Compares rebuilding models from serialized form against re-parsing the raw API response.
+
+Usage: python benchmarks/serialization.py [--items N] [--repeat N]
+
+The msgpack rows are skipped when msgpack is not installed.
+"""
+
+from typing import Any, Callable, Dict, List
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lastfm
+from lastfm.track import UserTrack
+
+def make_track(i: int) -> Dict[str, Any]:
+    return {
+        'artist': {'mbid': '', '#text': f'Artist {i % 97}'},
+        'streamable': '0',
+        'image': [{'size': size, '#text': f'https://lastfm.freetls.fastly.net/i/u/{size}/{i}.png'} for size in ('small', 'medium', 'large', 'extralarge')],
+        'mbid': f'{i:08x}-0000-0000-0000-000000000000',
+        'album': {'mbid': '', '#text': f'Album {i % 211}'},
+        'name': f'Track {i}',
+        'url': f'https://www.last.fm/music/Artist+{i % 97}/_/Track+{i}',
+        'date': {'uts': str(1_600_000_000 + i * 180), '#text': '13 Sep 2020, 12:26'}
+    }
+
+def make_response(items: int) -> bytes:
+    tracks = [make_track(i) for i in range(items)]
+    attr = {'user': 'bench', 'totalPages': '1', 'page': '1', 'perPage': str(items), 'total': str(items)}
+
+    return json.dumps({'recenttracks': {'track': tracks, '@attr': attr}}).encode('utf-8')
+
+def bench(name: str, fn: Callable[[], Any], repeat: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f'{name:<32} {best * 1000:>10.3f} ms')
+
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+
+    args = parser.parse_args()
+
+    raw = make_response(args.items)
+    models: List[UserTrack] = [UserTrack(track, None) for track in json.loads(raw)['recenttracks']['track']] # type: ignore
+    dicts = [model.to_dict() for model in models]
+    pickled = pickle.dumps(models)
+
+    print(f'{args.items} tracks, {len(raw)} bytes of JSON, {len(pickled)} bytes pickled')
+
+    bench('json.loads + build', lambda: [UserTrack(track, None) for track in json.loads(raw)['recenttracks']['track']], args.repeat) # type: ignore
+    bench('from_dict', lambda: [lastfm.loads(data) for data in dicts], args.repeat)
+    bench('pickle.loads', lambda: pickle.loads(pickled), args.repeat)
+
+    try:
+        import msgpack
+    except ImportError:
+        print('msgpack is not installed, skipping binary round-trips')
+    else:
+        blobs = [model.to_bytes() for model in models]
+        packed = msgpack.packb(dicts, use_bin_type=True)
+
+        print(f'{sum(map(len, blobs))} bytes as per-model msgpack, {len(packed)} bytes as one msgpack array')
+
+        bench('from_bytes (per model)', lambda: [lastfm.loads(blob) for blob in blobs], args.repeat)
+        bench('msgpack array + from_dict', lambda: [lastfm.loads(data) for data in msgpack.unpackb(packed, raw=False)], args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Compares aggregating a scrobble history in pure Python against ListeningStats.
+
+Usage: python benchmarks/stats.py [--rows N] [--artists N] [--repeat N]
+
+Rows are generated directly as interned columns, so only the aggregation itself is measured.
+"""
+
+from typing import Any, Callable, Dict
+
+import argparse
+import collections
+import datetime
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from lastfm.interner import Interner
+from lastfm.stats import ListeningStats
+
+def bench(name: str, fn: Callable[[], Any], repeat: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f'{name:<32} {best * 1000:>10.3f} ms')
+
+    return best
+
+def python_aggregate(uts: Any, artists: Any) -> Dict[str, Any]:
+    counts: Dict[int, int] = collections.Counter()
+    hours = [0] * 24
+    weekdays = [0] * 7
+    days = set()
+
+    for timestamp, artist in zip(uts, artists):
+        date = datetime.datetime.utcfromtimestamp(timestamp)
+        counts[artist] += 1
+        hours[date.hour] += 1
+        weekdays[date.weekday()] += 1
+        days.add(date.date())
+
+    return {'counts': counts, 'hours': hours, 'weekdays': weekdays, 'days': days}
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--artists', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    uts = np.sort(rng.integers(1_400_000_000, 1_700_000_000, args.rows, dtype=np.int64))
+    artist_ids = rng.integers(0, args.artists, args.rows, dtype=np.int32)
+    track_ids = rng.integers(0, args.artists * 10, args.rows, dtype=np.int32)
+
+    artists = Interner(str(i) for i in range(args.artists))
+    tracks = Interner((str(i // 10), str(i)) for i in range(args.artists * 10))
+
+    def vectorized() -> None:
+        stats = ListeningStats()
+        stats.artists, stats.tracks = artists, tracks
+        stats.add_columns(uts, artist_ids, track_ids)
+        stats.top_artists(10)
+        stats.longest_streak()
+
+    print(f'{args.rows} scrobbles, {args.artists} artists')
+
+    uts_list, artists_list = uts.tolist(), artist_ids.tolist()
+    bench('python: aggregate', lambda: python_aggregate(uts_list, artists_list), args.repeat)
+    bench('numpy: aggregate', vectorized, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,94 @@
-from .album import *
-from .artist import *
-from .client import *
-from .paginator import *
-from .tag import *
-from .user import *
-from .track import *
-from .image import *
-from .wiki import *
-
-from . import errors
\ No newline at end of file
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import importlib
+
+if TYPE_CHECKING:
+    from .album import *
+    from .artist import *
+    from .client import *
+    from .paginator import *
+    from .tag import *
+    from .user import *
+    from .chart import Period
+    from .track import *
+    from .image import *
+    from .wiki import *
+    from .backfill import *
+    from .poller import *
+    from .ratelimit import *
+    from .writes import *
+    from .serialization import *
+    from .decoding import *
+    from .export import *
+    from .interner import *
+    from .stats import *
+    from .similarity import *
+    from .cooccurrence import *
+    from .search import *
+    from .corrections import *
+    from .snapshots import *
+    from .crawler import *
+    from .tracing import *
+    from .scheduler import *
+    from .adaptive import *
+    from .breaker import *
+    from .deadlines import *
+    from .hedging import *
+
+    from . import errors
+
+# Public names are only imported on first access, so `import lastfm` stays cheap for callers that
+# only need a couple of them. Every submodule re-exported here has to be listed with its `__all__`.
+_SUBMODULES: Dict[str, Tuple[str, ...]] = {
+    'album': ('Album', 'PartialAlbum'),
+    'artist': ('Artist', 'ArtistBio'),
+    'client': ('Client',),
+    'paginator': ('Page', 'Paginator', 'MergedPaginator', 'CheckpointStore', 'MemoryCheckpointStore', 'FileCheckpointStore'),
+    'tag': ('Tag',),
+    'user': ('User',),
+    'chart': ('Period',),
+    'track': ('Track',),
+    'image': ('ImageSize', 'Image'),
+    'wiki': ('Wiki',),
+    'backfill': ('ChartType', 'WeeklyChartResult', 'WeeklyChartBackfill'),
+    'poller': ('NowPlayingEventType', 'NowPlayingEvent', 'NowPlayingPoller'),
+    'ratelimit': ('RateLimiter',),
+    'writes': ('WriteOperation', 'WriteResult', 'WritePipeline', 'WriteQueue'),
+    'serialization': ('Serializable', 'dumps', 'loads'),
+    'decoding': ('JSONDecoder', 'StructDecoder'),
+    'export': ('Sink', 'JSONLSink', 'CSVSink', 'SQLiteSink', 'ParquetSink', 'register_fields', 'get_fields', 'export'),
+    'interner': ('Interner',),
+    'stats': ('Streak', 'ListeningStats'),
+    'similarity': ('Similarity', 'TasteMatrix'),
+    'cooccurrence': ('TagMatrix',),
+    'search': ('SearchResultType', 'SearchResult', 'SearchIndex'),
+    'corrections': ('Correction', 'CorrectionMap'),
+    'crawler': ('CrawlEventType', 'CrawlEvent', 'FriendCrawler'),
+    'tracing': ('Span', 'Tracer', 'SpanRecord', 'RecordingTracer', 'params_digest'),
+    'scheduler': ('Priority', 'Scheduler', 'priority', 'get_priority'),
+    'adaptive': ('AdaptiveLimit',),
+    'breaker': ('CircuitState', 'CircuitBreaker'),
+    'deadlines': ('deadline', 'get_deadline', 'remaining'),
+    'hedging': ('HedgingPolicy',),
+    'snapshots': ('ChartKind', 'ChartSnapshot', 'ChartDiff', 'SnapshotStore', 'MemorySnapshotStore', 'FileSnapshotStore', 'ChartSnapshotter'),
+}
+
+_LAZY: Dict[str, str] = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = tuple(_LAZY)
+
+def __getattr__(name: str) -> Any:
+    if name == 'errors':
+        return importlib.import_module('.errors', __name__)
+
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY, 'errors'])
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Optional
+import time
+
+__all__ = ('AdaptiveLimit',)
+
+class AdaptiveLimit:
+    # Additive increase, multiplicative decrease of a concurrency limit, driven by request outcomes.
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        minimum: int = 1,
+        maximum: int = 64,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        smoothing: float = 0.01
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError('Limits must satisfy 1 <= minimum <= initial <= maximum')
+
+        if not 0 < backoff < 1:
+            raise ValueError('backoff must be between 0 and 1')
+
+        if tolerance <= 1:
+            raise ValueError('tolerance must be greater than 1')
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+
+        self.baseline: Optional[float] = None
+        self._limit = float(initial)
+        self._decreased_at = 0.0
+
+    def __repr__(self) -> str:
+        return f'<AdaptiveLimit limit={self.limit} baseline={self.baseline}>'
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _decrease(self, start: float) -> None:
+        # Requests already in flight when the limit was cut report the same congestion, only the
+        # first of them counts.
+        if start < self._decreased_at:
+            return
+
+        self._limit = max(self.minimum, self._limit * self.backoff)
+        self._decreased_at = time.monotonic()
+
+    def update(self, start: float, latency: float, inflight: int, *, dropped: bool = False) -> None:
+        if dropped:
+            self._decrease(start)
+            return
+
+        # The baseline follows the fastest responses and only drifts up slowly, so a latency spike
+        # stands out against it instead of being absorbed.
+        baseline = self.baseline
+        if baseline is None or latency < baseline:
+            self.baseline = latency
+        else:
+            self.baseline = baseline + (latency - baseline) * self.smoothing
+
+        if baseline is not None and latency > baseline * self.tolerance:
+            self._decrease(start)
+        elif inflight >= self.limit:
+            # Only grow when the limit is actually the bottleneck, by about one request per round trip.
+            self._limit = min(self.maximum, self._limit + 1 / self._limit)
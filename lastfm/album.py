@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import Dict, Any, List, Optional
 
-from .http import HTTPClient
+from .http import HTTPClient, _is_legacy_auth, _legacy_auth
 
 from .tag import Tag
 from .image import Image
 from .track import Track
 from .wiki import Wiki
+from .serialization import Serializable
+from .paginator import Paginator, single_page
 
 __all__ = ('Album', 'PartialAlbum')
 
@@ -19,7 +21,7 @@ def _get_name(data: Dict[str, Any]) -> str:
 
     raise ValueError('No name found')
 
-class PartialAlbum:
+class PartialAlbum(Serializable):
     __slots__ = ('_http', '_data', 'mbid', 'name', 'artist')
 
     def __init__(self, data: Dict[str, Any], artist: Optional[str], http: HTTPClient) -> None:
@@ -38,16 +40,23 @@ class PartialAlbum:
     @property
     def images(self) -> List[Image]:
         return [Image(image, self._http) for image in self._data.get('image', [])]
-    
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': 'PartialAlbum', 'data': self._data, 'artist': self.artist}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], http: Optional[HTTPClient] = None) -> PartialAlbum:
+        return cls(data['data'], data.get('artist'), http) # type: ignore
+
     async def fetch(self) -> Album:
         if self.mbid:
             data = await self._http.get_album_info(mbid=self.mbid)
         else:
             data = await self._http.get_album_info(artist=self.artist, album=self.name)
 
-        return Album(data['album'], self._http)
+        return self._http.build(lambda: Album(data['album'], self._http))
 
-class Album:
+class Album(Serializable):
     __slots__ = (
         '_http', '_data', 'name', 'artist', 'mbid', 'url', 'listeners', 'playcount'
     )
@@ -100,20 +109,26 @@ class Album:
 
         return [Track(track, self._http) for track in tracks]
 
-    async def add_tags(self, api_sig: str, sk: str, *tags: str) -> None:
+    async def add_tags(self, *tags: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if _is_legacy_auth(tags):
+            api_sig, sk, tags = _legacy_auth('Album.add_tags', tags)
+
         if len(tags) > 10:
             raise ValueError('Cannot add more than 10 tags')
 
         if not self.artist:
             return
 
-        await self._http.add_album_tags(api_sig, sk, self.artist, self.name, tags)
+        await self._http.add_album_tags(self.artist, self.name, tags, api_sig=api_sig, sk=sk)
+
+    async def remove_tag(self, tag: str, *legacy: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if legacy:
+            api_sig, sk, (tag,) = _legacy_auth('Album.remove_tag', (tag, *legacy), 3)
 
-    async def remove_tag(self, api_sig: str, sk: str, tag: str) -> None:
         if not self.artist:
             return
     
-        await self._http.remove_album_tag(api_sig, sk, self.artist, self.name, tag)
+        await self._http.remove_album_tag(self.artist, self.name, tag, api_sig=api_sig, sk=sk)
 
     async def get_tags(
         self, *, user: Optional[str] = None
@@ -124,7 +139,7 @@ class Album:
             data = await self._http.get_album_tags(self.artist, self.name, user=user)
 
         tags = data['tags'].get('tag', [])
-        return [Tag(tag, self._http) for tag in tags]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in tags])
 
     async def get_top_tags(self) -> List[Tag]:
         if self.mbid:
@@ -133,5 +148,10 @@ class Album:
             data = await self._http.get_album_top_tags(self.artist, self.name)
 
         tags = data['toptags'].get('tag', [])
-        return [Tag(tag, self._http) for tag in tags]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in tags])
+
+    def iter_tags(self, *, user: Optional[str] = None, **options: Any) -> Paginator[Tag]:
+        return Paginator(single_page(self.get_tags), user=user, **options)
 
+    def iter_top_tags(self, **options: Any) -> Paginator[Tag]:
+        return Paginator(single_page(self.get_top_tags), **options)
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
-from .http import HTTPClient
+from .http import HTTPClient, _is_legacy_auth, _legacy_auth
 
 from .tag import Tag
 from .image import Image
 from .wiki import Wiki
+from .serialization import Serializable
+from .paginator import Page, Paginator, single_page
 
 if TYPE_CHECKING:
     from .album import Album
+    from .track import Track
 
 __all__ = ('Artist', 'ArtistBio')
 
@@ -26,7 +29,7 @@ class ArtistBio(Wiki):
     def __repr__(self) -> str:
         return f'<ArtistBio published={self.published!r}>'
 
-class Artist:
+class Artist(Serializable):
     __slots__ = (
         '_http',
         '_data',
@@ -81,14 +84,20 @@ class Artist:
         similar = self._data.get('similar', {}).get('artist', [])
         return [Artist(artist, self._http) for artist in similar]
 
-    async def add_tags(self, api_sig: str, sk: str, *tags: str) -> None:
+    async def add_tags(self, *tags: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if _is_legacy_auth(tags):
+            api_sig, sk, tags = _legacy_auth('Artist.add_tags', tags)
+
         if len(tags) > 10:
             raise ValueError('Cannot add more than 10 tags')
 
-        await self._http.add_artist_tags(api_sig, sk, self.name, tags)
+        await self._http.add_artist_tags(self.name, tags, api_sig=api_sig, sk=sk)
+
+    async def remove_tag(self, tag: str, *legacy: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if legacy:
+            api_sig, sk, (tag,) = _legacy_auth('Artist.remove_tag', (tag, *legacy), 3)
 
-    async def remove_tag(self, api_sig: str, sk: str, tag: str) -> None:
-        await self._http.remove_artist_tag(api_sig, sk, self.name, tag)
+        await self._http.remove_artist_tag(self.name, tag, api_sig=api_sig, sk=sk)
 
     async def get_tags(
         self, *, user: Optional[str] = None
@@ -96,18 +105,45 @@ class Artist:
         data = await self._http.get_artist_tags(self.name, user=user)
 
         tags = data['tags'].get('tag', [])    
-        return [Tag(tag, self._http) for tag in tags]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in tags])
 
     async def get_top_tags(self) -> List[Tag]:
         data = await self._http.get_artist_top_tags(self.name)
-        return [Tag(tag, self._http) for tag in data['toptags']['tag']]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in data['toptags']['tag']])
 
-    async def get_similar(self) -> List[Artist]:
-        data = await self._http.get_artist_similar(self.name)
-        return [Artist(artist, self._http) for artist in data['similarartists']['artist']]
+    async def get_similar(self, *, limit: Optional[int] = None) -> List[Artist]:
+        data = await self._http.get_artist_similar(self.name, limit=limit)
+        return self._http.build(lambda: [Artist(artist, self._http) for artist in data['similarartists']['artist']])
 
-    async def get_top_albums(self) -> List[Album]:
+    async def get_top_albums(
+        self, *, limit: Optional[int] = None, page: Optional[int] = None
+    ) -> Page[Album]:
         from .album import Album
 
-        data = await self._http.get_artist_top_albums(self.name)
-        return [Album(album, self._http) for album in data['topalbums']['album']]
\ No newline at end of file
+        data = await self._http.get_artist_top_albums(self.name, limit=limit, page=page)
+        items = self._http.build(lambda: [Album(album, self._http) for album in data['topalbums']['album']])
+        return Page.from_attr(items, data['topalbums'].get('@attr'))
+
+    async def get_top_tracks(
+        self, *, limit: Optional[int] = None, page: Optional[int] = None
+    ) -> Page[Track]:
+        from .track import Track
+
+        data = await self._http.get_artist_top_tracks(self.name, limit=limit, page=page)
+        items = self._http.build(lambda: [Track(track, self._http) for track in data['toptracks']['track']])
+        return Page.from_attr(items, data['toptracks'].get('@attr'))
+
+    def iter_tags(self, *, user: Optional[str] = None, **options: Any) -> Paginator[Tag]:
+        return Paginator(single_page(self.get_tags), user=user, **options)
+
+    def iter_top_tags(self, **options: Any) -> Paginator[Tag]:
+        return Paginator(single_page(self.get_top_tags), **options)
+
+    def iter_similar(self, *, limit: int = 100, max: Optional[int] = None, **options: Any) -> Paginator[Artist]:
+        return Paginator(single_page(self.get_similar, size=max), limit=limit, max=max, **options)
+
+    def iter_top_albums(self, *, limit: int = 50, **options: Any) -> Paginator[Album]:
+        return Paginator(self.get_top_albums, limit=limit, **options)
+
+    def iter_top_tracks(self, *, limit: int = 50, **options: Any) -> Paginator[Track]:
+        return Paginator(self.get_top_tracks, limit=limit, **options)
\ No newline at end of file
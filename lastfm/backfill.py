@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Container, Dict, Iterable, List, NamedTuple, Optional, Sequence
+from enum import Enum
+import datetime
+import asyncio
+
+from . import scheduler
+from .chart import WeeklyChart
+from .scheduler import Priority
+
+if TYPE_CHECKING:
+    from .user import User
+    from .artist import Artist
+    from .album import Album
+    from .track import Track
+
+__all__ = ('ChartType', 'WeeklyChartResult', 'WeeklyChartBackfill')
+
+class ChartType(str, Enum):
+    Artist = 'artist'
+    Album = 'album'
+    Track = 'track'
+
+class WeeklyChartResult(NamedTuple):
+    chart: WeeklyChart
+    artists: Optional[List[Artist]] = None
+    albums: Optional[List[Album]] = None
+    tracks: Optional[List[Track]] = None
+
+class WeeklyChartBackfill:
+    def __init__(
+        self,
+        user: User,
+        types: Sequence[ChartType] = (ChartType.Artist,),
+        *,
+        concurrency: int = 8,
+        exclude: Optional[Container[WeeklyChart]] = None,
+        charts: Optional[Iterable[WeeklyChart]] = None,
+        priority: Priority = Priority.Bulk
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        if not types:
+            raise ValueError('At least one chart type must be provided')
+
+        self.user = user
+        self.types = tuple(ChartType(type) for type in types)
+        self.concurrency = concurrency
+        self.exclude = exclude
+        self.charts: Optional[List[WeeklyChart]] = list(charts) if charts is not None else None
+        self.priority = Priority(priority)
+
+    def __repr__(self) -> str:
+        return f'<WeeklyChartBackfill user={self.user.name!r} types={self.types!r}>'
+
+    def __aiter__(self) -> AsyncIterator[WeeklyChartResult]:
+        return self.stream()
+
+    async def get_pending(self) -> List[WeeklyChart]:
+        if self.charts is None:
+            self.charts = await self.user.get_weekly_chart_list()
+
+        if self.exclude is None:
+            return list(self.charts)
+
+        # Closed weeks never change, so anything already stored can be skipped. The current week is
+        # always refetched since its chart is still being built.
+        now = datetime.datetime.now()
+        return [chart for chart in self.charts if chart.end > now or chart not in self.exclude]
+
+    async def _fetch_chart(self, semaphore: asyncio.Semaphore, chart: WeeklyChart, type: ChartType) -> List[Any]:
+        if type is ChartType.Artist:
+            method = self.user.get_weekly_artist_chart
+        elif type is ChartType.Album:
+            method = self.user.get_weekly_album_chart
+        else:
+            method = self.user.get_weekly_track_chart
+
+        async with semaphore:
+            return await method(start=chart.start, end=chart.end)
+
+    async def _fetch(self, semaphore: asyncio.Semaphore, chart: WeeklyChart) -> WeeklyChartResult:
+        results = await asyncio.gather(*[self._fetch_chart(semaphore, chart, type) for type in self.types])
+        kwargs: Dict[str, Any] = {f'{type.value}s': result for type, result in zip(self.types, results)}
+
+        return WeeklyChartResult(chart, **kwargs)
+
+    async def stream(self) -> AsyncIterator[WeeklyChartResult]:
+        pending = await self.get_pending()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        # Backfills yield to interactive traffic when the client has a scheduler.
+        with scheduler.priority(self.priority):
+            tasks = [asyncio.ensure_future(self._fetch(semaphore, chart)) for chart in pending]
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def all(self) -> List[WeeklyChartResult]:
+        results = [result async for result in self.stream()]
+        results.sort(key=lambda result: result.chart.start)
+
+        return results
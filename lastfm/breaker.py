@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Deque, Tuple
+from collections import deque
+from enum import Enum
+import time
+
+from .errors import CircuitOpen
+
+__all__ = ('CircuitState', 'CircuitBreaker')
+
+class CircuitState(str, Enum):
+    Closed = 'closed'
+    Open = 'open'
+    HalfOpen = 'half_open'
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.5,
+        window: float = 10.0,
+        minimum_calls: int = 20,
+        reset_timeout: float = 30.0,
+        probes: int = 1
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError('threshold must be between 0 and 1')
+
+        if window <= 0 or reset_timeout <= 0:
+            raise ValueError('window and reset_timeout must be greater than 0')
+
+        if minimum_calls < 1 or probes < 1:
+            raise ValueError('minimum_calls and probes must be greater than 0')
+
+        self.threshold = threshold
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+
+        self.state = CircuitState.Closed
+        self._opened_at = 0.0
+        self._probing = 0
+
+        # (timestamp, failed) for every outcome within the window, plus a running failure count.
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+
+    def __repr__(self) -> str:
+        return f'<CircuitBreaker state={self.state.value} failures={self._failures}/{len(self._outcomes)}>'
+
+    def _expire(self, now: float) -> None:
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] <= now - self.window:
+            _, failed = outcomes.popleft()
+            self._failures -= failed
+
+    def _open(self, now: float) -> None:
+        self.state = CircuitState.Open
+        self._opened_at = now
+        self._probing = 0
+
+    def check(self) -> None:
+        # Called before every attempt, raises instead of letting it through while the circuit is open.
+        if self.state is CircuitState.Closed:
+            return
+
+        now = time.monotonic()
+        remaining = self._opened_at + self.reset_timeout - now
+
+        if self.state is CircuitState.Open:
+            if remaining > 0:
+                raise CircuitOpen(remaining)
+
+            self.state = CircuitState.HalfOpen
+        elif self._probing >= self.probes:
+            if remaining > 0:
+                raise CircuitOpen(remaining)
+
+            # The trial requests never reported back (e.g. they were cancelled), let new ones through.
+            self._probing = 0
+
+        self._opened_at = now
+        self._probing += 1
+
+    def record(self, failed: bool) -> None:
+        now = time.monotonic()
+
+        if self.state is CircuitState.HalfOpen:
+            if failed:
+                self._open(now)
+            else:
+                self.state = CircuitState.Closed
+                self._outcomes.clear()
+                self._failures = 0
+
+            return
+
+        if self.state is CircuitState.Open:
+            return
+
+        self._outcomes.append((now, failed))
+        self._failures += failed
+        self._expire(now)
+
+        calls = len(self._outcomes)
+        if failed and calls >= self.minimum_calls and self._failures >= calls * self.threshold:
+            self._open(now)
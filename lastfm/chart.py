@@ -2,8 +2,17 @@ from __future__ import annotations
 
 from typing import Dict, Any, NamedTuple
 
+from enum import Enum
 import datetime
 
+class Period(str, Enum):
+    Overall = 'overall'
+    SevenDays = '7day'
+    OneMonth = '1month'
+    ThreeMonths = '3month'
+    SixMonths = '6month'
+    OneYear = '12month'
+
 class WeeklyChart(NamedTuple):
     start: datetime.datetime
     end: datetime.datetime
@@ -1,6 +1,6 @@
-from typing import Any, Optional, List
+from __future__ import annotations
 
-import aiohttp
+from typing import TYPE_CHECKING, Any, Iterable, Optional, List
 
 from .http import HTTPClient
 from .album import Album
@@ -8,13 +8,58 @@ from .artist import Artist
 from .track import Track
 from .user import User
 from .tag import Tag
+from .poller import NowPlayingPoller
+from .writes import WritePipeline, WriteQueue
+from .similarity import TasteMatrix
+from .search import SearchIndex, SearchResult, SearchResultType
+from .corrections import CorrectionMap
+from .snapshots import ChartSnapshotter
+from .crawler import FriendCrawler
+from .paginator import Page, Paginator
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .adaptive import AdaptiveLimit
+    from .breaker import CircuitBreaker
+    from .decoding import Decoder
+    from .hedging import HedgingPolicy
+    from .scheduler import Scheduler
+    from .tracing import Tracer
 
 __all__ = 'Client',
 
 class Client:
-    def __init__(self, api_key: str, *, session: Optional[aiohttp.ClientSession] = None) -> None:
+    def __init__(
+        self, 
+        api_key: str, 
+        *, 
+        secret: Optional[str] = None,
+        session_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        decoder: Optional[Decoder] = None,
+        tracer: Optional[Tracer] = None,
+        scheduler: Optional[Scheduler] = None,
+        limit: Optional[AdaptiveLimit] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None
+    ) -> None:
         self.api_key = api_key
-        self.http = HTTPClient(api_key, session)
+        self.http = HTTPClient(
+            api_key,
+            session,
+            secret=secret,
+            session_key=session_key,
+            decoder=decoder,
+            tracer=tracer,
+            scheduler=scheduler,
+            limit=limit,
+            breaker=breaker,
+            hedging=hedging
+        )
+        self.write_queue: Optional[WriteQueue] = None
+        self.search_index: Optional[SearchIndex] = None
+        self.corrections: Optional[CorrectionMap] = None
 
     async def __aenter__(self):
         return self
@@ -23,8 +68,79 @@ class Client:
         await self.close()
 
     async def close(self) -> None:
+        if self.write_queue is not None:
+            await self.write_queue.stop()
+
+        if self.search_index is not None and self.search_index.path is not None:
+            self.search_index.save()
+
+        if self.corrections is not None:
+            self.corrections.save()
+
         await self.http.close()
 
+    def now_playing_poller(self, users: Iterable[str] = (), **kwargs: Any) -> NowPlayingPoller:
+        return NowPlayingPoller(self.http, users, **kwargs)
+
+    def write_pipeline(self, **kwargs: Any) -> WritePipeline:
+        return WritePipeline(self.http, **kwargs)
+
+    def taste_matrix(self, **kwargs: Any) -> TasteMatrix:
+        return TasteMatrix(self.http, **kwargs)
+
+    def friend_crawler(self, seeds: Iterable[str], **kwargs: Any) -> FriendCrawler:
+        return FriendCrawler(self.http, seeds, **kwargs)
+
+    def chart_snapshotter(self, countries: Iterable[str] = (), **kwargs: Any) -> ChartSnapshotter:
+        return ChartSnapshotter(self.http, countries, **kwargs)
+
+    def enable_write_queue(
+        self, *, path: Optional[str] = None, interval: float = 5.0, pipeline: Optional[WritePipeline] = None
+    ) -> WriteQueue:
+        if self.write_queue is None:
+            self.write_queue = WriteQueue(self.http, path=path, interval=interval, pipeline=pipeline)
+            self.write_queue.start()
+
+        return self.write_queue
+
+    def enable_search_index(self, *, path: Optional[str] = None) -> SearchIndex:
+        if self.search_index is None:
+            self.search_index = SearchIndex(path=path)
+            self.http.response_hooks.append(self.search_index.observe)
+
+        return self.search_index
+
+    def enable_corrections(self, *, path: Optional[str] = None) -> CorrectionMap:
+        if self.corrections is None:
+            self.corrections = CorrectionMap(path=path)
+            self.http.request_hooks.append(self.corrections.rewrite)
+            self.http.response_hooks.append(self.corrections.observe)
+
+        return self.corrections
+
+    async def _suggest(
+        self, type: SearchResultType, query: str, limit: int, threshold: float, search: Any
+    ) -> List[SearchResult]:
+        index = self.enable_search_index()
+
+        results = index.search(query, type=type, limit=limit, threshold=threshold)
+        if results:
+            return results
+
+        # Nothing close enough locally, the search results are indexed by the hook and ranked
+        # alongside everything else.
+        await search(query, limit=limit)
+        return index.search(query, type=type, limit=limit)
+
+    async def suggest_artists(self, query: str, *, limit: int = 10, threshold: float = 0.5) -> List[SearchResult]:
+        return await self._suggest(SearchResultType.Artist, query, limit, threshold, self.search_artists)
+
+    async def suggest_albums(self, query: str, *, limit: int = 10, threshold: float = 0.5) -> List[SearchResult]:
+        return await self._suggest(SearchResultType.Album, query, limit, threshold, self.search_albums)
+
+    async def suggest_tracks(self, query: str, *, limit: int = 10, threshold: float = 0.5) -> List[SearchResult]:
+        return await self._suggest(SearchResultType.Track, query, limit, threshold, self.search_tracks)
+
     async def get_album_info(
         self, 
         artist: Optional[str] = None, 
@@ -51,7 +167,7 @@ class Client:
             lang=lang
         )
 
-        return Album(data['album'], self.http)
+        return self.http.build(lambda: Album(data['album'], self.http))
 
     async def get_artist_info(
         self, 
@@ -77,7 +193,7 @@ class Client:
             lang=lang
         )
 
-        return Artist(data['artist'], self.http)
+        return self.http.build(lambda: Artist(data['artist'], self.http))
 
     async def get_track_info(
         self, 
@@ -103,11 +219,11 @@ class Client:
             username=username,
         )
 
-        return Track(data['track'], self.http)
+        return self.http.build(lambda: Track(data['track'], self.http))
 
     async def get_user_info(self, user: str) -> User:
         data = await self.http.get_user_info(user)
-        return User(data['user'], self.http)
+        return self.http.build(lambda: User(data['user'], self.http))
 
     async def search_albums(
         self, 
@@ -115,9 +231,10 @@ class Client:
         *, 
         limit: Optional[int] = None, 
         page: Optional[int] = None
-    ) -> List[Album]:
+    ) -> Page[Album]:
         data = await self.http.search_albums(album, limit=limit, page=page)
-        return [Album(album, self.http) for album in data['results']['albummatches']['album']]
+        items = self.http.build(lambda: [Album(album, self.http) for album in data['results']['albummatches']['album']])
+        return Page.from_opensearch(items, data['results'])
 
     async def search_artists(
         self, 
@@ -125,24 +242,77 @@ class Client:
         *, 
         limit: Optional[int] = None, 
         page: Optional[int] = None
-    ) -> List[Artist]:
+    ) -> Page[Artist]:
         data = await self.http.search_artists(artist, limit=limit, page=page)
-        return [Artist(artist, self.http) for artist in data['results']['artistmatches']['artist']]
+        items = self.http.build(lambda: [Artist(artist, self.http) for artist in data['results']['artistmatches']['artist']])
+        return Page.from_opensearch(items, data['results'])
+
+    async def search_tracks(
+        self, 
+        track: str, 
+        *, 
+        limit: Optional[int] = None, 
+        page: Optional[int] = None
+    ) -> Page[Track]:
+        data = await self.http.search_track(track, limit=limit, page=page)
+        items = self.http.build(lambda: [Track(track, self.http) for track in data['results']['trackmatches']['track']])
+        return Page.from_opensearch(items, data['results'])
     
+    async def get_chart_top_artists(
+        self, *, limit: Optional[int] = None, page: Optional[int] = None
+    ) -> Page[Artist]:
+        data = await self.http.get_chart_top_artists(limit, page)
+        items = self.http.build(lambda: [Artist(artist, self.http) for artist in data['artists']['artist']])
+        return Page.from_attr(items, data['artists'].get('@attr'))
+
+    async def get_chart_top_tracks(
+        self, *, limit: Optional[int] = None, page: Optional[int] = None
+    ) -> Page[Track]:
+        data = await self.http.get_chart_top_tracks(limit, page)
+        items = self.http.build(lambda: [Track(track, self.http) for track in data['tracks']['track']])
+        return Page.from_attr(items, data['tracks'].get('@attr'))
+
     async def get_chart_top_tags(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Tag]:
+    ) -> Page[Tag]:
         data = await self.http.get_chart_top_tags(limit, page)
-        return [Tag(tag, self.http) for tag in data['tags']['tag']]
+        items = self.http.build(lambda: [Tag(tag, self.http) for tag in data['tags']['tag']])
+        return Page.from_attr(items, data['tags'].get('@attr'))
     
     async def get_country_top_tracks(
         self, country: str, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Track]:
+    ) -> Page[Track]:
         data = await self.http.get_geo_top_tracks(country, limit, page)
-        return [Track(track, self.http) for track in data['tracks']['track']]
+        items = self.http.build(lambda: [Track(track, self.http) for track in data['tracks']['track']])
+        return Page.from_attr(items, data['tracks'].get('@attr'))
     
     async def get_country_top_artists(
         self, country: str, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Artist]:
+    ) -> Page[Artist]:
         data = await self.http.get_geo_top_artists(country, limit, page)
-        return [Artist(artist, self.http) for artist in data['topartists']['artist']]
\ No newline at end of file
+        items = self.http.build(lambda: [Artist(artist, self.http) for artist in data['topartists']['artist']])
+        return Page.from_attr(items, data['topartists'].get('@attr'))
+
+    def iter_search_albums(self, album: str, *, limit: int = 50, **options: Any) -> Paginator[Album]:
+        return Paginator(self.search_albums, album, limit=limit, **options)
+
+    def iter_search_artists(self, artist: str, *, limit: int = 50, **options: Any) -> Paginator[Artist]:
+        return Paginator(self.search_artists, artist, limit=limit, **options)
+
+    def iter_search_tracks(self, track: str, *, limit: int = 50, **options: Any) -> Paginator[Track]:
+        return Paginator(self.search_tracks, track, limit=limit, **options)
+
+    def iter_chart_top_artists(self, *, limit: int = 50, **options: Any) -> Paginator[Artist]:
+        return Paginator(self.get_chart_top_artists, limit=limit, **options)
+
+    def iter_chart_top_tracks(self, *, limit: int = 50, **options: Any) -> Paginator[Track]:
+        return Paginator(self.get_chart_top_tracks, limit=limit, **options)
+
+    def iter_chart_top_tags(self, *, limit: int = 50, **options: Any) -> Paginator[Tag]:
+        return Paginator(self.get_chart_top_tags, limit=limit, **options)
+
+    def iter_country_top_tracks(self, country: str, *, limit: int = 50, **options: Any) -> Paginator[Track]:
+        return Paginator(self.get_country_top_tracks, country, limit=limit, **options)
+
+    def iter_country_top_artists(self, country: str, *, limit: int = 50, **options: Any) -> Paginator[Artist]:
+        return Paginator(self.get_country_top_artists, country, limit=limit, **options)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple, Union
+from array import array
+import asyncio
+import json
+
+from .errors import LastFMException
+from .interner import Interner
+from .stats import _get_numpy
+from .tag import Tag
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .artist import Artist
+    from .track import Track
+
+__all__ = ('TagMatrix',)
+
+EntityKey = Union[str, Tuple[str, ...]]
+
+def _get_scipy_sparse() -> Any:
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise RuntimeError('scipy is required for TagMatrix, install it with `pip install lastfm[scipy]`') from None
+
+    return scipy.sparse
+
+def _entity_key(entity: Union[Artist, Track]) -> EntityKey:
+    from .track import Track
+
+    if isinstance(entity, Track):
+        return (entity.artist.name, entity.name)
+
+    return entity.name
+
+class TagMatrix:
+    def __init__(self) -> None:
+        self._np = _get_numpy()
+        self._sparse = _get_scipy_sparse()
+
+        self.entities: Interner[EntityKey] = Interner()
+        # Tags are case-insensitive on last.fm, so they are interned lowercased.
+        self.tags: Interner[str] = Interner()
+
+        # Entries are accumulated as COO triplets and only merged into the CSR matrix when it is read.
+        self._rows = array('i')
+        self._columns = array('i')
+        self._weights = array('f')
+        self._csr: Any = None
+        self._cooccurrence: Any = None
+
+    def __repr__(self) -> str:
+        return f'<TagMatrix entities={len(self.entities)} tags={len(self.tags)}>'
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __contains__(self, entity: EntityKey) -> bool:
+        return entity in self.entities
+
+    def add(self, entity: EntityKey, tags: Iterable[Union[Tag, Tuple[str, float]]]) -> None:
+        # Adding an entity again replaces its tags instead of summing both sets of weights.
+        if entity in self.entities:
+            self._clear(self.entities.get(entity))
+
+        row = self.entities.intern(entity)
+
+        for tag in tags:
+            if isinstance(tag, Tag):
+                # Tags without a count (e.g. from user tagging) weigh the same as a top weighted one,
+                # a count of 0 is kept as it is.
+                name, weight = tag.name, tag.count if tag.count is not None else 100
+            else:
+                name, weight = tag
+
+            self._rows.append(row)
+            self._columns.append(self.tags.intern(name.lower()))
+            self._weights.append(weight)
+
+        self._cooccurrence = None
+
+    def _clear(self, row: int) -> None:
+        matrix = self.matrix
+        if row >= matrix.shape[0]:
+            return
+
+        # Cut the row's entries out directly, eliminating zeros would also drop other entities' 0 weights.
+        np = self._np
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        indptr = matrix.indptr.copy()
+        indptr[row + 1:] -= end - start
+
+        self._csr = self._sparse.csr_matrix(
+            (np.delete(matrix.data, np.s_[start:end]), np.delete(matrix.indices, np.s_[start:end]), indptr),
+            shape=matrix.shape
+        )
+
+    async def _worker(self, entities: Iterator[Union[Artist, Track]], errors: Dict[EntityKey, LastFMException]) -> None:
+        for entity in entities:
+            key = _entity_key(entity)
+
+            try:
+                tags = await entity.get_top_tags()
+            except LastFMException as exc:
+                errors[key] = exc
+            else:
+                self.add(key, tags)
+
+    async def consume(self, entities: Iterable[Union[Artist, Track]], *, concurrency: int = 8) -> Dict[EntityKey, LastFMException]:
+        # Workers share one iterator, so a large catalogue is streamed rather than scheduled all at once.
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        iterator = iter(entities)
+        errors: Dict[EntityKey, LastFMException] = {}
+
+        await asyncio.gather(*[self._worker(iterator, errors) for _ in range(concurrency)])
+        return errors
+
+    @property
+    def matrix(self) -> Any:
+        # Entities by tags CSR matrix of weights. A tag listed twice for an entity sums the weights.
+        np = self._np
+        shape = (len(self.entities), len(self.tags))
+
+        if self._rows or self._csr is None or self._csr.shape != shape:
+            weights = np.frombuffer(self._weights, dtype=np.float32)
+            rows = np.frombuffer(self._rows, dtype=np.int32)
+            columns = np.frombuffer(self._columns, dtype=np.int32)
+
+            # Adding sparse matrices drops explicit zeros, so the merged entries are rebuilt from the
+            # previous ones and the new triplets together, keeping tags with a weight of 0.
+            if self._csr is not None:
+                previous = self._csr.tocoo()
+                weights = np.concatenate((previous.data.astype(np.float32), weights))
+                rows = np.concatenate((previous.row.astype(np.int32), rows))
+                columns = np.concatenate((previous.col.astype(np.int32), columns))
+
+            csr = self._sparse.coo_matrix((weights, (rows, columns)), shape=shape).tocsr()
+            csr.sum_duplicates()
+
+            self._csr = csr
+            self._rows, self._columns, self._weights = array('i'), array('i'), array('f')
+
+        return self._csr
+
+    def cooccurrence(self) -> Any:
+        # Tags by tags CSR matrix counting the entities tagged with both. The diagonal is the number
+        # of entities carrying each tag.
+        if self._cooccurrence is None:
+            present = self.matrix.copy()
+            present.data[:] = 1
+
+            self._cooccurrence = (present.T @ present).tocsr()
+
+        return self._cooccurrence
+
+    def related(self, tag: str, k: int = 10) -> List[Tuple[str, float]]:
+        np = self._np
+
+        index = self.tags.get(tag.lower())
+        if index < 0:
+            return []
+
+        matrix = self.cooccurrence()
+        row = matrix.getrow(index)
+        counts = matrix.diagonal()
+
+        # Co-occurrence counts are normalized by how common both tags are, otherwise the most
+        # popular tags would be related to everything.
+        columns, values = row.indices, row.data
+        scores = values / np.sqrt(counts[index] * counts[columns])
+
+        keep = columns != index
+        columns, scores = columns[keep], scores[keep]
+
+        if k < len(scores):
+            top = np.argpartition(-scores, k)[:k]
+            columns, scores = columns[top], scores[top]
+
+        order = np.argsort(-scores, kind='stable')
+        return [(self.tags[int(column)], float(score)) for column, score in zip(columns[order], scores[order])]
+
+    def vector(self, entity: EntityKey) -> Dict[str, float]:
+        index = self.entities.get(entity)
+        if index < 0:
+            return {}
+
+        row = self.matrix.getrow(index)
+        return {self.tags[int(column)]: float(weight) for column, weight in zip(row.indices, row.data)}
+
+    def save(self, path: str) -> None:
+        np = self._np
+        matrix = self.matrix
+
+        np.savez_compressed(
+            path,
+            data=matrix.data,
+            indices=matrix.indices,
+            indptr=matrix.indptr,
+            shape=np.array(matrix.shape),
+            # Entity keys are either names or (artist, track) pairs, JSON keeps them apart.
+            entities=np.array([json.dumps(key) for key in self.entities], dtype=str),
+            tags=np.array(self.tags.keys, dtype=str)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> TagMatrix:
+        matrix = cls()
+
+        with matrix._np.load(path) as data:
+            entities = (json.loads(key) for key in data['entities'].tolist())
+            matrix.entities = Interner(tuple(key) if isinstance(key, list) else key for key in entities)
+            matrix.tags = Interner(data['tags'].tolist())
+            matrix._csr = matrix._sparse.csr_matrix(
+                (data['data'], data['indices'], data['indptr']), shape=tuple(data['shape'])
+            )
+
+        return matrix
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+import asyncio
+import json
+import os
+
+__all__ = ('Correction', 'CorrectionMap')
+
+class Correction(NamedTuple):
+    artist: str
+    track: Optional[str] = None
+    mbid: Optional[str] = None
+
+def _key(name: str) -> str:
+    return name.casefold().strip()
+
+def _name(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        return value or None
+    elif isinstance(value, dict):
+        return value.get('name') or value.get('#text') or None
+
+    return None
+
+# Reads that identify an artist or track by name. Searches match loosely on purpose and writes are
+# signed over the names they were called with, neither is rewritten.
+REWRITTEN_METHODS: FrozenSet[str] = frozenset({
+    'artist.getInfo',
+    'artist.getSimilar',
+    'artist.getTags',
+    'artist.getTopAlbums',
+    'artist.getTopTags',
+    'artist.getTopTracks',
+    'album.getInfo',
+    'album.getTags',
+    'album.getTopTags',
+    'track.getInfo',
+    'track.getSimilar',
+    'track.getTags',
+    'track.getTopTags',
+})
+
+class CorrectionMap:
+    def __init__(self, *, path: Optional[str] = None, save_delay: float = 5.0) -> None:
+        if save_delay < 0:
+            raise ValueError('save_delay must be greater than or equal to 0')
+
+        self.path = path
+        self.save_delay = save_delay
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+
+        # Raw names, casefolded, to their canonical spelling.
+        self._artists: Dict[str, Correction] = {}
+        self._tracks: Dict[Tuple[str, str], Correction] = {}
+
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __repr__(self) -> str:
+        return f'<CorrectionMap artists={len(self._artists)} tracks={len(self._tracks)}>'
+
+    def __len__(self) -> int:
+        return len(self._artists) + len(self._tracks)
+
+    def artist(self, name: str) -> Correction:
+        return self._artists.get(_key(name)) or Correction(name)
+
+    def track(self, artist: str, track: str) -> Correction:
+        # Requests are rewritten before they are sent, so a track correction may have been recorded
+        # under the already corrected artist.
+        canonical = self.artist(artist).artist
+
+        correction = self._tracks.get((_key(artist), _key(track))) or self._tracks.get((_key(canonical), _key(track)))
+        return correction or Correction(canonical, track)
+
+    # Names that came back exactly as they were sent are not recorded, there is nothing to rewrite.
+
+    def add_artist(self, raw: str, artist: str, mbid: Optional[str] = None) -> None:
+        key = _key(raw)
+        correction = Correction(artist, None, mbid or None)
+
+        if raw == artist and key not in self._artists:
+            return
+
+        if self._artists.get(key) != correction:
+            self._artists[key] = correction
+            self._changed()
+
+    def add_track(self, raw_artist: str, raw_track: str, artist: str, track: str, mbid: Optional[str] = None) -> None:
+        key = (_key(raw_artist), _key(raw_track))
+        correction = Correction(artist, track, mbid or None)
+
+        if (raw_artist, raw_track) == (artist, track) and key not in self._tracks:
+            return
+
+        if self._tracks.get(key) != correction:
+            self._tracks[key] = correction
+            self._changed()
+
+    def _changed(self) -> None:
+        # Lookups record corrections in bursts, they are written once things settle down instead of
+        # on every one of them. Outside of a running loop there is nothing to defer to.
+        if self.path is None or self._save_handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+        else:
+            self._save_handle = loop.call_later(self.save_delay, self.save)
+
+    def rewrite(self, params: Dict[str, Any]) -> None:
+        # Request hook for `HTTPClient.request_hooks`. Requests by mbid, or with a signature that
+        # covers the names as given, are left alone.
+        if params.get('method') not in REWRITTEN_METHODS or 'mbid' in params or 'api_sig' in params:
+            return
+
+        artist = params.get('artist')
+        if not isinstance(artist, str):
+            return
+
+        track = params.get('track')
+        if isinstance(track, str):
+            correction = self.track(artist, track)
+            params['track'] = correction.track
+        else:
+            correction = self.artist(artist)
+
+        params['artist'] = correction.artist
+
+    def observe(self, method: str, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        # Response hook for `HTTPClient.response_hooks`. Explicit corrections and the canonical names
+        # echoed back by lookups (autocorrected or not) are both recorded.
+        artist = params.get('artist')
+        if not isinstance(artist, str) or 'mbid' in params:
+            return
+
+        track = params.get('track')
+
+        if method == 'artist.getCorrection':
+            correction = (data.get('corrections') or {}).get('correction')
+            if isinstance(correction, dict) and correction.get('artist'):
+                self.add_artist(artist, correction['artist']['name'], correction['artist'].get('mbid'))
+        elif method == 'track.getCorrection':
+            correction = (data.get('corrections') or {}).get('correction')
+            if isinstance(correction, dict) and correction.get('track') and isinstance(track, str):
+                corrected = correction['track']
+                self.add_track(artist, track, _name(corrected['artist']) or artist, corrected['name'], corrected.get('mbid'))
+        elif method == 'artist.getInfo':
+            info = data.get('artist') or {}
+            if info.get('name'):
+                self.add_artist(artist, info['name'], info.get('mbid'))
+        elif method == 'track.getInfo':
+            info = data.get('track') or {}
+            name, canonical = info.get('name'), _name(info.get('artist'))
+            if name and canonical and isinstance(track, str):
+                self.add_track(artist, track, canonical, name, info.get('mbid'))
+                self.add_artist(artist, canonical, (info.get('artist') or {}).get('mbid'))
+        elif method == 'album.getInfo':
+            canonical = _name((data.get('album') or {}).get('artist'))
+            if canonical:
+                self.add_artist(artist, canonical)
+
+    def save(self) -> None:
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
+        if self.path is None:
+            return
+
+        data = {
+            'artists': [[raw, *correction] for raw, correction in self._artists.items()],
+            'tracks': [[*raw, *correction] for raw, correction in self._tracks.items()]
+        }
+
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        os.replace(tmp, self.path)
+
+    def load(self) -> None:
+        if self.path is None:
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        for raw, artist, track, mbid in data['artists']:
+            self._artists[raw] = Correction(artist, track, mbid)
+
+        for raw_artist, raw_track, artist, track, mbid in data['tracks']:
+            self._tracks[(raw_artist, raw_track)] = Correction(artist, track, mbid)
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+import asyncio
+import json
+import os
+
+from . import scheduler
+from .paginator import _to_int
+from .ratelimit import RateLimiter
+from .scheduler import Priority
+from .user import User
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+    from .export import Sink
+
+__all__ = ('CrawlEventType', 'CrawlEvent', 'FriendCrawler')
+
+class CrawlEventType(str, Enum):
+    Edge = 'edge'
+    Profile = 'profile'
+
+class CrawlEvent(NamedTuple):
+    type: CrawlEventType
+    user: str
+    depth: int
+    # Set on edges.
+    friend: Optional[str] = None
+    # Set on profiles.
+    profile: Optional[User] = None
+
+class FriendCrawler:
+    def __init__(
+        self,
+        http: HTTPClient,
+        seeds: Iterable[str] = (),
+        *,
+        max_depth: int = 1,
+        max_users: Optional[int] = None,
+        concurrency: int = 8,
+        rate: float = 5.0,
+        page_size: int = 200,
+        hydrate: bool = True,
+        batch_size: int = 50,
+        buffer: int = 1000,
+        path: Optional[str] = None,
+        priority: Priority = Priority.Bulk
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        if batch_size < 1 or buffer < 1:
+            raise ValueError('batch_size and buffer must be greater than 0')
+
+        self.http = http
+        self.seeds = list(seeds)
+        self.max_depth = max_depth
+        self.max_users = max_users
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.page_size = page_size
+        self.hydrate = hydrate
+        self.batch_size = batch_size
+        self.path = path
+        self.priority = Priority(priority)
+
+        # Depth at which each user was first reached. Together with the expanded and hydrated sets
+        # this is the whole crawl state, anything seen but not done yet is picked up on resume.
+        self.seen: Dict[str, int] = {}
+        self.expanded: Set[str] = set()
+        self.hydrated: Set[str] = set()
+        self.errors: Dict[str, Exception] = {}
+
+        self.buffer = buffer
+        self._unsaved = 0
+
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __repr__(self) -> str:
+        return f'<FriendCrawler seen={len(self.seen)} expanded={len(self.expanded)} max_depth={self.max_depth}>'
+
+    def __aiter__(self) -> AsyncIterator[CrawlEvent]:
+        return self.stream()
+
+    def _discover(self, name: str, depth: int) -> None:
+        previous = self.seen.get(name)
+        if previous is not None:
+            # Pages are expanded concurrently, a user can be reached through a longer path first.
+            if depth < previous:
+                self.seen[name] = depth
+                if depth < self.max_depth <= previous:
+                    self._expand_queue.put_nowait((depth, name))
+
+            return
+
+        if self.max_users is not None and len(self.seen) >= self.max_users:
+            return
+
+        self.seen[name] = depth
+        self._schedule(name, depth)
+
+    def _schedule(self, name: str, depth: int) -> None:
+        if self.hydrate and name not in self.hydrated:
+            self._hydrate_queue.put_nowait(name)
+
+        if depth < self.max_depth and name not in self.expanded:
+            self._expand_queue.put_nowait((depth, name))
+
+    async def _friends_page(self, name: str, page: int) -> Tuple[List[str], int]:
+        async with self._semaphore:
+            await self.limiter.acquire()
+            data = await self.http.get_user_friends(name, self.page_size, page)
+
+        friends = data['friends']
+        users = friends.get('user', [])
+        if isinstance(users, dict):
+            users = [users]
+
+        pages = _to_int((friends.get('@attr') or {}).get('totalPages')) or 1
+        return [user['name'] for user in users], pages
+
+    async def _expand(self, name: str) -> None:
+        depth = self.seen[name]
+
+        async def add(friends: List[str]) -> None:
+            for friend in friends:
+                await self._events.put(CrawlEvent(CrawlEventType.Edge, name, depth, friend))
+                self._discover(friend, depth + 1)
+
+        # Any failure is recorded against the user rather than ending the whole crawl.
+        try:
+            friends, pages = await self._friends_page(name, 1)
+            await add(friends)
+
+            # Once the page count is known the remaining pages are fetched concurrently.
+            for future in asyncio.as_completed([self._friends_page(name, page) for page in range(2, pages + 1)]):
+                friends, _ = await future
+                await add(friends)
+        except Exception as exc:
+            self.errors[name] = exc
+            return
+
+        self.expanded.add(name)
+
+    async def _profile(self, name: str) -> None:
+        try:
+            async with self._semaphore:
+                await self.limiter.acquire()
+                data = await self.http.get_user_info(name)
+
+            profile = User(data['user'], self.http)
+        except Exception as exc:
+            self.errors[name] = exc
+            return
+
+        self.hydrated.add(name)
+        await self._events.put(CrawlEvent(CrawlEventType.Profile, name, self.seen[name], profile=profile))
+
+    async def _expander(self) -> None:
+        while True:
+            _, name = await self._expand_queue.get()
+            try:
+                await self._expand(name)
+            except Exception as exc:
+                await self._events.put(exc)
+            finally:
+                self._expand_queue.task_done()
+
+            # Without hydration nothing else saves the state, so the expanders do it every batch.
+            self._unsaved += 1
+            if self._unsaved >= self.batch_size:
+                self.save()
+
+    async def _hydrator(self) -> None:
+        # Profiles are fetched in bounded batches, the state is saved after each one.
+        done = False
+        while not done:
+            batch: List[str] = []
+            name = await self._hydrate_queue.get()
+
+            while name is not None:
+                batch.append(name)
+                if len(batch) >= self.batch_size or self._hydrate_queue.empty():
+                    break
+
+                name = self._hydrate_queue.get_nowait()
+
+            done = name is None
+
+            try:
+                await asyncio.gather(*[self._profile(name) for name in batch])
+            except Exception as exc:
+                await self._events.put(exc)
+                return
+
+            self.save()
+
+    async def _run(self) -> None:
+        expanders = [asyncio.ensure_future(self._expander()) for _ in range(self.concurrency)]
+        hydrator = asyncio.ensure_future(self._hydrator())
+
+        try:
+            await self._expand_queue.join()
+            self._hydrate_queue.put_nowait(None)
+            await hydrator
+        except Exception as exc:
+            await self._events.put(exc)
+        else:
+            # Only sent when the crawl ends on its own, once cancelled there is no one left to read it.
+            await self._events.put(None)
+        finally:
+            for task in (*expanders, hydrator):
+                task.cancel()
+
+            await asyncio.gather(*expanders, hydrator, return_exceptions=True)
+
+    async def stream(self) -> AsyncIterator[CrawlEvent]:
+        # Created per crawl inside the running loop, before 3.10 they bind to the loop that is
+        # current when they are constructed.
+        # Crawling pauses once `buffer` events are waiting, instead of piling up while the consumer
+        # is busy (e.g. writing an export).
+        self._events: asyncio.Queue[Any] = asyncio.Queue(self.buffer)
+        # Shallower users are expanded first, so the crawl stays close to breadth-first order.
+        self._expand_queue: asyncio.PriorityQueue[Tuple[int, str]] = asyncio.PriorityQueue()
+        self._hydrate_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        for seed in self.seeds:
+            self.seen.setdefault(seed, 0)
+
+        # When resuming, users that were reached but not finished are queued again.
+        for name, depth in self.seen.items():
+            self._schedule(name, depth)
+
+        with scheduler.priority(self.priority):
+            task = asyncio.ensure_future(self._run())
+
+        try:
+            while True:
+                event = await self._events.get()
+                if event is None:
+                    break
+                elif isinstance(event, Exception):
+                    raise event
+
+                yield event
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+            self.save()
+
+    async def export(self, edges: Sink, profiles: Optional[Sink] = None) -> Tuple[int, int]:
+        from .export import get_fields
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(1)
+
+        fields = get_fields(User)
+        getters = tuple(fields.values())
+
+        edge_rows: List[Tuple[Any, ...]] = []
+        profile_rows: List[Tuple[Any, ...]] = []
+        counts = [0, 0]
+
+        async def flush(sink: Optional[Sink], rows: List[Tuple[Any, ...]], index: int) -> None:
+            if sink is not None and rows:
+                await loop.run_in_executor(executor, sink.write, list(rows))
+                counts[index] += len(rows)
+
+            rows.clear()
+
+        try:
+            await loop.run_in_executor(executor, edges.open, ('user', 'friend', 'depth'))
+            if profiles is not None:
+                await loop.run_in_executor(executor, profiles.open, tuple(fields))
+
+            async for event in self.stream():
+                if event.type is CrawlEventType.Edge:
+                    edge_rows.append((event.user, event.friend, event.depth))
+                    if len(edge_rows) >= self.batch_size:
+                        await flush(edges, edge_rows, 0)
+                elif profiles is not None:
+                    profile_rows.append(tuple(getter(event.profile) for getter in getters))
+                    if len(profile_rows) >= self.batch_size:
+                        await flush(profiles, profile_rows, 1)
+
+            await flush(edges, edge_rows, 0)
+            await flush(profiles, profile_rows, 1)
+        finally:
+            try:
+                await loop.run_in_executor(executor, edges.close)
+                if profiles is not None:
+                    await loop.run_in_executor(executor, profiles.close)
+            finally:
+                executor.shutdown(wait=False)
+
+        return counts[0], counts[1]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        self._unsaved = 0
+        data = {'seen': self.seen, 'expanded': list(self.expanded), 'hydrated': list(self.hydrated)}
+
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        os.replace(tmp, self.path)
+
+    def load(self) -> None:
+        if self.path is None:
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.seen.update(data['seen'])
+        self.expanded.update(data['expanded'])
+        self.hydrated.update(data['hydrated'])
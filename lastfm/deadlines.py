@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional
+import contextlib
+import contextvars
+import time
+
+__all__ = ('deadline', 'get_deadline', 'remaining')
+
+# Absolute `time.monotonic()` deadline of the current call chain, None when it is unbounded.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('deadline', default=None)
+
+def get_deadline(timeout: Optional[float] = None) -> Optional[float]:
+    # The earliest of the enclosing deadline and `timeout` seconds from now.
+    current = _deadline.get()
+    if timeout is None:
+        return current
+
+    deadline = time.monotonic() + timeout
+    return deadline if current is None else min(current, deadline)
+
+def remaining() -> Optional[float]:
+    current = _deadline.get()
+    if current is None:
+        return None
+
+    return max(current - time.monotonic(), 0.0)
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> Iterator[float]:
+    # Nested blocks can only shorten the deadline. Every request made inside the block, including the
+    # ones models make on their own (e.g. `PartialAlbum.fetch`), shares it across retries.
+    if timeout < 0:
+        raise ValueError('timeout must be greater than or equal to 0')
+
+    value = get_deadline(timeout)
+    assert value is not None
+
+    token = _deadline.set(value)
+    try:
+        yield value
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Type, TypedDict, Union, Protocol
+
+import json
+
+__all__ = ('JSONDecoder', 'StructDecoder')
+
+# Schemas of the list endpoints. Keys that aren't listed are skipped while decoding rather than
+# materialized, so every key a model reads must be listed here (tests/test_decoding.py checks
+# this against the model properties). Scalars stay the raw strings last.fm sends, which keeps the
+# output interchangeable with `json.loads`: this is only a faster parser, the models convert
+# fields exactly as they do with JSONDecoder. Containers that are rarely present in list
+# responses are left untyped so nothing under them is skipped.
+
+_Image = TypedDict('_Image', {'#text': str, 'size': str}, total=False)
+_Date = TypedDict('_Date', {'uts': str, '#text': str}, total=False)
+_Stats = TypedDict('_Stats', {'listeners': str, 'playcount': str}, total=False)
+_Wiki = TypedDict('_Wiki', {'published': str, 'summary': str, 'content': str}, total=False)
+
+# Also the shape of the artist embedded in tracks and albums, which is read as an Artist.
+_Artist = TypedDict('_Artist', {
+    '#text': str,
+    'name': str,
+    'url': str,
+    'mbid': str,
+    'streamable': str,
+    'ontour': str,
+    'listeners': str,
+    'playcount': str,
+    'stats': _Stats,
+    'image': List[_Image],
+    'tags': Dict[str, Any],
+    'similar': Dict[str, Any],
+    '@attr': Dict[str, Any],
+}, total=False)
+
+_AlbumRef = TypedDict('_AlbumRef', {
+    '#text': str,
+    'title': str,
+    'mbid': str,
+    'artist': Any,
+    'image': List[_Image],
+}, total=False)
+
+_Track = TypedDict('_Track', {
+    'name': str,
+    'url': str,
+    'mbid': str,
+    'duration': Any,
+    'listeners': str,
+    'playcount': str,
+    'stats': _Stats,
+    'streamable': Any,
+    'loved': str,
+    'artist': _Artist,
+    'album': _AlbumRef,
+    'image': List[_Image],
+    'date': _Date,
+    'toptags': Dict[str, Any],
+    '@attr': Dict[str, Any],
+}, total=False)
+
+_Album = TypedDict('_Album', {
+    'name': str,
+    'url': str,
+    'mbid': str,
+    'listeners': str,
+    'playcount': str,
+    'artist': Union[str, _Artist],
+    'image': List[_Image],
+    'wiki': _Wiki,
+    'tags': Dict[str, Any],
+    'tracks': Dict[str, Any],
+    '@attr': Dict[str, Any],
+}, total=False)
+
+_Tracks = TypedDict('_Tracks', {'track': List[_Track], '@attr': Dict[str, Any]}, total=False)
+_Artists = TypedDict('_Artists', {'artist': List[_Artist], '@attr': Dict[str, Any]}, total=False)
+_Albums = TypedDict('_Albums', {'album': List[_Album], '@attr': Dict[str, Any]}, total=False)
+
+def _response(key: str, body: Type[Any]) -> Type[Any]:
+    # Error payloads share the schema so they still decode and surface as HTTPException.
+    return TypedDict(f'_{key}', {key: body, 'error': int, 'message': str}, total=False) # type: ignore
+
+SCHEMAS: Dict[str, Type[Any]] = {
+    'user.getRecentTracks': _response('recenttracks', _Tracks),
+    'user.getLovedTracks': _response('lovedtracks', _Tracks),
+    'user.getTopTracks': _response('toptracks', _Tracks),
+    'user.getTopArtists': _response('topartists', _Artists),
+    'user.getTopAlbums': _response('topalbums', _Albums),
+    'library.getArtists': _response('artists', _Artists),
+    'artist.getTopTracks': _response('toptracks', _Tracks),
+    'artist.getTopAlbums': _response('topalbums', _Albums),
+    'tag.getTopTracks': _response('tracks', _Tracks),
+    'tag.getTopArtists': _response('topartists', _Artists),
+    'tag.getTopAlbums': _response('albums', _Albums),
+    'geo.getTopTracks': _response('tracks', _Tracks),
+    'geo.getTopArtists': _response('topartists', _Artists),
+    'chart.getTopTracks': _response('tracks', _Tracks),
+    'chart.getTopArtists': _response('artists', _Artists),
+}
+
+class Decoder(Protocol):
+    def decode(self, method: str, body: bytes) -> Dict[str, Any]:
+        ...
+
+class JSONDecoder:
+    def __repr__(self) -> str:
+        return '<JSONDecoder>'
+
+    def decode(self, method: str, body: bytes) -> Dict[str, Any]:
+        return json.loads(body)
+
+class StructDecoder:
+    def __init__(self, schemas: Optional[Dict[str, Type[Any]]] = None) -> None:
+        try:
+            import msgspec
+        except ImportError:
+            raise RuntimeError('msgspec is required for StructDecoder, install it with `pip install lastfm[msgspec]`') from None
+
+        self._msgspec = msgspec
+        self._fallback = msgspec.json.Decoder()
+        self._decoders = {
+            method: msgspec.json.Decoder(schema) for method, schema in {**SCHEMAS, **(schemas or {})}.items()
+        }
+
+    def __repr__(self) -> str:
+        return f'<StructDecoder schemas={len(self._decoders)}>'
+
+    def decode(self, method: str, body: bytes) -> Dict[str, Any]:
+        decoder = self._decoders.get(method)
+        if decoder is None:
+            return self._fallback.decode(body)
+
+        try:
+            return decoder.decode(body)
+        except self._msgspec.ValidationError:
+            # last.fm collapses single-item lists into objects on some endpoints, those responses
+            # don't match the schema and are decoded without one.
+            return self._fallback.decode(body)
@@ -1,5 +1,10 @@
 from typing import Any, Dict
 
+import asyncio
+
+# Service offline, temporarily unavailable and rate limit exceeded. Everything else is a permanent failure.
+RETRYABLE_ERRORS = (11, 16, 29)
+
 class LastFMException(Exception):
     pass
 
@@ -10,4 +15,16 @@ class HTTPException(LastFMException):
         self.error: int = response['error']
         self.message: str = response['message']
 
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class CircuitOpen(LastFMException):
+    def __init__(self, retry_after: float) -> None:
+        # Seconds until the circuit lets a trial request through again.
+        self.retry_after = retry_after
+
+        super().__init__(f'Circuit is open, retry in {retry_after:.1f}s')
+
+class DeadlineExceeded(LastFMException, asyncio.TimeoutError):
+    # Also an `asyncio.TimeoutError`, so code that already handles timeouts keeps working.
+    def __init__(self) -> None:
+        super().__init__('Deadline exceeded')
\ No newline at end of file
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+import asyncio
+import csv
+import json
+
+from .paginator import EmptyPage, MaxReached
+from .track import Track, UserTrack
+from .artist import Artist
+from .album import Album, PartialAlbum
+from .tag import Tag
+from .user import User
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .paginator import AbstractPaginator
+
+__all__ = (
+    'Sink',
+    'JSONLSink',
+    'CSVSink',
+    'SQLiteSink',
+    'ParquetSink',
+    'register_fields',
+    'get_fields',
+    'export',
+)
+
+Getter = Callable[[Any], Any]
+Fields = Dict[str, Getter]
+
+_FIELDS: Dict[type, Fields] = {}
+
+def _getter(value: Union[str, Getter]) -> Getter:
+    if not isinstance(value, str):
+        return value
+
+    # Dotted paths short-circuit on None so optional relations (e.g. `album.name`) export as empty.
+    names = value.split('.')
+    def getter(obj: Any) -> Any:
+        for name in names:
+            if obj is None:
+                return None
+
+            obj = getattr(obj, name)
+
+        return obj
+
+    return attrgetter(value) if len(names) == 1 else getter
+
+def register_fields(cls: type, fields: Mapping[str, Union[str, Getter]]) -> None:
+    _FIELDS[cls] = {column: _getter(value) for column, value in fields.items()}
+
+def get_fields(cls: type) -> Fields:
+    for base in cls.__mro__:
+        fields = _FIELDS.get(base)
+        if fields is not None:
+            return fields
+
+    raise TypeError(f'No export fields registered for {cls.__name__}, use register_fields')
+
+def _date(track: UserTrack) -> Optional[int]:
+    date = track.date
+    return date.uts if date is not None else None
+
+register_fields(Track, {
+    'name': 'name',
+    'artist': 'artist.name',
+    'album': 'album.name',
+    'mbid': 'mbid',
+    'url': 'url',
+    'duration': 'duration',
+    'listeners': 'listeners',
+    'playcount': 'playcount',
+})
+
+register_fields(UserTrack, {
+    **_FIELDS[Track],
+    'loved': 'loved',
+    'date': _date,
+})
+
+register_fields(Artist, {
+    'name': 'name',
+    'mbid': 'mbid',
+    'url': 'url',
+    'listeners': 'listeners',
+    'playcount': 'playcount',
+})
+
+register_fields(Album, {
+    'name': 'name',
+    'artist': 'artist',
+    'mbid': 'mbid',
+    'url': 'url',
+    'listeners': 'listeners',
+    'playcount': 'playcount',
+})
+
+register_fields(PartialAlbum, {'name': 'name', 'artist': 'artist', 'mbid': 'mbid'})
+register_fields(Tag, {'name': 'name', 'url': 'url', 'total': 'total', 'reach': 'reach'})
+
+register_fields(User, {
+    'name': 'name',
+    'realname': 'realname',
+    'url': 'url',
+    'country': 'country',
+    'playcount': 'playcount',
+    'artist_count': 'artist_count',
+    'album_count': 'album_count',
+    'track_count': 'track_count',
+})
+
+class Sink(ABC):
+    # Sinks are only ever used from a single worker thread, opened once the columns are known.
+
+    columns: Sequence[str]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @abstractmethod
+    def open(self, columns: Sequence[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
+
+class JSONLSink(Sink):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: Any = None
+
+    def __repr__(self) -> str:
+        return f'<JSONLSink path={self.path!r}>'
+
+    def open(self, columns: Sequence[str]) -> None:
+        self.columns = columns
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        self._file.writelines(json.dumps(dict(zip(self.columns, row))) + '\n' for row in rows)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class CSVSink(Sink):
+    def __init__(self, path: str, **fmtparams: Any) -> None:
+        self.path = path
+        self.fmtparams = fmtparams
+        self._file: Any = None
+        self._writer: Any = None
+
+    def __repr__(self) -> str:
+        return f'<CSVSink path={self.path!r}>'
+
+    def open(self, columns: Sequence[str]) -> None:
+        self.columns = columns
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file, **self.fmtparams)
+        self._writer.writerow(columns)
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = self._writer = None
+
+class SQLiteSink(Sink):
+    def __init__(self, path: str, table: str) -> None:
+        self.path = path
+        self.table = table
+        self._connection: Any = None
+        self._insert = ''
+
+    def __repr__(self) -> str:
+        return f'<SQLiteSink path={self.path!r} table={self.table!r}>'
+
+    def open(self, columns: Sequence[str]) -> None:
+        import sqlite3
+
+        self.columns = columns
+        self._connection = sqlite3.connect(self.path)
+
+        names = ', '.join(f'"{column}"' for column in columns)
+        self._connection.execute(f'CREATE TABLE IF NOT EXISTS "{self.table}" ({names})')
+        self._insert = f'INSERT INTO "{self.table}" ({names}) VALUES ({", ".join("?" * len(columns))})'
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        # One transaction per batch keeps inserts fast without holding the whole export uncommitted.
+        with self._connection:
+            self._connection.executemany(self._insert, rows)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+class ParquetSink(Sink):
+    def __init__(self, path: str, **options: Any) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError('pyarrow is required for ParquetSink, install it with `pip install lastfm[parquet]`') from None
+
+        self._pyarrow = pyarrow
+        self.path = path
+        self.options = options
+        self._writer: Any = None
+
+    def __repr__(self) -> str:
+        return f'<ParquetSink path={self.path!r}>'
+
+    def open(self, columns: Sequence[str]) -> None:
+        self.columns = columns
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        pa = self._pyarrow
+        table = pa.Table.from_pydict({column: [row[i] for row in rows] for i, column in enumerate(self.columns)})
+
+        # Each batch becomes a row group. The schema is taken from the first batch.
+        if self._writer is None:
+            self._writer = pa.parquet.ParquetWriter(self.path, table.schema, **self.options)
+        else:
+            table = table.cast(self._writer.schema)
+
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def _extract(items: List[Any], fields: Optional[Fields]) -> Tuple[Sequence[str], List[Tuple[Any, ...]]]:
+    if fields is None:
+        first = items[0]
+        if isinstance(first, Mapping):
+            columns = tuple(first)
+            return columns, [tuple(item.get(column) for column in columns) for item in items]
+
+        fields = get_fields(type(first))
+
+    getters = tuple(fields.values())
+    return tuple(fields), [tuple(getter(item) for getter in getters) for item in items]
+
+async def export(
+    paginator: AbstractPaginator[Any],
+    sink: Sink,
+    *,
+    fields: Optional[Mapping[str, Union[str, Getter]]] = None
+) -> int:
+    resolved = {column: _getter(value) for column, value in fields.items()} if fields is not None else None
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(1)
+
+    columns: Optional[Sequence[str]] = None
+    writing: Optional[asyncio.Future[None]] = None
+    count = 0
+
+    try:
+        # Items already buffered by a partially consumed paginator go out first.
+        items = list(paginator.items)
+        paginator.items.clear()
+
+        while True:
+            if not items:
+                try:
+                    items = await paginator.fetch()
+                except (EmptyPage, MaxReached):
+                    break
+
+                continue
+
+            names, rows = _extract(items, resolved)
+            items = []
+
+            # At most one page is being written while the next one is fetched, so memory stays at
+            # roughly two pages no matter how large the export is.
+            if writing is not None:
+                await writing
+
+            if columns is None:
+                columns = names
+                await loop.run_in_executor(executor, sink.open, columns)
+
+            writing = loop.run_in_executor(executor, sink.write, rows)
+            count += len(rows)
+
+        if writing is not None:
+            await writing
+    finally:
+        try:
+            await loop.run_in_executor(executor, sink.close)
+        finally:
+            executor.shutdown(wait=False)
+
+    return count
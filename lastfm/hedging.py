@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Deque, Optional
+from collections import deque
+
+__all__ = ('HedgingPolicy',)
+
+class HedgingPolicy:
+    # Decides when a GET gets a second identical request: once it has been slower than the rolling
+    # `quantile` of recent latencies, as long as the budget of extra requests allows it.
+    def __init__(
+        self,
+        *,
+        quantile: float = 0.95,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        window: int = 1000,
+        minimum_samples: int = 50,
+        minimum_delay: float = 0.01
+    ) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError('quantile must be between 0 and 1')
+
+        if not 0 <= budget <= 1:
+            raise ValueError('budget must be between 0 and 1')
+
+        if minimum_samples < 1 or window < minimum_samples:
+            raise ValueError('window must be at least minimum_samples, which must be greater than 0')
+
+        self.quantile = quantile
+        self.budget = budget
+        self.burst = burst
+        self.minimum_samples = minimum_samples
+        self.minimum_delay = minimum_delay
+
+        self.hedged = 0
+        self.requests = 0
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._delay: Optional[float] = None
+        self._stale = 0
+        # Every request adds `budget` tokens and every hedge spends one, so hedges stay under that
+        # fraction of the traffic, with at most `burst` of them at once.
+        self._tokens = burst
+
+    def __repr__(self) -> str:
+        return f'<HedgingPolicy delay={self.delay} hedged={self.hedged}/{self.requests}>'
+
+    def record(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+        # Sorting the window on every request would cost more than the hedging saves, the quantile
+        # is refreshed after every twentieth of the window instead.
+        self._stale += 1
+        if self._stale * 20 >= len(self._latencies):
+            self._delay = None
+
+    @property
+    def delay(self) -> Optional[float]:
+        # None until there are enough samples to tell what slow is.
+        if self._delay is None and len(self._latencies) >= self.minimum_samples:
+            ordered = sorted(self._latencies)
+            self._delay = max(self.minimum_delay, ordered[int(self.quantile * (len(ordered) - 1))])
+            self._stale = 0
+
+        return self._delay
+
+    def start(self) -> None:
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+
+    def acquire(self) -> bool:
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        self.hedged += 1
+        return True
@@ -1,19 +1,107 @@
-from typing import Any, Dict, List, Optional, Sequence
+from __future__ import annotations
 
-import aiohttp
-import asyncio
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Sequence, Tuple, TypeVar
 
-from .errors import HTTPException
+import asyncio
+import contextvars
+import hashlib
+import re
+import sys
+import time
+import warnings
+
+from .errors import RETRYABLE_ERRORS, DeadlineExceeded, HTTPException
+from .deadlines import get_deadline
+from .decoding import JSONDecoder
+from .scheduler import Scheduler
+from .tracing import NOOP_SPAN, params_digest
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .adaptive import AdaptiveLimit
+    from .breaker import CircuitBreaker
+    from .decoding import Decoder
+    from .hedging import HedgingPolicy
+    from .scheduler import Priority
+    from .tracing import Span, Tracer
+
+# Called with the method, the parameters sent and the decoded response of every successful request.
+ResponseHook = Callable[[str, Dict[str, Any], Dict[str, Any]], None]
+# Called with the parameters of every request before it is signed and sent, and may modify them.
+RequestHook = Callable[[Dict[str, Any]], None]
+
+T = TypeVar('T')
+
+# Method and params digest of the last traced request completed in the current context. Models are
+# built from a response after its request span has closed, the build span carries these to link the two.
+_last_request: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar('last_request', default=None)
+
+# `api_sig` and `sk` used to be the first positional arguments of every authenticated method. The
+# old form still works with a warning; on the models it is told apart from tags by the signature,
+# an md5 hex digest.
+_SIGNATURE = re.compile(r'[0-9a-f]{32}')
+
+def _is_legacy_auth(args: Sequence[Any]) -> bool:
+    return len(args) >= 2 and (args[0] is None or (isinstance(args[0], str) and _SIGNATURE.fullmatch(args[0]) is not None))
+
+def _legacy_auth(method: str, args: Tuple[Any, ...], count: Optional[int] = None) -> Tuple[Any, Any, Tuple[Any, ...]]:
+    if count is not None and len(args) != count:
+        raise TypeError(f'{method}() takes api_sig and sk as keyword arguments')
+
+    warnings.warn(
+        f'Passing api_sig and sk positionally to {method}() is deprecated, pass them as keyword arguments',
+        DeprecationWarning,
+        stacklevel=3
+    )
+
+    return args[0], args[1], args[2:]
+
+def _is_client_error(exc: BaseException) -> bool:
+    # aiohttp is imported lazily, if it hasn't been imported nothing can have raised one of its errors.
+    aiohttp = sys.modules.get('aiohttp')
+    return aiohttp is not None and isinstance(exc, aiohttp.ClientError)
 
 class HTTPClient:
     URL = 'http://ws.audioscrobbler.com/2.0/'
 
-    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession]):
+    def __init__(
+        self, 
+        api_key: str, 
+        session: Optional[aiohttp.ClientSession], 
+        *, 
+        secret: Optional[str] = None, 
+        session_key: Optional[str] = None,
+        decoder: Optional[Decoder] = None,
+        tracer: Optional[Tracer] = None,
+        scheduler: Optional[Scheduler] = None,
+        limit: Optional[AdaptiveLimit] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None
+    ):
         self.api_key = api_key
         self.session = session
+        self.secret = secret
+        self.session_key = session_key
+        self.decoder: Decoder = decoder or JSONDecoder()
+        self.tracer = tracer
+        self.limit = limit
+        self.breaker = breaker
+        self.hedging = hedging
+
+        # An adaptive limit works by resizing the scheduler's concurrency, so it needs one.
+        if limit is not None and scheduler is None:
+            scheduler = Scheduler(limit.limit)
+
+        self.scheduler = scheduler
+        self.request_hooks: List[RequestHook] = []
+        self.response_hooks: List[ResponseHook] = []
 
     async def _create_session(self) -> aiohttp.ClientSession:
         if not self.session:
+            # Deferred so that importing the library doesn't pay for aiohttp until a request is made.
+            import aiohttp
+
             self.session = aiohttp.ClientSession()
 
         return self.session
@@ -29,35 +117,302 @@ class HTTPClient:
         async with session.get(url) as response:
             return await response.read()
 
-    async def request(self, method: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Dict[str, Any]:
-        session = await self._create_session()
-        params = params or {}
-        
-        params.update({'method': method, 'api_key': self.api_key, 'format': 'json', **kwargs})
+    def _prepare(self, method: str, params: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        params = {'method': method, 'api_key': self.api_key, **(params or {}), **kwargs}
         params = {k: v for k, v in params.items() if v is not None}
-        
+
         for key, value in params.items():
             if isinstance(value, bool):
                 params[key] = 1 if value else 0
 
-        async with session.get(self.URL, params=params) as response:
-            if response.status == 429:
-                retry_after = float(response.headers['Retry-After'])
-                await asyncio.sleep(retry_after)
+        for hook in self.request_hooks:
+            hook(params)
+
+        return params
+
+    def sign(self, params: Dict[str, Any], secret: Optional[str] = None) -> str:
+        secret = secret or self.secret
+        if secret is None:
+            raise ValueError('A secret is required to sign requests')
+
+        # The signature covers every parameter except format and callback, ordered by name.
+        payload = ''.join(f'{k}{v}' for k, v in sorted(params.items()) if k not in ('format', 'callback'))
+        return hashlib.md5((payload + secret).encode('utf-8')).hexdigest()
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]:
+        # Without a tracer this is a shared no-op, so untraced requests don't pay for spans.
+        if self.tracer is None:
+            return NOOP_SPAN
+
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    def build(self, fn: Callable[[], T]) -> T:
+        # Runs `fn`, which turns the response of the last request into models, in a span of its own.
+        if self.tracer is None:
+            return fn()
+
+        with self.span('lastfm.build', _last_request.get()) as span:
+            result = fn()
+
+            items = result if isinstance(result, list) else [result]
+            span.set_attribute('lastfm.items', len(items))
+            if items:
+                span.set_attribute('lastfm.model', type(items[0]).__name__)
+
+            return result
+
+    def _observe(self, start: float, inflight: int, *, dropped: bool = False, failed: bool = False) -> None:
+        if self.limit is not None:
+            self.limit.update(start, time.monotonic() - start, inflight, dropped=dropped)
+            if self.scheduler is not None and self.scheduler.concurrency != self.limit.limit:
+                self.scheduler.resize(self.limit.limit)
+
+        if self.breaker is not None:
+            self.breaker.record(failed)
+
+    async def _send(self, session: aiohttp.ClientSession, verb: str, params: Dict[str, Any]) -> Tuple[int, float, bytes]:
+        if verb == 'POST':
+            ctx = session.post(self.URL, data=params)
+        else:
+            ctx = session.get(self.URL, params=params)
+
+        with self.span('lastfm.network') as network:
+            async with ctx as response:
+                status = response.status
+                network.set_attribute('http.status_code', status)
+
+                if status == 429:
+                    return status, float(response.headers['Retry-After']), b''
+
+                body = await response.read()
+                network.set_attribute('lastfm.bytes', len(body))
+
+                return status, 0.0, body
+
+    async def _attempt(
+        self,
+        session: aiohttp.ClientSession,
+        verb: str,
+        params: Dict[str, Any],
+        priority: Optional[Priority],
+        deadline: Optional[float],
+        sent: Optional[asyncio.Future[None]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        # A single round trip. Returns the decoded response, or None and the delay asked for by a 429.
+        # `sent` is resolved once the request leaves the queue.
+        scheduler = self.scheduler
+        observe = self.limit is not None or self.breaker is not None
+
+        if self.breaker is not None:
+            self.breaker.check()
+
+        if scheduler is not None:
+            # Every attempt takes its own slot, the slot isn't held while backing off from a 429.
+            with self.span('lastfm.queue', {'lastfm.waiting': scheduler.waiting}):
+                if deadline is None:
+                    await scheduler.acquire(priority)
+                else:
+                    try:
+                        await asyncio.wait_for(scheduler.acquire(priority), deadline - time.monotonic())
+                    except asyncio.TimeoutError:
+                        raise DeadlineExceeded() from None
+
+        if sent is not None and not sent.done():
+            sent.set_result(None)
+
+        inflight = scheduler.active if scheduler is not None else 0
+        start = time.monotonic()
+
+        try:
+            if deadline is None:
+                status, retry_after, body = await self._send(session, verb, params)
+            else:
+                status, retry_after, body = await asyncio.wait_for(self._send(session, verb, params), deadline - start)
+        except asyncio.TimeoutError:
+            # Running out of the caller's own deadline says nothing about the API, only a network
+            # timeout counts against it.
+            if deadline is not None and time.monotonic() >= deadline:
+                raise DeadlineExceeded() from None
+
+            if observe:
+                self._observe(start, inflight, dropped=True, failed=True)
+
+            raise
+        except Exception as exc:
+            # Connection failures and dropped connections are what an outage mostly looks like.
+            if observe and _is_client_error(exc):
+                self._observe(start, inflight, dropped=True, failed=True)
+
+            raise
+        finally:
+            if scheduler is not None:
+                scheduler.release()
+
+        if status == 429:
+            if observe:
+                self._observe(start, inflight, dropped=True, failed=True)
+
+            return None, retry_after
+
+        latency = time.monotonic() - start
+        if self.hedging is not None:
+            self.hedging.record(latency)
+
+        with self.span('lastfm.decode', {'lastfm.bytes': len(body)}):
+            try:
+                data = self.decoder.decode(params['method'], body)
+            except Exception:
+                # Error pages from proxies and overloaded servers (e.g. an HTML 503) aren't JSON.
+                if observe and status != 200:
+                    self._observe(start, inflight, dropped=True, failed=True)
+
+                raise
+
+        if status != 200 or 'error' in data:
+            # Only outages and rate limiting count against the API, other errors are the caller's.
+            if observe:
+                unavailable = status >= 500 or data.get('error') in RETRYABLE_ERRORS
+                self._observe(start, inflight, dropped=unavailable, failed=unavailable)
+
+            raise HTTPException(data)
+
+        if observe:
+            self._observe(start, inflight)
+
+        return data, 0.0
+
+    async def _hedged(
+        self, session: aiohttp.ClientSession, params: Dict[str, Any], priority: Optional[Priority], deadline: Optional[float]
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        hedging = self.hedging
+        assert hedging is not None
+
+        hedging.start()
+        delay = hedging.delay
+        if delay is None:
+            return await self._attempt(session, 'GET', params, priority, deadline)
+
+        # Latencies are measured from when a request leaves the queue, so is the hedge delay.
+        # Otherwise waiting for a slot alone would trigger hedges that wait in the same queue.
+        sent: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        tasks = [asyncio.ensure_future(self._attempt(session, 'GET', params, priority, deadline, sent))]
+        try:
+            await asyncio.wait([tasks[0], sent], return_when=asyncio.FIRST_COMPLETED)
+
+            done, pending = await asyncio.wait(tasks, timeout=delay)
+            if done or not hedging.acquire():
+                return await tasks[0]
+
+            # The same request again, whichever answers first is used. Failures and 429s only count
+            # once both attempts have ended without a response.
+            with self.span('lastfm.hedge', {'lastfm.hedge_delay': delay}):
+                tasks.append(asyncio.ensure_future(self._attempt(session, 'GET', params, priority, deadline)))
+
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None and task.result()[0] is not None:
+                            return task.result()
+
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+
+                return done.pop().result()
+        finally:
+            sent.cancel()
+            for task in tasks:
+                task.cancel()
+
+    async def _request(
+        self, verb: str, params: Dict[str, Any], priority: Optional[Priority] = None, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        session = await self._create_session()
+        deadline = get_deadline(timeout)
+        params['format'] = 'json'
+
+        attributes = link = None
+        if self.tracer is not None:
+            link = {'lastfm.method': params['method'], 'lastfm.params_digest': params_digest(params)}
+            attributes = {**link, 'http.method': verb}
+
+        with self.span('lastfm.request', attributes):
+            while True:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise DeadlineExceeded()
+
+                # Only reads are hedged, sending a write twice could apply it twice.
+                if verb == 'GET' and self.hedging is not None:
+                    data, retry_after = await self._hedged(session, params, priority, deadline)
+                else:
+                    data, retry_after = await self._attempt(session, verb, params, priority, deadline)
+
+                if data is None:
+                    # A retry that can't finish in time fails now instead of sleeping until the deadline.
+                    if deadline is not None and time.monotonic() + retry_after >= deadline:
+                        raise DeadlineExceeded()
+
+                    with self.span('lastfm.retry_wait', {'lastfm.retry_after': retry_after}):
+                        await asyncio.sleep(retry_after)
+
+                    continue
+
+                for hook in self.response_hooks:
+                    hook(params['method'], params, data)
+
+                if link is not None:
+                    _last_request.set(link)
+
+                return data
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Optional[Priority] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        return await self._request('GET', self._prepare(method, params, kwargs), priority, timeout)
+
+    async def post(
+        self, 
+        method: str, 
+        params: Optional[Dict[str, Any]] = None, 
+        *, 
+        api_sig: Optional[str] = None, 
+        sk: Optional[str] = None,
+        priority: Optional[Priority] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        sk = sk or self.session_key
+        if sk is None:
+            raise ValueError('A session key is required for authenticated methods')
 
-                return await self.request(method, **kwargs)
+        params = self._prepare(method, params, kwargs)
+        params['sk'] = sk
+        params['api_sig'] = api_sig or self.sign(params)
 
-            data = await response.json()
-            if response.status != 200 or 'error' in data:
-                raise HTTPException(data)
+        return await self._request('POST', params, priority, timeout)
 
-            return data
+    async def add_album_tags(
+        self, artist: str, album: str, tags: Sequence[str], *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> None:
+        if legacy:
+            api_sig, sk, (artist, album, tags) = _legacy_auth('add_album_tags', (artist, album, tags, *legacy), 5)
 
-    async def add_album_tags(self, api_sig: str, sk: str, artist: str, album: str, tags: Sequence[str]) -> None:
-        await self.request('album.addTags', api_sig=api_sig, sk=sk, artist=artist, album=album, tags=','.join(tags))
+        await self.post('album.addTags', api_sig=api_sig, sk=sk, artist=artist, album=album, tags=','.join(tags))
 
-    async def remove_album_tag(self, api_sig: str, sk: str, artist: str, album: str, tag: str) -> None:
-        await self.request('album.removeTag', api_sig=api_sig, sk=sk, artist=artist, album=album, tag=tag)
+    async def remove_album_tag(
+        self, artist: str, album: str, tag: str, *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> None:
+        if legacy:
+            api_sig, sk, (artist, album, tag) = _legacy_auth('remove_album_tag', (artist, album, tag, *legacy), 5)
+
+        await self.post('album.removeTag', api_sig=api_sig, sk=sk, artist=artist, album=album, tag=tag)
 
     async def get_album_info(
         self, 
@@ -113,11 +468,21 @@ class HTTPClient:
     async def search_albums(self, album: str, limit: Optional[int] = None, page: Optional[int] = None) -> Dict[str, Any]:
         return await self.request('album.search', album=album, limit=limit, page=page)
 
-    async def add_artist_tags(self, api_sig: str, sk: str, artist: str, tags: Sequence[str]) -> None:
-        await self.request('artist.addTags', api_sig=api_sig, sk=sk, artist=artist, tags=','.join(tags))
+    async def add_artist_tags(
+        self, artist: str, tags: Sequence[str], *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> None:
+        if legacy:
+            api_sig, sk, (artist, tags) = _legacy_auth('add_artist_tags', (artist, tags, *legacy), 4)
+
+        await self.post('artist.addTags', api_sig=api_sig, sk=sk, artist=artist, tags=','.join(tags))
+
+    async def remove_artist_tag(
+        self, artist: str, tag: str, *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> None:
+        if legacy:
+            api_sig, sk, (artist, tag) = _legacy_auth('remove_artist_tag', (artist, tag, *legacy), 4)
 
-    async def remove_artist_tag(self, api_sig: str, sk: str, artist: str, tag: str) -> None:
-        await self.request('artist.removeTag', api_sig=api_sig, sk=sk, artist=artist, tag=tag)
+        await self.post('artist.removeTag', api_sig=api_sig, sk=sk, artist=artist, tag=tag)
 
     async def get_artist_correction(self, artist: str) -> Dict[str, Any]:
         return await self.request('artist.getCorrection', artist=artist)
@@ -233,9 +598,12 @@ class HTTPClient:
         return await self.request('tag.getWeeklyChartList', tag=tag)
 
     async def add_track_tags(
-        self, api_sig: str, sk: str, artist: str, track: str, tags: Sequence[str]
+        self, artist: str, track: str, tags: Sequence[str], *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
     ) -> Dict[str, Any]:
-        return await self.request(
+        if legacy:
+            api_sig, sk, (artist, track, tags) = _legacy_auth('add_track_tags', (artist, track, tags, *legacy), 5)
+
+        return await self.post(
             'track.addTags', api_sig=api_sig, artist=artist, track=track, tags=','.join(tags), sk=sk
         )
 
@@ -273,8 +641,13 @@ class HTTPClient:
     ) -> Dict[str, Any]:
         return await self.request('track.getTopTags', artist=artist, track=track, mbid=mbid, autocorrect=autocorrect)
 
-    async def love_track(self, api_sig: str, sk: str, artist: str, track: str) -> Dict[str, Any]:
-        return await self.request('track.love', api_sig=api_sig, artist=artist, track=track, sk=sk)
+    async def love_track(
+        self, artist: str, track: str, *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if legacy:
+            api_sig, sk, (artist, track) = _legacy_auth('love_track', (artist, track, *legacy), 4)
+
+        return await self.post('track.love', api_sig=api_sig, artist=artist, track=track, sk=sk)
 
     # TODO: track.scrobble
 
@@ -286,11 +659,21 @@ class HTTPClient:
     ) -> Dict[str, Any]:
         return await self.request('track.search', track=track, limit=limit, page=page)
 
-    async def unlove_track(self, api_sig: str, sk: str, artist: str, track: str) -> Dict[str, Any]:
-        return await self.request('track.unlove', api_sig=api_sig, artist=artist, track=track, sk=sk)
+    async def unlove_track(
+        self, artist: str, track: str, *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if legacy:
+            api_sig, sk, (artist, track) = _legacy_auth('unlove_track', (artist, track, *legacy), 4)
+
+        return await self.post('track.unlove', api_sig=api_sig, artist=artist, track=track, sk=sk)
+
+    async def remove_track_tag(
+        self, artist: str, track: str, tag: str, *legacy: Any, api_sig: Optional[str] = None, sk: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if legacy:
+            api_sig, sk, (artist, track, tag) = _legacy_auth('remove_track_tag', (artist, track, tag, *legacy), 5)
 
-    async def remove_track_tag(self, api_sig: str, sk: str, artist: str, track: str, tag: str) -> Dict[str, Any]:
-        return await self.request('track.removeTag', api_sig=api_sig, artist=artist, track=track, tag=tag, sk=sk)
+        return await self.post('track.removeTag', api_sig=api_sig, artist=artist, track=track, tag=tag, sk=sk)
 
     async def get_user_info(self, user: str) -> Dict[str, Any]:
         return await self.request('user.getInfo', user=user)
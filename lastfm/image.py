@@ -1,8 +1,11 @@
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any
 
 from enum import Enum
 
-from .http import HTTPClient
+if TYPE_CHECKING:
+    from .http import HTTPClient
 
 __all__ = ('ImageSize', 'Image')
 
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, TypeVar
+
+__all__ = ('Interner',)
+
+K = TypeVar('K', bound=Hashable)
+
+class Interner(Generic[K]):
+    # Maps keys to dense integer ids in first-seen order, so they can index NumPy arrays directly.
+
+    __slots__ = ('ids', 'keys')
+
+    def __init__(self, keys: Iterable[K] = ()) -> None:
+        self.ids: Dict[K, int] = {}
+        self.keys: List[K] = []
+
+        for key in keys:
+            self.intern(key)
+
+    def __repr__(self) -> str:
+        return f'<Interner size={len(self.keys)}>'
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.ids
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.keys)
+
+    def __getitem__(self, id: int) -> K:
+        return self.keys[id]
+
+    def intern(self, key: K) -> int:
+        id = self.ids.get(key)
+        if id is None:
+            id = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+
+        return id
+
+    def get(self, key: K) -> int:
+        return self.ids.get(key, -1)
@@ -1,31 +1,216 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generic, List, Coroutine, TypeVar, Generator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Deque, Dict, Generic, Iterable, List, Coroutine, TypeVar, Generator, Optional
 from abc import ABC, abstractmethod
+from collections import deque
+import asyncio
+import functools
+import hashlib
+import heapq
+import json
+import os
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from .export import Sink
+
 T = TypeVar('T')
 R = TypeVar('R')
 
 __all__ = (
+    'Page',
     'Paginator',
+    'MergedPaginator',
+    'CheckpointStore',
+    'MemoryCheckpointStore',
+    'FileCheckpointStore',
 )
 
+def _to_int(value: Any) -> Optional[int]:
+    return int(value) if value not in (None, '') else None
+
+class Page(List[T]):
+    __slots__ = ('page', 'per_page', 'total_pages', 'total')
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        *,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        total_pages: Optional[int] = None,
+        total: Optional[int] = None
+    ) -> None:
+        super().__init__(items)
+
+        self.page = page
+        self.per_page = per_page
+        self.total_pages = total_pages
+        self.total = total
+
+    def __repr__(self) -> str:
+        return f'<Page page={self.page} total_pages={self.total_pages} total={self.total} items={len(self)}>'
+
+    @classmethod
+    def from_attr(cls, items: Iterable[T], attr: Optional[Dict[str, Any]]) -> Page[T]:
+        # The `@attr` block list endpoints send along with their items.
+        attr = attr or {}
+        return cls(
+            items,
+            page=_to_int(attr.get('page')),
+            per_page=_to_int(attr.get('perPage')),
+            total_pages=_to_int(attr.get('totalPages')),
+            total=_to_int(attr.get('total'))
+        )
+
+    @classmethod
+    def from_opensearch(cls, items: Iterable[T], results: Dict[str, Any]) -> Page[T]:
+        # Search endpoints report their position with OpenSearch fields instead of `@attr`.
+        total = _to_int(results.get('opensearch:totalResults'))
+        per_page = _to_int(results.get('opensearch:itemsPerPage'))
+        start = _to_int(results.get('opensearch:startIndex'))
+
+        page = total_pages = None
+        if per_page:
+            if start is not None:
+                page = start // per_page + 1
+            if total is not None:
+                total_pages = -(-total // per_page)
+
+        return cls(items, page=page, per_page=per_page, total_pages=total_pages, total=total)
+
+def single_page(
+    fn: Callable[..., Awaitable[List[T]]], *, size: Optional[int] = None
+) -> Callable[..., Coroutine[None, None, Page[T]]]:
+    # Adapts an endpoint without paging to the paginator callback signature. The whole list is
+    # requested once and sliced into pages locally, so offsets, reverse iteration and `max` behave
+    # the same as on a paged endpoint. `size` is how many items to ask the endpoint for in total,
+    # unrelated to the paginator's page size.
+    result: Optional[List[T]] = None
+
+    @functools.wraps(fn)
+    async def callback(*args: Any, page: int, limit: int, **kwargs: Any) -> Page[T]:
+        nonlocal result
+        if result is None:
+            if size is not None:
+                kwargs['limit'] = size
+
+            result = await fn(*args, **kwargs)
+
+        total = len(result)
+        return Page(
+            result[(page - 1) * limit:page * limit],
+            page=page,
+            per_page=limit,
+            total_pages=-(-total // limit),
+            total=total
+        )
+
+    return callback
+
 class EmptyPage(Exception):
     pass
 
 class MaxReached(Exception):
     pass
 
+class CheckpointStore(ABC):
+    @abstractmethod
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+class MemoryCheckpointStore(CheckpointStore):
+    def __init__(self) -> None:
+        self.checkpoints: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.checkpoints.get(key)
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        self.checkpoints[key] = state
+
+    def delete(self, key: str) -> None:
+        self.checkpoints.pop(key, None)
+
+class FileCheckpointStore(CheckpointStore):
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp = f'{path}.tmp'
+
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+        os.replace(tmp, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+def _callback_identity(callback: Callable[..., Any]) -> str:
+    name = getattr(callback, '__qualname__', None) or repr(callback)
+    name = f'{getattr(callback, "__module__", None)}.{name}'
+
+    # Bound model methods (e.g. `user.get_top_tracks`) are identified by the model they belong to as well,
+    # including through wrappers like `single_page` which don't keep `__self__`.
+    owner = getattr(callback, '__self__', None)
+    if owner is None:
+        owner = getattr(getattr(callback, '__wrapped__', None), '__self__', None)
+
+    if owner is not None:
+        # Albums and tracks are only unique together with their artist.
+        artist = getattr(owner, 'artist', None)
+        parts = [getattr(artist, 'name', artist), getattr(owner, 'name', None)]
+
+        key = '/'.join(str(part) for part in parts if part)
+        if key:
+            name = f'{name}[{key}]'
+
+    return name
+
 class AbstractPaginator(ABC, Generic[T]):
-    items: List[T]
+    items: Deque[T]
 
     @abstractmethod
-    async def next(self) -> List[T]:
+    async def fetch(self) -> List[T]:
         raise NotImplementedError
 
+    @property
+    def checkpointed(self) -> bool:
+        # Whether a paginator this one reads from saves checkpoints, in which case it must not be
+        # fetched from ahead of what has been handed out.
+        return False
+
+    async def next(self) -> List[T]:
+        items = await self.fetch()
+        self.items.extend(items)
+
+        return items
+
     async def all(self) -> List[T]:
         return [item async for item in self]
 
@@ -37,55 +222,162 @@ class AbstractPaginator(ABC, Generic[T]):
 
     async def __anext__(self) -> T:
         try:
-            if self.items:
-                return self.items.pop()
+            while not self.items:
+                await self.next()
 
-            await self.next()
-            return self.items.pop()
+            return self.items.popleft()
         except (EmptyPage, MaxReached):
             raise StopAsyncIteration
 
+    def map(self, fn: Callable[[T], R]) -> MappedPaginator[T, R]:
+        return MappedPaginator(fn, self)
+    
+    def filter(self, fn: Callable[[T], bool]) -> FilteredPaginator[T]:
+        return FilteredPaginator(fn, self)
+
+    def map_concurrent(
+        self, fn: Callable[[T], Awaitable[R]], *, concurrency: int = 8, ordered: bool = True
+    ) -> ConcurrentMappedPaginator[T, R]:
+        return ConcurrentMappedPaginator(fn, self, concurrency=concurrency, ordered=ordered)
+
+    async def export(self, sink: Sink, *, fields: Optional[Dict[str, Any]] = None) -> int:
+        from .export import export
+
+        return await export(self, sink, fields=fields)
+
 class MappedPaginator(Generic[T, R], AbstractPaginator[R]):
-    def __init__(self, fn: Callable[[T], R], paginator: Paginator[T]) -> None:
+    def __init__(self, fn: Callable[[T], R], paginator: AbstractPaginator[T]) -> None:
         self.fn = fn
         self.paginator = paginator
 
-        self.items = []
+        self.items = deque()
 
-    async def next(self) -> List[R]:
-        items = await self.paginator.next()
-        mapped = [self.fn(item) for item in items]
+    @property
+    def checkpointed(self) -> bool:
+        return self.paginator.checkpointed
 
-        self.items.extend(mapped)
-        return mapped
+    async def fetch(self) -> List[R]:
+        return [self.fn(item) for item in await self.paginator.fetch()]
     
 class FilteredPaginator(AbstractPaginator[T]):
-    def __init__(self, fn: Callable[[T], bool], paginator: Paginator[T]) -> None:
+    def __init__(self, fn: Callable[[T], bool], paginator: AbstractPaginator[T]) -> None:
         self.fn = fn
         self.paginator = paginator
 
-        self.items = []
+        self.items = deque()
 
-    async def next(self) -> List[T]:
-        items = await self.paginator.next()
-        filtered = [item for item in items if self.fn(item)]
+    @property
+    def checkpointed(self) -> bool:
+        return self.paginator.checkpointed
 
-        self.items.extend(filtered)
-        return filtered
-    
-    async def __anext__(self) -> T:
+    async def fetch(self) -> List[T]:
+        return [item for item in await self.paginator.fetch() if self.fn(item)]
+
+class ConcurrentMappedPaginator(Generic[T, R], AbstractPaginator[R]):
+    def __init__(
+        self,
+        fn: Callable[[T], Awaitable[R]],
+        paginator: AbstractPaginator[T],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        self.fn = fn
+        self.paginator = paginator
+        self.concurrency = concurrency
+        self.ordered = ordered
+
+        self.items = deque()
+        self._results: Optional[AsyncGenerator[R, None]] = None
+
+    def __repr__(self) -> str:
+        return f'<ConcurrentMappedPaginator concurrency={self.concurrency} ordered={self.ordered}>'
+
+    @property
+    def checkpointed(self) -> bool:
+        return self.paginator.checkpointed
+
+    async def _call(self, item: T) -> R:
+        return await self.fn(item)
+
+    async def _run(self) -> AsyncGenerator[R, None]:
+        # At most `concurrency` calls are in flight, one page is buffered and the next one is being
+        # fetched in the background. Results are only produced as fast as they're consumed.
+        # A checkpointed source saves its position when its next page is fetched, so that page is
+        # only requested once every result before it has been handed out.
+        prefetch = not self.paginator.checkpointed
+        pending: Deque[asyncio.Future[R]] = deque()
+        buffer: Deque[T] = deque()
+
+        page: Optional[asyncio.Future[List[T]]] = None
+        exhausted = False
         try:
-            if self.items:
-                return self.items.pop()
-            
-            while not self.items:
-                await self.next()
+            while True:
+                while len(pending) < self.concurrency:
+                    if not buffer:
+                        if exhausted:
+                            break
 
-            return self.items.pop()
-        except (EmptyPage, MaxReached):
-            raise StopAsyncIteration
+                        if page is None:
+                            if pending and not prefetch:
+                                break
+
+                            page = asyncio.ensure_future(self.paginator.fetch())
+
+                        if pending and not page.done():
+                            break
+
+                        try:
+                            items = await page
+                        except (EmptyPage, MaxReached):
+                            page = None
+                            exhausted = True
+                            break
+
+                        buffer.extend(items)
+                        page = asyncio.ensure_future(self.paginator.fetch()) if prefetch else None
+                        continue
+
+                    pending.append(asyncio.ensure_future(self._call(buffer.popleft())))
+
+                if not pending:
+                    return
+
+                if self.ordered:
+                    yield await pending.popleft()
+                    continue
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+            if page is not None:
+                page.cancel()
+
+    async def fetch(self) -> List[R]:
+        if self._results is None:
+            self._results = self._run()
+
+        try:
+            return [await self._results.__anext__()]
+        except StopAsyncIteration:
+            raise EmptyPage
+
+    async def aclose(self) -> None:
+        if self._results is not None:
+            await self._results.aclose()
 
 class Paginator(AbstractPaginator[T]):
+    # Most pages requested by one paginator, wherever it started.
     MAX_PAGES = 1000
 
     __slots__ = (
@@ -93,10 +385,20 @@ class Paginator(AbstractPaginator[T]):
         'page', 
         'limit',
         'max',
+        'start',
         'offset',
+        'reverse',
         'callback',
         'args', 
-        'kwargs'
+        'kwargs',
+        'checkpoint_store',
+        'checkpoint_key',
+        'checkpoint_every',
+        'total',
+        'total_pages',
+        '_pages',
+        '_skip',
+        '_first_page',
     )
 
     def __init__(
@@ -105,14 +407,23 @@ class Paginator(AbstractPaginator[T]):
         *args: Any,
         limit: int = 30,
         max: Optional[int] = None,
+        offset: int = 0,
+        reverse: bool = False,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        checkpoint_every: int = 1,
         **kwargs: Any,
     ) -> None:
-        self.items: List[T] = []
-        self.page = 1
-        self.offset = 0
+        if offset < 0:
+            raise ValueError('offset must be greater than or equal to 0')
+
+        self.items: Deque[T] = deque()
+        self.total: Optional[int] = None
+        self.total_pages: Optional[int] = None
         self.callback = callback
         self.args = args
         self.kwargs = kwargs
+        self.reverse = reverse
 
         if max:
             if max < 0:
@@ -124,36 +435,432 @@ class Paginator(AbstractPaginator[T]):
     
         self.max = max
 
+        self._pages = 0
+        self._first_page: Optional[List[T]] = None
+        self._seek(offset)
+
+        if checkpoint_every < 1:
+            raise ValueError('checkpoint_every must be greater than 0')
+
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_key = checkpoint_key or self.identity
+        self.checkpoint_every = checkpoint_every
+
+        if checkpoint_store is not None:
+            state = checkpoint_store.load(self.checkpoint_key)
+            if state is not None:
+                self.restore(state)
+
     def __repr__(self):
-        return f'<Paginator page={self.page} limit={self.limit}>'
+        return f'<Paginator page={self.page} limit={self.limit} reverse={self.reverse}>'
 
     def __len__(self):
         return len(self.items)
 
-    async def next(self) -> List[T]:
-        if self.max is not None and self.offset >= self.max:
-            raise MaxReached
-        elif self.page > self.MAX_PAGES:
-            raise MaxReached
+    @property
+    def checkpointed(self) -> bool:
+        return self.checkpoint_store is not None
 
+    def _seek(self, offset: int) -> None:
+        # `offset` is the position of the next item to fetch, counted from the end when reversed. A
+        # forward seek starts at the page containing it and drops whatever comes before on that page.
+        self.start = offset
+
+        if self.reverse:
+            self.page = 1
+            self.offset = offset
+            self._skip = 0
+        else:
+            self.page = offset // self.limit + 1
+            self.offset = (self.page - 1) * self.limit
+            self._skip = offset - self.offset
+
+    @property
+    def consumed(self) -> int:
+        return max(self.offset - self.start, 0)
+
+    @property
+    def estimate(self) -> Optional[int]:
+        if self.total is None:
+            return self.max
+
+        remaining = max(self.total - self.start, 0)
+        return min(remaining, self.max) if self.max is not None else remaining
+
+    async def count(self) -> Optional[int]:
+        # Only known once a page has come back, so prime the buffer with the first one. Nothing is
+        # fetched twice since iteration starts from the buffered page.
+        if self.total is None and self._pages == 0:
+            try:
+                await self.next()
+            except (EmptyPage, MaxReached):
+                return 0
+
+        return self.estimate
+
+    def _fit_remainder(self) -> None:
+        # Pages are addressed by number, so the page size can only change on a page boundary. The
+        # smallest size that divides the offset and still covers the remainder keeps the final
+        # request aligned while only fetching what's left. It never goes above the current size, an
+        # endpoint may clamp larger ones and the page would no longer start at the offset. This
+        # changes the page number, not the number of requests `MAX_PAGES` caps.
+        if self.max is None or self._skip:
+            return
+
+        remaining = self.max - self.consumed
+        if remaining >= self.limit or self.offset % self.limit != 0:
+            return
+
+        for limit in range(remaining, self.limit):
+            if self.offset % limit == 0:
+                break
+        else:
+            return
+
+        self.limit = limit
+        self.page = self.offset // limit + 1
+
+    @property
+    def identity(self) -> str:
+        params = json.dumps([self.args, self.kwargs], sort_keys=True, default=str)
+        return f'{_callback_identity(self.callback)}:{params}'
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {
+            'identity': self.identity,
+            'page': self.page,
+            'start': self.start,
+            'offset': self.offset,
+            'limit': self.limit,
+            'max': self.max,
+            'reverse': self.reverse,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        if state['identity'] != self.identity:
+            raise ValueError('Checkpoint was created by a different callback or with different parameters')
+
+        if state.get('reverse', False) != self.reverse:
+            raise ValueError('Checkpoint was created with a different iteration order')
+
+        self.items.clear()
+        self.page = state['page']
+        self.start = state.get('start', 0)
+        self.offset = state['offset']
+        self.limit = state['limit']
+        self.max = state['max']
+        self._skip = 0
+
+    def _save_checkpoint(self) -> None:
+        # Called right before a page is fetched, at which point everything fetched so far has been
+        # handed out: paginators reading from this one don't fetch ahead while it is checkpointed
+        # (see `checkpointed`), so resuming never skips buffered items.
+        if self.checkpoint_store is None or self._pages == 0:
+            return
+
+        if self._pages % self.checkpoint_every == 0:
+            self.checkpoint_store.save(self.checkpoint_key, self.checkpoint())
+
+    def _finish(self) -> None:
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.delete(self.checkpoint_key)
+
+    async def _request(self, page: int) -> List[T]:
         items = await self.callback(
             *self.args, 
-            page=self.page, 
+            page=page, 
             limit=self.limit, 
             **self.kwargs
         )
 
+        if isinstance(items, Page):
+            if items.total is not None:
+                # The kept first page was sliced against the old total, it can't be reused.
+                if items.total != self.total:
+                    self._first_page = None
+
+                self.total = items.total
+            if items.total_pages is not None:
+                self.total_pages = items.total_pages
+
+            items = list(items)
+
+        return items
+
+    async def _fetch_reversed(self) -> List[T]:
+        if self.total is None:
+            # Page 1 is needed for the total anyway, and is kept around to be handed out last.
+            self._first_page = await self._request(1)
+            if self.total is None:
+                raise ValueError('Reverse pagination requires an endpoint that reports its total')
+
+        assert self.total is not None
+
+        # Walk pages from the back using the forward index of the next item to hand out. The total is
+        # re-read with every page: items added at the front (e.g. new scrobbles) shift forward indexes
+        # but not positions counted from the end, so the index is recomputed until it lands on the
+        # page that was just fetched.
+        while True:
+            if self.offset >= self.total:
+                self._finish()
+                raise EmptyPage
+
+            index = self.total - 1 - self.offset
+            page = index // self.limit + 1
+
+            if page == 1 and self._first_page is not None:
+                items = self._first_page
+                self._first_page = None
+            else:
+                items = await self._request(page)
+
+            index = self.total - 1 - self.offset
+            if index // self.limit + 1 == page:
+                break
+
+        items = items[:index - (page - 1) * self.limit + 1]
+        items.reverse()
+
         if not items:
+            self._finish()
+            raise EmptyPage
+
+        self.page = page - 1
+        return items
+
+    async def fetch(self) -> List[T]:
+        if self.max is not None and self.consumed >= self.max:
+            self._finish()
+            raise MaxReached
+        elif self._pages >= self.MAX_PAGES:
+            # Caps the number of requests made, not how deep a seek can start.
+            self._finish()
+            raise MaxReached
+        elif not self.reverse and self.total_pages is not None and self.page > self.total_pages:
+            self._finish()
             raise EmptyPage
 
-        self.page += 1
+        self._save_checkpoint()
+
+        if self.reverse:
+            items = await self._fetch_reversed()
+        else:
+            self._fit_remainder()
+            items = await self._request(self.page)
+
+            if not items:
+                self._finish()
+                raise EmptyPage
+
+            self.page += 1
+            self.offset += self._skip
+
+            items = items[self._skip:]
+            self._skip = 0
+
+        if self.max is not None:
+            items = items[:self.max - self.consumed]
+
+        self._pages += 1
         self.offset += len(items)
 
-        self.items.extend(items)
         return items
-    
-    def map(self, fn: Callable[[T], R]) -> MappedPaginator[T, R]:
-        return MappedPaginator(fn, self)
-    
-    def filter(self, fn: Callable[[T], bool]) -> FilteredPaginator[T]:
-        return FilteredPaginator(fn, self)
+
+class _Descending:
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: _Descending) -> bool:
+        return other.value < self.value
+
+class _Source(Generic[T]):
+    __slots__ = ('paginator', 'buffer', 'next_page', 'done')
+
+    def __init__(self, paginator: AbstractPaginator[T]) -> None:
+        self.paginator = paginator
+        self.buffer: Deque[T] = deque()
+        self.next_page: Optional[asyncio.Future[List[T]]] = None
+        self.done = False
+
+    def stop(self) -> None:
+        self.done = True
+        self.buffer.clear()
+
+        if self.next_page is not None:
+            self.next_page.cancel()
+            self.next_page = None
+
+class MergedPaginator(AbstractPaginator[T]):
+    def __init__(
+        self,
+        *paginators: AbstractPaginator[T],
+        concurrency: int = 8,
+        key: Optional[Callable[[T], Any]] = None,
+        reverse: bool = False,
+        max: Optional[int] = None,
+        until: Optional[Callable[[T], bool]] = None
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        if max is not None and max < 0:
+            raise ValueError('max must be greater than 0')
+
+        self.paginators = paginators
+        self.concurrency = concurrency
+        self.key = key
+        self.reverse = reverse
+        self.max = max
+        self.until = until
+
+        self.items = deque()
+        self._results: Optional[AsyncGenerator[T, None]] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self) -> str:
+        return f'<MergedPaginator sources={len(self.paginators)} concurrency={self.concurrency} key={self.key!r}>'
+
+    @property
+    def checkpointed(self) -> bool:
+        return any(paginator.checkpointed for paginator in self.paginators)
+
+    async def _fetch(self, source: _Source[T]) -> List[T]:
+        assert self._semaphore is not None
+
+        async with self._semaphore:
+            return await source.paginator.fetch()
+
+    def _prefetch(self, source: _Source[T]) -> None:
+        source.next_page = asyncio.ensure_future(self._fetch(source))
+
+    async def _refill(self, source: _Source[T]) -> None:
+        while not source.buffer and not source.done:
+            if source.next_page is None:
+                self._prefetch(source)
+                assert source.next_page is not None
+
+            try:
+                items = await source.next_page
+            except (EmptyPage, MaxReached):
+                source.next_page = None
+                source.done = True
+
+                return
+
+            source.next_page = None
+            source.buffer.extend(items)
+
+            # A checkpointed source saves its position when its next page is fetched, which is only
+            # right once everything buffered has been merged and handed out.
+            if not source.paginator.checkpointed:
+                self._prefetch(source)
+
+    async def _interleave(self, sources: List[_Source[T]]) -> AsyncGenerator[T, None]:
+        pending: Dict[asyncio.Future[List[T]], _Source[T]] = {}
+        for source in sources:
+            self._prefetch(source)
+            assert source.next_page is not None
+
+            pending[source.next_page] = source
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                source = pending.pop(future)
+                source.next_page = None
+
+                try:
+                    items = future.result()
+                except (EmptyPage, MaxReached):
+                    source.done = True
+                    continue
+
+                for item in items:
+                    if self.until is not None and self.until(item):
+                        source.stop()
+                        break
+
+                    yield item
+
+                # Only fetched once the whole page has been handed out, so checkpointed sources are safe.
+                if not source.done:
+                    self._prefetch(source)
+                    assert source.next_page is not None
+
+                    pending[source.next_page] = source
+
+    async def _merge(self, sources: List[_Source[T]]) -> AsyncGenerator[T, None]:
+        # A k-way merge over the heads of every source, each of which has to already be sorted by
+        # `key`. Every source that isn't checkpointed keeps its next page prefetched so the merge
+        # rarely waits on the network.
+        assert self.key is not None
+        key = self.key
+
+        heap: List[Any] = []
+
+        def push(index: int) -> None:
+            source = sources[index]
+            if not source.buffer:
+                return
+
+            item = source.buffer[0]
+            if self.until is not None and self.until(item):
+                source.stop()
+                return
+
+            value = _Descending(key(item)) if self.reverse else key(item)
+            heapq.heappush(heap, (value, index))
+
+        for source in sources:
+            self._prefetch(source)
+
+        for index, source in enumerate(sources):
+            await self._refill(source)
+            push(index)
+
+        while heap:
+            _, index = heapq.heappop(heap)
+            source = sources[index]
+
+            yield source.buffer.popleft()
+
+            await self._refill(source)
+            push(index)
+
+    async def _run(self) -> AsyncGenerator[T, None]:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        sources = [_Source(paginator) for paginator in self.paginators]
+
+        results = self._interleave(sources) if self.key is None else self._merge(sources)
+        count = 0
+
+        try:
+            if self.max == 0:
+                return
+
+            async for item in results:
+                yield item
+
+                count += 1
+                if self.max is not None and count >= self.max:
+                    return
+        finally:
+            await results.aclose()
+
+            for source in sources:
+                source.stop()
+
+    async def fetch(self) -> List[T]:
+        if self._results is None:
+            self._results = self._run()
+
+        try:
+            return [await self._results.__anext__()]
+        except StopAsyncIteration:
+            raise EmptyPage
+
+    async def aclose(self) -> None:
+        if self._results is not None:
+            await self._results.aclose()
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from enum import Enum
+import asyncio
+import heapq
+import logging
+import time
+
+from .ratelimit import RateLimiter
+from .track import UserTrack
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .http import HTTPClient
+
+__all__ = ('NowPlayingEventType', 'NowPlayingEvent', 'NowPlayingPoller')
+
+_log = logging.getLogger(__name__)
+
+class NowPlayingEventType(str, Enum):
+    Started = 'started'
+    Changed = 'changed'
+    Stopped = 'stopped'
+
+class NowPlayingEvent(NamedTuple):
+    type: NowPlayingEventType
+    user: str
+    track: Optional[UserTrack]
+    previous: Optional[UserTrack]
+
+def _track_key(track: UserTrack) -> Tuple[str, str]:
+    return (track.artist.name, track.name)
+
+class _UserState:
+    __slots__ = ('name', 'interval', 'due', 'track')
+
+    def __init__(self, name: str, interval: float) -> None:
+        self.name = name
+        self.interval = interval
+        self.due = 0.0
+        self.track: Optional[UserTrack] = None
+
+class NowPlayingPoller:
+    def __init__(
+        self,
+        http: HTTPClient,
+        users: Iterable[str] = (),
+        *,
+        rate: float = 5.0,
+        concurrency: int = 10,
+        min_interval: float = 15.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0
+    ) -> None:
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError('Intervals must satisfy 0 < min_interval <= max_interval')
+
+        if backoff < 1:
+            raise ValueError('backoff must be greater than or equal to 1')
+
+        self.http = http
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self.limiter = RateLimiter(rate)
+        self.concurrency = concurrency
+
+        self._states: Dict[str, _UserState] = {}
+        self._heap: List[Tuple[float, str]] = []
+        # Created on first use, inside the running loop.
+        self._events: Optional[asyncio.Queue[NowPlayingEvent]] = None
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._polls: Set[asyncio.Task[None]] = set()
+
+        for user in users:
+            self.add(user)
+
+    def __repr__(self) -> str:
+        return f'<NowPlayingPoller users={len(self._states)} running={self.running}>'
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, user: str) -> bool:
+        return user in self._states
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    def __aiter__(self) -> AsyncIterator[NowPlayingEvent]:
+        return self.events()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def now_playing(self, user: str) -> Optional[UserTrack]:
+        state = self._states.get(user)
+        return state.track if state else None
+
+    def add(self, user: str) -> None:
+        if user in self._states:
+            return
+
+        state = _UserState(user, self.min_interval)
+        self._states[user] = state
+
+        self._schedule(state, 0)
+
+    def remove(self, user: str) -> None:
+        # Any heap entry left behind is discarded once it comes due.
+        self._states.pop(user, None)
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = list(self._polls)
+        if self._task is not None:
+            tasks.append(self._task)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def events(self) -> AsyncIterator[NowPlayingEvent]:
+        while True:
+            yield await self._queue().get()
+
+    def _queue(self) -> asyncio.Queue[NowPlayingEvent]:
+        if self._events is None:
+            self._events = asyncio.Queue()
+
+        return self._events
+
+    def _schedule(self, state: _UserState, delay: float) -> None:
+        # Users can be added before the loop runs, the event loop clock is monotonic as well.
+        state.due = time.monotonic() + delay
+        heapq.heappush(self._heap, (state.due, state.name))
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _sleep(self, delay: Optional[float]) -> None:
+        loop = asyncio.get_running_loop()
+        self._waiter = waiter = loop.create_future()
+
+        handle = None
+        if delay is not None:
+            handle = loop.call_later(delay, lambda: waiter.done() or waiter.set_result(None))
+
+        try:
+            await waiter
+        finally:
+            self._waiter = None
+            if handle is not None:
+                handle.cancel()
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        while True:
+            if not self._heap:
+                await self._sleep(None)
+                continue
+
+            due, name = self._heap[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                await self._sleep(delay)
+                continue
+
+            heapq.heappop(self._heap)
+
+            state = self._states.get(name)
+            if state is None or state.due != due:
+                continue
+
+            # Once more users are due than the budget allows, everyone's polls slip evenly instead of
+            # the request rate going over it.
+            await self.limiter.acquire()
+            await semaphore.acquire()
+
+            task = asyncio.ensure_future(self._poll(state))
+            task.add_done_callback(lambda _: semaphore.release())
+
+            self._polls.add(task)
+            task.add_done_callback(self._polls.discard)
+
+    async def _poll(self, state: _UserState) -> None:
+        # Failures back off like an idle user. Whatever happens the user is put back on the heap,
+        # otherwise an unexpected error would silently stop their polling for good.
+        interval = min(state.interval * self.backoff, self.max_interval)
+
+        try:
+            data = await self.http.get_user_recent_tracks(state.name, limit=1)
+
+            if state.name not in self._states:
+                return
+
+            tracks = data['recenttracks'].get('track', [])
+            if isinstance(tracks, dict):
+                tracks = [tracks]
+
+            track = UserTrack(tracks[0], self.http) if tracks else None
+            if track is not None and not track.is_now_playing():
+                track = None
+
+            previous = state.track
+            event: Optional[NowPlayingEventType] = None
+
+            if track is not None and previous is None:
+                event = NowPlayingEventType.Started
+            elif track is not None and previous is not None and _track_key(track) != _track_key(previous):
+                event = NowPlayingEventType.Changed
+            elif track is None and previous is not None:
+                event = NowPlayingEventType.Stopped
+
+            state.track = track
+
+            # Active listeners are polled as often as allowed, idle users back off exponentially
+            # until they start listening again.
+            if track is not None or event is not None:
+                interval = self.min_interval
+
+            if event is not None:
+                self._queue().put_nowait(NowPlayingEvent(event, state.name, track, previous))
+        except Exception:
+            _log.exception('Polling now playing of %r failed', state.name)
+        finally:
+            if self._states.get(state.name) is state:
+                state.interval = interval
+                self._schedule(state, interval)
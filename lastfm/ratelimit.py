@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any
+import asyncio
+import time
+
+__all__ = 'RateLimiter',
+
+class RateLimiter:
+    __slots__ = ('rate', 'per', 'interval', '_next')
+
+    def __init__(self, rate: float, per: float = 1.0) -> None:
+        if rate <= 0 or per <= 0:
+            raise ValueError('rate and per must be greater than 0')
+
+        self.rate = rate
+        self.per = per
+        self.interval = per / rate
+
+        self._next = 0.0
+
+    def __repr__(self) -> str:
+        return f'<RateLimiter rate={self.rate} per={self.per}>'
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def acquire(self) -> None:
+        # Each caller reserves the next free slot before sleeping, so concurrent callers are spaced out
+        # evenly without needing a lock.
+        now = time.monotonic()
+        slot = max(self._next, now)
+        self._next = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
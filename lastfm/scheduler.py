@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Tuple
+from collections import deque
+from enum import IntEnum
+import asyncio
+import contextlib
+import contextvars
+import time
+
+__all__ = ('Priority', 'Scheduler', 'priority', 'get_priority')
+
+class Priority(IntEnum):
+    Interactive = 0
+    Normal = 1
+    Bulk = 2
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar('priority', default=Priority.Normal)
+
+def get_priority() -> Priority:
+    return _priority.get()
+
+@contextlib.contextmanager
+def priority(value: Priority) -> Iterator[None]:
+    # Tasks copy the context when they are created, so anything spawned inside the block keeps the priority.
+    token = _priority.set(Priority(value))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+DEFAULT_WEIGHTS: Dict[Priority, float] = {Priority.Interactive: 16.0, Priority.Normal: 4.0, Priority.Bulk: 1.0}
+
+class Scheduler:
+    def __init__(
+        self,
+        concurrency: int = 8,
+        *,
+        rate: Optional[float] = None,
+        weights: Optional[Mapping[Priority, float]] = None
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be greater than 0')
+
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError('weights must be greater than 0')
+
+        self.concurrency = concurrency
+        self.rate = rate
+        self.weights = weights
+
+        self.active = 0
+        self._interval = 1 / rate if rate is not None else 0.0
+        self._next = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Weighted fair queuing: each waiter is tagged with a virtual finish time that advances by
+        # 1 / weight within its class, and the smallest tag across classes goes next. A class that
+        # was idle starts from the current virtual time, so it can't build up credit.
+        self._virtual = 0.0
+        self._finish: Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._queues: Dict[Priority, Deque[Tuple[float, asyncio.Future[None]]]] = {priority: deque() for priority in Priority}
+
+    def __repr__(self) -> str:
+        return f'<Scheduler concurrency={self.concurrency} rate={self.rate} active={self.active} waiting={self.waiting}>'
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _ready(self) -> bool:
+        # Waits out the rate budget with a timer instead of a sleeping task.
+        delay = self._next - time.monotonic()
+        if delay <= 0:
+            return True
+
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+
+        return False
+
+    def _wake(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self.active < self.concurrency:
+            head: Optional[Priority] = None
+            for priority, queue in self._queues.items():
+                # Waiters cancelled while queued are dropped here.
+                while queue and queue[0][1].done():
+                    queue.popleft()
+
+                if queue and (head is None or queue[0][0] < self._queues[head][0][0]):
+                    head = priority
+
+            if head is None or not self._ready():
+                return
+
+            tag, future = self._queues[head].popleft()
+            self._virtual = tag
+            self._next = max(self._next, time.monotonic()) + self._interval
+
+            self.active += 1
+            future.set_result(None)
+
+    async def acquire(self, priority: Optional[Priority] = None) -> None:
+        priority = Priority(priority) if priority is not None else _priority.get()
+
+        # Nothing queued ahead means there is no one to be fair to.
+        if self.active < self.concurrency and not self.waiting and self._ready():
+            self._next = max(self._next, time.monotonic()) + self._interval
+            self.active += 1
+            return
+
+        tag = self._finish[priority] = max(self._virtual, self._finish[priority]) + 1 / self.weights[priority]
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues[priority].append((tag, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Handed a slot right as the wait was cancelled, it goes to the next waiter.
+            if future.done() and not future.cancelled():
+                self.release()
+
+            raise
+
+    def resize(self, concurrency: int) -> None:
+        # Slots already handed out are kept when shrinking, new ones are only given once enough are released.
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        grew = concurrency > self.concurrency
+        self.concurrency = concurrency
+
+        if grew:
+            self._dispatch()
+
+    def release(self) -> None:
+        self.active -= 1
+        self._dispatch()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.release()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+from collections import Counter
+from enum import Enum
+from itertools import chain
+import heapq
+import json
+import os
+import re
+import unicodedata
+
+__all__ = ('SearchResultType', 'SearchResult', 'SearchIndex')
+
+_WORDS = re.compile(r'\w+')
+
+# Parts of a response that never contain names worth indexing.
+_SKIPPED = frozenset(('image', 'wiki', 'bio', 'streamable', '@attr', 'tags', 'toptags'))
+
+class SearchResultType(str, Enum):
+    Artist = 'artist'
+    Album = 'album'
+    Track = 'track'
+
+class SearchResult(NamedTuple):
+    type: SearchResultType
+    name: str
+    artist: Optional[str]
+    mbid: Optional[str]
+    score: float
+
+def _normalize(text: str) -> str:
+    # Case, accents and punctuation are ignored, so "Beyoncé" and "beyonce" index the same way.
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(_WORDS.findall(text))
+
+def _trigrams(text: str) -> Set[str]:
+    # Padding at the start weighs prefixes more, which is what partially typed queries match on.
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _artist_name(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        return value or None
+    elif isinstance(value, dict):
+        return value.get('name') or value.get('#text') or None
+
+    return None
+
+class SearchIndex:
+    def __init__(self, *, path: Optional[str] = None) -> None:
+        self.path = path
+
+        self._types: List[SearchResultType] = []
+        self._names: List[str] = []
+        self._normalized: List[str] = []
+        self._artists: List[Optional[str]] = []
+        self._mbids: List[Optional[str]] = []
+        self._sizes: List[int] = []
+
+        self._keys: Dict[Tuple[SearchResultType, str, str], int] = {}
+        self._by_mbid: Dict[str, int] = {}
+        self._postings: Dict[SearchResultType, Dict[str, List[int]]] = {type: {} for type in SearchResultType}
+
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __repr__(self) -> str:
+        return f'<SearchIndex entries={len(self)}>'
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(
+        self, type: SearchResultType, name: str, artist: Optional[str] = None, mbid: Optional[str] = None
+    ) -> None:
+        type = SearchResultType(type)
+
+        normalized = _normalize(name)
+        if not normalized:
+            return
+
+        key = (type, normalized, _normalize(artist) if artist else '')
+        id = self._keys.get(key)
+
+        if id is None:
+            id = self._keys[key] = len(self._names)
+            grams = _trigrams(normalized)
+
+            self._types.append(type)
+            self._names.append(name)
+            self._normalized.append(normalized)
+            self._artists.append(artist)
+            self._mbids.append(None)
+            self._sizes.append(len(grams))
+
+            postings = self._postings[type]
+            for gram in grams:
+                postings.setdefault(gram, []).append(id)
+
+        if mbid and self._mbids[id] is None:
+            self._mbids[id] = mbid
+            self._by_mbid[mbid] = id
+
+    def observe(self, method: str, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        # Response hook for `HTTPClient.response_hooks`, every entity that passes through is indexed.
+        for key, value in data.items():
+            self._collect(key, value, None)
+
+    def _collect(self, key: str, value: Any, artist: Optional[str]) -> None:
+        if isinstance(value, list):
+            for item in value:
+                self._collect(key, item, artist)
+
+            return
+
+        if not isinstance(value, dict):
+            return
+
+        mbid = value.get('mbid') or None
+
+        if key == 'artist':
+            name = _artist_name(value)
+            if name:
+                self.add(SearchResultType.Artist, name, mbid=mbid)
+                artist = name
+        elif key == 'album':
+            name = value.get('name') or value.get('title') or value.get('#text')
+            artist = _artist_name(value.get('artist')) or artist
+            if name:
+                self.add(SearchResultType.Album, name, artist, mbid)
+        elif key == 'track':
+            artist = _artist_name(value.get('artist')) or artist
+            name = value.get('name')
+            if name:
+                self.add(SearchResultType.Track, name, artist, mbid)
+
+        for child, item in value.items():
+            if child not in _SKIPPED:
+                self._collect(child, item, artist)
+
+    def _result(self, id: int, score: float) -> SearchResult:
+        return SearchResult(self._types[id], self._names[id], self._artists[id], self._mbids[id], score)
+
+    def search(
+        self, query: str, *, type: Optional[SearchResultType] = None, limit: int = 10, threshold: float = 0.0
+    ) -> List[SearchResult]:
+        types = (SearchResultType(type),) if type is not None else tuple(SearchResultType)
+
+        id = self._by_mbid.get(query)
+        if id is not None and self._types[id] in types:
+            return [self._result(id, 1.0)]
+
+        normalized = _normalize(query)
+        if not normalized:
+            return []
+
+        grams = _trigrams(normalized)
+
+        # Counting over the chained posting lists keeps the per-entry work out of the interpreter loop.
+        shared = Counter(chain.from_iterable(
+            self._postings[kind].get(gram, ()) for kind in types for gram in grams
+        ))
+
+        # Jaccard similarity of the trigram sets. It can't exceed count / size, so entries sharing too
+        # few trigrams are dropped before scoring. Names starting with the query share all of its
+        # trigrams but the one padded at the end, they are kept for the prefix check below.
+        size = len(grams)
+        sizes = self._sizes
+        names = self._normalized
+        minimum = min(threshold * size, size - 1)
+
+        def score(id: int, count: int) -> float:
+            similarity = count / (size + sizes[id] - count)
+
+            # A partially typed query shares only a few trigrams with the whole name, so a name it is
+            # the start of scores at least halfway, more the more of the name was typed.
+            if count >= size - 1 and names[id].startswith(normalized):
+                similarity = max(similarity, 0.5 + 0.5 * len(normalized) / len(names[id]))
+
+            return similarity
+
+        scored: Iterator[Tuple[float, int]] = (
+            (score(id, count), id) for id, count in shared.items() if count >= minimum
+        )
+
+        best = heapq.nlargest(limit, (item for item in scored if item[0] >= threshold))
+        return [self._result(id, score) for score, id in best]
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if path is None:
+            raise ValueError('A path is required to save the index')
+
+        entries = [
+            [type.value, name, artist, mbid]
+            for type, name, artist, mbid in zip(self._types, self._names, self._artists, self._mbids)
+        ]
+
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'entries': entries}, f)
+
+        os.replace(tmp, path)
+
+    def load(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if path is None:
+            raise ValueError('A path is required to load the index')
+
+        # Only the entries are stored, trigram postings are rebuilt since they are cheap to compute.
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        for type, name, artist, mbid in data['entries']:
+            self.add(type, name, artist, mbid)
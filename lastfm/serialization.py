@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .http import HTTPClient
+    from .client import Client
+
+__all__ = ('Serializable', 'dumps', 'loads')
+
+_MODELS: Dict[str, Type[Serializable]] = {}
+
+def _get_msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError:
+        raise RuntimeError('msgpack is required for binary serialization, install it with `pip install lastfm[msgpack]`') from None
+
+    return msgpack
+
+class Serializable:
+    __slots__ = ()
+
+    _http: Optional[HTTPClient]
+    _data: Dict[str, Any]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _MODELS[cls.__name__] = cls
+
+    def __reduce__(self) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        # Rebuilding from the raw payload leaves the HTTP client (and its aiohttp session) out of the
+        # pickle, so models can go through process pools and queues. Use `attach` once unpickled.
+        return (self.from_dict, (self.to_dict(),))
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Only the raw payload is stored, it fully determines the model and is never larger than the
+        # API response. The parsed fields are rebuilt from it on load.
+        return {'type': type(self).__name__, 'data': self._data}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], http: Optional[HTTPClient] = None) -> Self:
+        return cls(data['data'], http) # type: ignore
+
+    def to_bytes(self) -> bytes:
+        return dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, http: Optional[HTTPClient] = None) -> Self:
+        model = loads(data, http)
+        if not isinstance(model, cls):
+            raise TypeError(f'Expected a serialized {cls.__name__}, got {type(model).__name__}')
+
+        return model
+
+    def attach(self, client: Union[Client, HTTPClient]) -> Self:
+        self._http = getattr(client, 'http', client)
+        return self
+
+def dumps(model: Serializable) -> bytes:
+    return _get_msgpack().packb(model.to_dict(), use_bin_type=True)
+
+def loads(data: Union[bytes, Dict[str, Any]], http: Optional[HTTPClient] = None) -> Serializable:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = _get_msgpack().unpackb(data, raw=False)
+
+    cls = _MODELS.get(data['type'])
+    if cls is None:
+        raise ValueError(f'Unknown model type {data["type"]!r}')
+
+    return cls.from_dict(data, http)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+from enum import Enum
+import asyncio
+
+from .chart import Period
+from .errors import LastFMException
+from .interner import Interner
+from .ratelimit import RateLimiter
+from .stats import _get_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .http import HTTPClient
+
+__all__ = ('Similarity', 'TasteMatrix')
+
+class Similarity(str, Enum):
+    Cosine = 'cosine'
+    Jaccard = 'jaccard'
+
+class TasteMatrix:
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        period: Period = Period.Overall,
+        limit: int = 50,
+        concurrency: int = 8,
+        rate: float = 5.0
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        np = self._np = _get_numpy()
+
+        self.http = http
+        self.period = Period(period)
+        self.limit = limit
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+
+        self.users: Interner[str] = Interner()
+        self.artists: Interner[str] = Interner()
+
+        # Users by artists playcounts. Both axes grow with spare capacity, only the used corner is read.
+        self._matrix = np.zeros((16, 256), dtype=np.float32)
+
+        # Similarity matrices are computed once in full, after that only the rows of users whose
+        # vectors changed are recomputed.
+        self._cache: Dict[Similarity, np.ndarray] = {}
+        self._dirty: Dict[Similarity, Set[int]] = {metric: set() for metric in Similarity}
+
+    def __repr__(self) -> str:
+        return f'<TasteMatrix users={len(self.users)} artists={len(self.artists)} period={self.period.value!r}>'
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def __contains__(self, user: str) -> bool:
+        return user in self.users
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._matrix[:len(self.users), :len(self.artists)]
+
+    def _reserve(self, users: int, artists: int) -> None:
+        rows, columns = self._matrix.shape
+        if users <= rows and artists <= columns:
+            return
+
+        shape = (
+            rows if users <= rows else max(users, rows * 2),
+            columns if artists <= columns else max(artists, columns * 2)
+        )
+
+        matrix = self._np.zeros(shape, dtype=self._np.float32)
+        matrix[:rows, :columns] = self._matrix
+        self._matrix = matrix
+
+    def set_user(self, user: str, playcounts: Iterable[Tuple[str, int]]) -> None:
+        index = self.users.intern(user)
+
+        pairs = [(self.artists.intern(artist), playcount) for artist, playcount in playcounts]
+        self._reserve(len(self.users), len(self.artists))
+
+        row = self._matrix[index]
+        row[:] = 0
+        for id, playcount in pairs:
+            row[id] = playcount
+
+        for dirty in self._dirty.values():
+            dirty.add(index)
+
+    async def _fetch_user(self, semaphore: asyncio.Semaphore, user: str) -> None:
+        async with semaphore:
+            await self.limiter.acquire()
+            data = await self.http.get_user_top_artists(user, self.period.value, self.limit)
+
+        artists = data['topartists'].get('artist', [])
+        if isinstance(artists, dict):
+            artists = [artists]
+
+        self.set_user(user, ((artist['name'], int(artist['playcount'])) for artist in artists))
+
+    async def fetch(self, users: Iterable[str]) -> Dict[str, LastFMException]:
+        # Users that failed are left as they were and returned with their error.
+        semaphore = asyncio.Semaphore(self.concurrency)
+        users = list(users)
+
+        results = await asyncio.gather(*[self._fetch_user(semaphore, user) for user in users], return_exceptions=True)
+
+        errors: Dict[str, LastFMException] = {}
+        for user, result in zip(users, results):
+            if isinstance(result, LastFMException):
+                errors[user] = result
+            elif isinstance(result, BaseException):
+                raise result
+
+        return errors
+
+    async def refresh(self, user: str) -> None:
+        await self._fetch_user(asyncio.Semaphore(1), user)
+
+    def _compute(self, metric: Similarity, matrix: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        np = self._np
+
+        if metric is Similarity.Cosine:
+            norms = np.sqrt(np.einsum('ij,ij->i', matrix, matrix))
+            products = matrix[rows] @ matrix.T
+            denominator = np.outer(norms[rows], norms)
+        else:
+            present = (matrix > 0).astype(np.float32)
+            sizes = present.sum(axis=1)
+            products = present[rows] @ present.T
+            denominator = sizes[rows, None] + sizes[None, :] - products
+
+        # Users without any artists are similar to nobody.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator > 0, products / denominator, 0).astype(np.float32)
+
+    def similarities(self, metric: Similarity = Similarity.Cosine) -> np.ndarray:
+        np = self._np
+
+        metric = Similarity(metric)
+        matrix = self.matrix
+        size = len(self.users)
+
+        cache = self._cache.get(metric)
+        dirty = self._dirty[metric]
+
+        if cache is None or len(dirty) > size // 2:
+            cache = self._compute(metric, matrix, np.arange(size))
+        elif dirty:
+            if len(cache) < size:
+                grown = np.zeros((size, size), dtype=np.float32)
+                grown[:len(cache), :len(cache)] = cache
+                cache = grown
+
+            rows = np.fromiter(dirty, dtype=np.intp)
+            values = self._compute(metric, matrix, rows)
+
+            cache[rows, :] = values
+            cache[:, rows] = values.T
+
+        dirty.clear()
+        self._cache[metric] = cache
+
+        return cache
+
+    def similarity(self, a: str, b: str, metric: Similarity = Similarity.Cosine) -> float:
+        matrix = self.similarities(metric)
+        return float(matrix[self.users.ids[a], self.users.ids[b]])
+
+    def most_similar(self, user: str, n: int = 10, metric: Similarity = Similarity.Cosine) -> List[Tuple[str, float]]:
+        np = self._np
+
+        index = self.users.ids[user]
+        row = self.similarities(metric)[index].copy()
+        row[index] = -np.inf
+
+        n = min(n, len(row) - 1)
+        if n <= 0:
+            return []
+
+        ids = np.argpartition(-row, n - 1)[:n]
+        ids = ids[np.argsort(-row[ids], kind='stable')]
+
+        return [(self.users[id], float(row[id])) for id in ids]
+
+    def shared_artists(self, a: str, b: str) -> List[str]:
+        np = self._np
+
+        matrix = self.matrix
+        shared = np.flatnonzero((matrix[self.users.ids[a]] > 0) & (matrix[self.users.ids[b]] > 0))
+        return [self.artists[id] for id in shared]
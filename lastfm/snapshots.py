@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from abc import ABC, abstractmethod
+from enum import Enum
+import asyncio
+import json
+import os
+import re
+import time
+
+from .errors import LastFMException
+from .ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+
+__all__ = (
+    'ChartKind',
+    'ChartSnapshot',
+    'ChartDiff',
+    'SnapshotStore',
+    'MemorySnapshotStore',
+    'FileSnapshotStore',
+    'ChartSnapshotter',
+)
+
+# Artists and tags are keyed by name, tracks by (artist, name).
+EntryKey = Tuple[str, ...]
+
+class ChartKind(str, Enum):
+    Artists = 'artists'
+    Tracks = 'tracks'
+    Tags = 'tags'
+
+def _snapshot_key(kind: ChartKind, country: Optional[str]) -> str:
+    return f'{kind.value}:{country or "global"}'
+
+class ChartSnapshot(NamedTuple):
+    kind: ChartKind
+    country: Optional[str]
+    timestamp: float
+    entries: Tuple[EntryKey, ...]
+    # Listeners for artists and tracks, reach for tags. Aligned with `entries`.
+    counts: Tuple[int, ...]
+
+    @property
+    def key(self) -> str:
+        return _snapshot_key(self.kind, self.country)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'kind': self.kind.value,
+            'country': self.country,
+            'timestamp': self.timestamp,
+            'entries': [list(entry) for entry in self.entries],
+            'counts': list(self.counts)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ChartSnapshot:
+        return cls(
+            ChartKind(data['kind']),
+            data['country'],
+            data['timestamp'],
+            tuple(tuple(entry) for entry in data['entries']),
+            tuple(data['counts'])
+        )
+
+class ChartDiff(NamedTuple):
+    snapshot: ChartSnapshot
+    previous: Optional[ChartSnapshot]
+    # Ranks are 1-based. Climbers and fallers are (entry, previous rank, rank), largest move first.
+    new: List[Tuple[EntryKey, int]]
+    dropped: List[Tuple[EntryKey, int]]
+    climbers: List[Tuple[EntryKey, int, int]]
+    fallers: List[Tuple[EntryKey, int, int]]
+
+    @classmethod
+    def compute(cls, snapshot: ChartSnapshot, previous: Optional[ChartSnapshot]) -> ChartDiff:
+        if previous is None:
+            return cls(snapshot, None, [], [], [], [])
+
+        ranks = {entry: rank for rank, entry in enumerate(previous.entries, 1)}
+        current = {entry: rank for rank, entry in enumerate(snapshot.entries, 1)}
+
+        new, climbers, fallers = [], [], []
+        for entry, rank in current.items():
+            before = ranks.get(entry)
+            if before is None:
+                new.append((entry, rank))
+            elif rank < before:
+                climbers.append((entry, before, rank))
+            elif rank > before:
+                fallers.append((entry, before, rank))
+
+        dropped = [(entry, rank) for entry, rank in ranks.items() if entry not in current]
+
+        climbers.sort(key=lambda move: move[2] - move[1])
+        fallers.sort(key=lambda move: move[1] - move[2])
+
+        return cls(snapshot, previous, new, dropped, climbers, fallers)
+
+class SnapshotStore(ABC):
+    # Only the latest snapshot per chart is needed to diff against, stores may keep history elsewhere.
+
+    @abstractmethod
+    def latest(self, key: str) -> Optional[ChartSnapshot]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, snapshot: ChartSnapshot) -> None:
+        raise NotImplementedError
+
+class MemorySnapshotStore(SnapshotStore):
+    def __init__(self) -> None:
+        self.snapshots: Dict[str, ChartSnapshot] = {}
+
+    def latest(self, key: str) -> Optional[ChartSnapshot]:
+        return self.snapshots.get(key)
+
+    def save(self, snapshot: ChartSnapshot) -> None:
+        self.snapshots[snapshot.key] = snapshot
+
+class FileSnapshotStore(SnapshotStore):
+    def __init__(self, directory: str, *, history: bool = True) -> None:
+        self.directory = directory
+        self.history = history
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, re.sub(r'[^\w-]', '_', key) + extension)
+
+    def latest(self, key: str) -> Optional[ChartSnapshot]:
+        try:
+            with open(self._path(key, '.json'), encoding='utf-8') as f:
+                return ChartSnapshot.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, snapshot: ChartSnapshot) -> None:
+        data = json.dumps(snapshot.to_dict(), separators=(',', ':'))
+
+        # History is append-only JSON lines, it is never read back to diff.
+        if self.history:
+            with open(self._path(snapshot.key, '.jsonl'), 'a', encoding='utf-8') as f:
+                f.write(data + '\n')
+
+        path = self._path(snapshot.key, '.json')
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+
+        os.replace(tmp, path)
+
+def _parse(kind: ChartKind, items: Any) -> Tuple[Tuple[EntryKey, ...], Tuple[int, ...]]:
+    if isinstance(items, dict):
+        items = [items]
+
+    if kind is ChartKind.Tracks:
+        entries = tuple((item['artist']['name'], item['name']) for item in items)
+    else:
+        entries = tuple((item['name'],) for item in items)
+
+    field = 'reach' if kind is ChartKind.Tags else 'listeners'
+    counts = tuple(int(item.get(field) or 0) for item in items)
+
+    return entries, counts
+
+class ChartSnapshotter:
+    def __init__(
+        self,
+        http: HTTPClient,
+        countries: Iterable[str] = (),
+        *,
+        kinds: Sequence[ChartKind] = tuple(ChartKind),
+        limit: int = 50,
+        concurrency: int = 8,
+        rate: float = 5.0,
+        store: Optional[SnapshotStore] = None
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        self.http = http
+        self.countries = list(countries)
+        self.kinds = tuple(ChartKind(kind) for kind in kinds)
+        self.limit = limit
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.store = store or MemorySnapshotStore()
+
+        self.errors: Dict[str, LastFMException] = {}
+
+    def __repr__(self) -> str:
+        return f'<ChartSnapshotter kinds={self.kinds!r} countries={len(self.countries)}>'
+
+    def __aiter__(self) -> AsyncIterator[ChartDiff]:
+        return self.stream()
+
+    def jobs(self) -> List[Tuple[ChartKind, Optional[str]]]:
+        # geo.* only has artist and track charts, tags are global only.
+        jobs: List[Tuple[ChartKind, Optional[str]]] = [(kind, None) for kind in self.kinds]
+        jobs.extend((kind, country) for country in self.countries for kind in self.kinds if kind is not ChartKind.Tags)
+
+        return jobs
+
+    async def _request(self, kind: ChartKind, country: Optional[str]) -> Any:
+        if country is None:
+            if kind is ChartKind.Artists:
+                return (await self.http.get_chart_top_artists(self.limit))['artists']['artist']
+            elif kind is ChartKind.Tracks:
+                return (await self.http.get_chart_top_tracks(self.limit))['tracks']['track']
+
+            return (await self.http.get_chart_top_tags(self.limit))['tags']['tag']
+
+        if kind is ChartKind.Artists:
+            return (await self.http.get_geo_top_artists(country, self.limit))['topartists']['artist']
+
+        return (await self.http.get_geo_top_tracks(country, self.limit))['tracks']['track']
+
+    async def snapshot(self, kind: ChartKind, country: Optional[str] = None) -> ChartDiff:
+        kind = ChartKind(kind)
+
+        await self.limiter.acquire()
+        items = await self._request(kind, country)
+
+        entries, counts = _parse(kind, items)
+        snapshot = ChartSnapshot(kind, country, time.time(), entries, counts)
+
+        diff = ChartDiff.compute(snapshot, self.store.latest(snapshot.key))
+        self.store.save(snapshot)
+
+        return diff
+
+    async def _run_job(self, semaphore: asyncio.Semaphore, kind: ChartKind, country: Optional[str]) -> Optional[ChartDiff]:
+        async with semaphore:
+            try:
+                return await self.snapshot(kind, country)
+            except LastFMException as exc:
+                self.errors[_snapshot_key(kind, country)] = exc
+                return None
+
+    async def stream(self) -> AsyncIterator[ChartDiff]:
+        # Diffs are yielded as charts come in. Charts that failed are skipped and kept in `errors`.
+        self.errors.clear()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        tasks = [asyncio.ensure_future(self._run_job(semaphore, kind, country)) for kind, country in self.jobs()]
+        try:
+            for future in asyncio.as_completed(tasks):
+                diff = await future
+                if diff is not None:
+                    yield diff
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(self) -> List[ChartDiff]:
+        return [diff async for diff in self.stream()]
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, List, NamedTuple, Optional, Tuple
+import datetime
+
+from .interner import Interner
+from .paginator import EmptyPage, MaxReached
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .paginator import AbstractPaginator
+    from .track import UserTrack
+
+__all__ = ('Streak', 'ListeningStats')
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+def _get_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError('numpy is required for this feature, install it with `pip install lastfm[numpy]`') from None
+
+    return numpy
+
+class Streak(NamedTuple):
+    start: datetime.date
+    end: datetime.date
+    days: int
+
+class _Column:
+    # Append-only array with amortized growth, so incremental updates don't copy the whole history.
+
+    __slots__ = ('np', 'data', 'size')
+
+    def __init__(self, np: Any, dtype: Any) -> None:
+        self.np = np
+        self.data = np.empty(1024, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray) -> None:
+        end = self.size + len(values)
+        if end > len(self.data):
+            data = self.np.empty(max(end, len(self.data) * 2), dtype=self.data.dtype)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+
+        self.data[self.size:end] = values
+        self.size = end
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.data[:self.size]
+
+class ListeningStats:
+    def __init__(self, *, utc_offset: datetime.timedelta = datetime.timedelta()) -> None:
+        np = self._np = _get_numpy()
+
+        # Buckets are computed in local time, a fixed offset is enough for hour and day boundaries.
+        self.utc_offset = int(utc_offset.total_seconds())
+
+        self.artists: Interner[str] = Interner()
+        self.tracks: Interner[Tuple[str, str]] = Interner()
+
+        self._uts = _Column(np, np.int64)
+        self._artist_ids = _Column(np, np.int32)
+        self._track_ids = _Column(np, np.int32)
+
+        self._artist_counts = np.zeros(0, dtype=np.int64)
+        self._track_counts = np.zeros(0, dtype=np.int64)
+        self._hours = np.zeros(24, dtype=np.int64)
+        self._weekdays = np.zeros(7, dtype=np.int64)
+        self._days = np.zeros(0, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f'<ListeningStats scrobbles={len(self)} artists={len(self.artists)} tracks={len(self.tracks)}>'
+
+    def __len__(self) -> int:
+        return self._uts.size
+
+    @property
+    def latest(self) -> Optional[datetime.datetime]:
+        # Fetch with `start` past this to only pull scrobbles that are not counted yet.
+        if not len(self):
+            return None
+
+        return datetime.datetime.fromtimestamp(int(self._uts.values.max()))
+
+    def add(self, tracks: Iterable[UserTrack]) -> int:
+        uts: List[int] = []
+        artist_ids: List[int] = []
+        track_ids: List[int] = []
+
+        for track in tracks:
+            date = track.date
+            if date is None:
+                # Now playing, it is added once it is scrobbled.
+                continue
+
+            artist = track.artist.name
+
+            uts.append(date.uts)
+            artist_ids.append(self.artists.intern(artist))
+            track_ids.append(self.tracks.intern((artist, track.name)))
+
+        np = self._np
+        self.add_columns(
+            np.array(uts, dtype=np.int64), np.array(artist_ids, dtype=np.int32), np.array(track_ids, dtype=np.int32)
+        )
+
+        return len(uts)
+
+    def add_columns(self, uts: np.ndarray, artist_ids: np.ndarray, track_ids: np.ndarray) -> None:
+        # Ids must come from `self.artists` and `self.tracks`.
+        if not len(uts) == len(artist_ids) == len(track_ids):
+            raise ValueError('Columns must have the same length')
+
+        if not len(uts):
+            return
+
+        np = self._np
+
+        self._uts.extend(uts)
+        self._artist_ids.extend(artist_ids)
+        self._track_ids.extend(track_ids)
+
+        # Aggregates only look at the new rows and are added onto the running totals.
+        self._artist_counts = self._accumulate(self._artist_counts, artist_ids, len(self.artists))
+        self._track_counts = self._accumulate(self._track_counts, track_ids, len(self.tracks))
+
+        local = uts + self.utc_offset
+        days = local // 86400
+
+        self._hours += np.bincount(local // 3600 % 24, minlength=24)
+        # 1970-01-01 was a Thursday, weekdays are numbered from Monday like `datetime.weekday`.
+        self._weekdays += np.bincount((days + 3) % 7, minlength=7)
+        self._days = np.union1d(self._days, days)
+
+    def _accumulate(self, counts: np.ndarray, ids: np.ndarray, size: int) -> np.ndarray:
+        added = self._np.bincount(ids, minlength=size)
+        added[:len(counts)] += counts
+        return added
+
+    async def consume(self, paginator: AbstractPaginator[UserTrack]) -> int:
+        # Pages are aggregated as they arrive instead of collecting the whole history first.
+        count = self.add(paginator.items)
+        paginator.items.clear()
+
+        while True:
+            try:
+                count += self.add(await paginator.fetch())
+            except (EmptyPage, MaxReached):
+                return count
+
+    def _top(self, counts: np.ndarray, n: Optional[int]) -> np.ndarray:
+        np = self._np
+        if n is not None and n < len(counts):
+            ids = np.argpartition(-counts, n)[:n]
+        else:
+            ids = np.arange(len(counts))
+
+        return ids[np.argsort(-counts[ids], kind='stable')]
+
+    def top_artists(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        counts = self._artist_counts
+        return [(self.artists[id], int(counts[id])) for id in self._top(counts, n)]
+
+    def top_tracks(self, n: Optional[int] = None) -> List[Tuple[str, str, int]]:
+        counts = self._track_counts
+        return [(*self.tracks[id], int(counts[id])) for id in self._top(counts, n)]
+
+    def artist_playcount(self, artist: str) -> int:
+        id = self.artists.get(artist)
+        return int(self._artist_counts[id]) if id >= 0 else 0
+
+    def track_playcount(self, artist: str, track: str) -> int:
+        id = self.tracks.get((artist, track))
+        return int(self._track_counts[id]) if id >= 0 else 0
+
+    def hour_histogram(self) -> np.ndarray:
+        return self._hours.copy()
+
+    def weekday_histogram(self) -> np.ndarray:
+        return self._weekdays.copy()
+
+    def streaks(self) -> List[Streak]:
+        np = self._np
+
+        days = self._days
+        if not len(days):
+            return []
+
+        # A streak ends wherever the gap to the next listening day is more than one day.
+        breaks = np.flatnonzero(np.diff(days) != 1)
+        starts = np.concatenate(([0], breaks + 1))
+        ends = np.concatenate((breaks, [len(days) - 1]))
+
+        return [
+            Streak(_EPOCH + datetime.timedelta(days=int(days[s])), _EPOCH + datetime.timedelta(days=int(days[e])), int(e - s + 1))
+            for s, e in zip(starts, ends)
+        ]
+
+    def longest_streak(self) -> Optional[Streak]:
+        streaks = self.streaks()
+        return max(streaks, key=lambda streak: streak.days) if streaks else None
+
+    def current_streak(self, today: Optional[datetime.date] = None) -> Optional[Streak]:
+        if not len(self._days):
+            return None
+
+        if today is None:
+            now = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=self.utc_offset)
+            today = now.date()
+
+        # Still current if the last listening day is today or yesterday.
+        streak = self.streaks()[-1]
+        return streak if (today - streak.end).days <= 1 else None
+
+    def save(self, path: str) -> None:
+        np = self._np
+        np.savez_compressed(
+            path,
+            uts=self._uts.values,
+            artist_ids=self._artist_ids.values,
+            track_ids=self._track_ids.values,
+            artists=np.array(self.artists.keys, dtype=str),
+            track_artists=np.array([artist for artist, _ in self.tracks], dtype=str),
+            track_names=np.array([name for _, name in self.tracks], dtype=str),
+            utc_offset=self.utc_offset
+        )
+
+    @classmethod
+    def load(cls, path: str) -> ListeningStats:
+        np = _get_numpy()
+
+        with np.load(path) as data:
+            stats = cls(utc_offset=datetime.timedelta(seconds=int(data['utc_offset'])))
+            stats.artists = Interner(data['artists'].tolist())
+            stats.tracks = Interner(zip(data['track_artists'].tolist(), data['track_names'].tolist()))
+            stats.add_columns(data['uts'], data['artist_ids'], data['track_ids'])
+
+        return stats
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from .chart import WeeklyChart
 from .http import HTTPClient
 from .wiki import Wiki
+from .serialization import Serializable
+from .paginator import Page, Paginator, single_page
 
 if TYPE_CHECKING:
     from .track import Track
@@ -13,8 +15,8 @@ if TYPE_CHECKING:
 
 __all__ = 'Tag',
 
-class Tag:
-    __slots__ = ('_data', '_http', 'name', 'url', 'total', 'reach')
+class Tag(Serializable):
+    __slots__ = ('_data', '_http', 'name', 'url', 'total', 'reach', 'count')
 
     def __init__(self, data: Dict[str, Any], http: HTTPClient) -> None:
         self._http = http
@@ -26,6 +28,11 @@ class Tag:
         self.total: int = data.get('total', 0)
         self.reach: int = data.get('reach', 0)
 
+        # Relative weight (0-100) of the tag on the entity it was fetched for, None outside of top
+        # tags responses.
+        count = data.get('count')
+        self.count: Optional[int] = int(count) if count is not None else None
+
     def __repr__(self) -> str:
         return f'<Tag name={self.name!r}>'
 
@@ -39,33 +46,47 @@ class Tag:
     
     async def get_similar(self) -> List[Tag]:
         data = await self._http.get_tag_similar(self.name)
-        return [Tag(tag, self._http) for tag in data['similartags']['tag']]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in data['similartags']['tag']])
     
     async def get_top_artists(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Artist]:
+    ) -> Page[Artist]:
         from .artist import Artist
 
         data = await self._http.get_tag_top_artists(self.name, limit, page)
-        return [Artist(artist, self._http) for artist in data['topartists']['artist']]
+        items = self._http.build(lambda: [Artist(artist, self._http) for artist in data['topartists']['artist']])
+        return Page.from_attr(items, data['topartists'].get('@attr'))
     
     async def get_top_tracks(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Track]:
+    ) -> Page[Track]:
         from .track import Track
 
         data = await self._http.get_tag_top_tracks(self.name, limit, page)
-        print(data.keys())
-        return [Track(track, self._http) for track in data['tracks']['track']]
+        items = self._http.build(lambda: [Track(track, self._http) for track in data['tracks']['track']])
+        return Page.from_attr(items, data['tracks'].get('@attr'))
     
     async def get_top_albums(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Album]:
+    ) -> Page[Album]:
         from .album import Album
 
         data = await self._http.get_tag_top_albums(self.name, limit, page)
-        return [Album(album, self._http) for album in data['albums']['album']]
+        items = self._http.build(lambda: [Album(album, self._http) for album in data['albums']['album']])
+        return Page.from_attr(items, data['albums'].get('@attr'))
     
     async def get_weekly_chart_list(self) -> List[WeeklyChart]:
         data = await self._http.get_tag_weekly_chart_list(self.name)
-        return [WeeklyChart.from_dict(chart) for chart in data['weeklychartlist']['chart']]
\ No newline at end of file
+        return [WeeklyChart.from_dict(chart) for chart in data['weeklychartlist']['chart']]
+
+    def iter_similar(self, **options: Any) -> Paginator[Tag]:
+        return Paginator(single_page(self.get_similar), **options)
+
+    def iter_top_artists(self, *, limit: int = 50, **options: Any) -> Paginator[Artist]:
+        return Paginator(self.get_top_artists, limit=limit, **options)
+
+    def iter_top_tracks(self, *, limit: int = 50, **options: Any) -> Paginator[Track]:
+        return Paginator(self.get_top_tracks, limit=limit, **options)
+
+    def iter_top_albums(self, *, limit: int = 50, **options: Any) -> Paginator[Album]:
+        return Paginator(self.get_top_albums, limit=limit, **options)
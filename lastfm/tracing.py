@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ContextManager, Deque, Dict, Iterator, NamedTuple, Optional, Protocol
+from collections import deque
+import contextlib
+import contextvars
+import hashlib
+import time
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ('Span', 'Tracer', 'SpanRecord', 'RecordingTracer', 'params_digest')
+
+# Parameters that identify the caller rather than the call, they are left out of digests.
+_PRIVATE_PARAMS = frozenset(('api_key', 'sk', 'api_sig', 'format'))
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> Any: ...
+
+class Tracer(Protocol):
+    # The subset of `opentelemetry.trace.Tracer` used here, so an OpenTelemetry tracer can be passed as is.
+    def start_as_current_span(self, name: str, *, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]: ...
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+# Stands in for both the span context manager and the span itself when tracing is off.
+NOOP_SPAN = _NoopSpan()
+
+def params_digest(params: Dict[str, Any]) -> str:
+    # Identical calls get the same digest, without putting user names or credentials on spans.
+    payload = '&'.join(f'{k}={v}' for k, v in sorted(params.items()) if k not in _PRIVATE_PARAMS)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+class SpanRecord(NamedTuple):
+    name: str
+    parent: Optional[str]
+    start: float
+    duration: float
+    attributes: Dict[str, Any]
+    error: Optional[BaseException]
+
+class _RecordingSpan:
+    __slots__ = ('name', 'parent', 'attributes')
+
+    def __init__(self, name: str, parent: Optional[str], attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+class RecordingTracer:
+    # A dependency free tracer that keeps finished spans in memory, for when OpenTelemetry isn't set up.
+    def __init__(self, *, maxlen: Optional[int] = None) -> None:
+        self.spans: Deque[SpanRecord] = deque(maxlen=maxlen)
+
+        self._current: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('current', default=None)
+
+    def __repr__(self) -> str:
+        return f'<RecordingTracer spans={len(self.spans)}>'
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str, *, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        span = _RecordingSpan(name, self._current.get(), dict(attributes or {}))
+        token = self._current.set(name)
+
+        error: Optional[BaseException] = None
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self._current.reset(token)
+
+            self.spans.append(SpanRecord(span.name, span.parent, start, duration, span.attributes, error))
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def totals(self) -> Dict[str, float]:
+        # Total time spent in each stage, by span name.
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration
+
+        return totals
@@ -3,9 +3,10 @@ from __future__ import annotations
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import datetime
 
-from .http import HTTPClient
+from .http import HTTPClient, _is_legacy_auth, _legacy_auth
 from .tag import Tag
 from .artist import Artist
+from .serialization import Serializable
 
 if TYPE_CHECKING:
     from .album import PartialAlbum
@@ -36,7 +37,7 @@ class Date:
     def datetime(self) -> datetime.datetime:
         return datetime.datetime.fromtimestamp(self.uts)
     
-class Track:
+class Track(Serializable):
     __slots__ = (
         '_http',
         '_data',
@@ -113,26 +114,38 @@ class Track:
         if tags is None:
             return []
         
-        return [Tag(tag, self._http) for tag in data['tags']['tag']]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in data['tags']['tag']])
 
     async def get_top_tags(self) -> List[Tag]:
         data = await self._http.get_track_top_tags(self.artist.name, self.name)
-        return [Tag(tag, self._http) for tag in data['toptags']['tag']]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in data['toptags']['tag']])
+
+    async def add_tags(self, *tags: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if _is_legacy_auth(tags):
+            api_sig, sk, tags = _legacy_auth('Track.add_tags', tags)
 
-    async def add_tags(self, api_sig: str, sk: str, *tags: str) -> None:
         if len(tags) > 10:
             raise ValueError('Cannot add more than 10 tags')
     
-        await self._http.add_track_tags(api_sig, sk, self.artist.name, self.name, tags)
+        await self._http.add_track_tags(self.artist.name, self.name, tags, api_sig=api_sig, sk=sk)
+
+    async def remove_tag(self, tag: str, *legacy: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if legacy:
+            api_sig, sk, (tag,) = _legacy_auth('Track.remove_tag', (tag, *legacy), 3)
+
+        await self._http.remove_track_tag(self.artist.name, self.name, tag, api_sig=api_sig, sk=sk)
+
+    async def love(self, *legacy: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if legacy:
+            api_sig, sk, _ = _legacy_auth('Track.love', legacy, 2)
 
-    async def remove_tag(self, api_sig: str, sk: str, tag: str) -> None:
-        await self._http.remove_track_tag(api_sig, sk, self.artist.name, self.name, tag)
+        await self._http.love_track(self.artist.name, self.name, api_sig=api_sig, sk=sk)
 
-    async def love(self, api_sig: str, sk: str) -> None:
-        await self._http.love_track(api_sig, sk, self.artist.name, self.name)
+    async def unlove(self, *legacy: str, api_sig: Optional[str] = None, sk: Optional[str] = None) -> None:
+        if legacy:
+            api_sig, sk, _ = _legacy_auth('Track.unlove', legacy, 2)
 
-    async def unlove(self, api_sig: str, sk: str) -> None:
-        await self._http.unlove_track(api_sig, sk, self.artist.name, self.name)
+        await self._http.unlove_track(self.artist.name, self.name, api_sig=api_sig, sk=sk)
 
 class UserTrack(Track):
     __slots__ = Track.__slots__ + ('loved',)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Container
 
-from enum import Enum
 import datetime
 
 from .http import HTTPClient
@@ -11,19 +10,14 @@ from .album import Album
 from .artist import Artist
 from .track import Track, UserTrack, to_bool
 from .tag import Tag
-from .chart import WeeklyChart
+from .chart import Period, WeeklyChart
+from .backfill import ChartType, WeeklyChartBackfill
+from .serialization import Serializable
+from .paginator import Page, Paginator, single_page
 
 __all__ = ('Period', 'User')
 
-class Period(str, Enum):
-    Overall = 'overall'
-    SevenDays = '7day'
-    OneMonth = '1month'
-    ThreeMonths = '3month'
-    SixMonths = '6month'
-    OneYear = '12month'
-
-class User:
+class User(Serializable):
     __slots__ = (
         '_http',
         '_data',
@@ -72,25 +66,40 @@ class User:
 
     async def get_top_artists(
         self, period: Period = Period.Overall, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Artist]:
+    ) -> Page[Artist]:
         data = await self._http.get_user_top_artists(self.name, period, limit, page)
-        return [Artist(artist, self._http) for artist in data['topartists']['artist']]
+        items = self._http.build(lambda: [Artist(artist, self._http) for artist in data['topartists']['artist']])
+        return Page.from_attr(items, data['topartists'].get('@attr'))
 
     async def get_top_albums(
         self, period: Period = Period.Overall, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Album]:
+    ) -> Page[Album]:
         data = await self._http.get_user_top_albums(self.name, period, limit, page)
-        return [Album(album, self._http) for album in data['topalbums']['album']]
+        items = self._http.build(lambda: [Album(album, self._http) for album in data['topalbums']['album']])
+        return Page.from_attr(items, data['topalbums'].get('@attr'))
 
     async def get_top_tracks(
         self, period: Period = Period.Overall, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Track]:
+    ) -> Page[Track]:
         data = await self._http.get_user_top_tracks(self.name, period, limit, page)
-        return [Track(track, self._http) for track in data['toptracks']['track']]
+        items = self._http.build(lambda: [Track(track, self._http) for track in data['toptracks']['track']])
+        return Page.from_attr(items, data['toptracks'].get('@attr'))
 
     async def get_top_tags(self, *, limit: Optional[int] = None) -> List[Tag]:
         data = await self._http.get_user_top_tags(self.name, limit)
-        return [Tag(tag, self._http) for tag in data['toptags']['tag']]
+        return self._http.build(lambda: [Tag(tag, self._http) for tag in data['toptags']['tag']])
+
+    def iter_top_artists(self, period: Period = Period.Overall, *, limit: int = 50, **options: Any) -> Paginator[Artist]:
+        return Paginator(self.get_top_artists, period, limit=limit, **options)
+
+    def iter_top_albums(self, period: Period = Period.Overall, *, limit: int = 50, **options: Any) -> Paginator[Album]:
+        return Paginator(self.get_top_albums, period, limit=limit, **options)
+
+    def iter_top_tracks(self, period: Period = Period.Overall, *, limit: int = 50, **options: Any) -> Paginator[Track]:
+        return Paginator(self.get_top_tracks, period, limit=limit, **options)
+
+    def iter_top_tags(self, *, limit: int = 50, max: Optional[int] = None, **options: Any) -> Paginator[Tag]:
+        return Paginator(single_page(self.get_top_tags, size=max), limit=limit, max=max, **options)
 
     async def get_recent_tracks(
         self,
@@ -100,7 +109,7 @@ class User:
         start: Optional[datetime.datetime] = None,
         end: Optional[datetime.datetime] = None,
         extended: Optional[bool] = None
-    ) -> List[UserTrack]:
+    ) -> Page[UserTrack]:
         kwargs: Dict[str, Any] = {
             'limit': limit,
             'page': page,
@@ -113,7 +122,19 @@ class User:
             kwargs['to'] = int(end.timestamp())
 
         data = await self._http.get_user_recent_tracks(self.name, **kwargs)
-        return [UserTrack(track, self._http) for track in data['recenttracks']['track']]
+        items = self._http.build(lambda: [UserTrack(track, self._http) for track in data['recenttracks']['track']])
+        return Page.from_attr(items, data['recenttracks'].get('@attr'))
+
+    def iter_recent_tracks(
+        self,
+        *,
+        limit: int = 200,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+        extended: Optional[bool] = None,
+        **options: Any
+    ) -> Paginator[UserTrack]:
+        return Paginator(self.get_recent_tracks, limit=limit, start=start, end=end, extended=extended, **options)
 
     async def get_weekly_artist_chart(
         self, *, start: Optional[datetime.datetime] = None, end: Optional[datetime.datetime] = None
@@ -125,7 +146,7 @@ class User:
             kwargs['to'] = int(end.timestamp())
 
         data = await self._http.get_user_weekly_artist_chart(self.name, **kwargs)
-        return [Artist(artist, self._http) for artist in data['weeklyartistchart']['artist']]
+        return self._http.build(lambda: [Artist(artist, self._http) for artist in data['weeklyartistchart']['artist']])
 
     async def get_weekly_album_chart(
         self, *, start: Optional[datetime.datetime] = None, end: Optional[datetime.datetime] = None
@@ -137,7 +158,7 @@ class User:
             kwargs['to'] = int(end.timestamp())
 
         data = await self._http.get_user_weekly_album_chart(self.name, **kwargs)
-        return [Album(album, self._http) for album in data['weeklyalbumchart']['album']]
+        return self._http.build(lambda: [Album(album, self._http) for album in data['weeklyalbumchart']['album']])
 
     async def get_weekly_track_chart(
         self, *, start: Optional[datetime.datetime] = None, end: Optional[datetime.datetime] = None
@@ -149,32 +170,54 @@ class User:
             kwargs['to'] = int(end.timestamp())
 
         data = await self._http.get_user_weekly_track_chart(self.name, **kwargs)
-        return [Track(track, self._http) for track in data['weeklytrackchart']['track']]
+        return self._http.build(lambda: [Track(track, self._http) for track in data['weeklytrackchart']['track']])
     
     async def get_weekly_chart_list(self) -> List[WeeklyChart]:
         data = await self._http.get_user_weekly_chart_list(self.name)
         return [WeeklyChart.from_dict(chart) for chart in data['weeklychartlist']['chart']]
 
+    def backfill_weekly_charts(
+        self,
+        *types: ChartType,
+        concurrency: int = 8,
+        exclude: Optional[Container[WeeklyChart]] = None,
+        charts: Optional[Iterable[WeeklyChart]] = None
+    ) -> WeeklyChartBackfill:
+        return WeeklyChartBackfill(
+            self, types or (ChartType.Artist,), concurrency=concurrency, exclude=exclude, charts=charts
+        )
+
     async def get_loved_tracks(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[UserTrack]:
+    ) -> Page[UserTrack]:
         data = await self._http.get_user_loved_tracks(self.name, limit, page)
-        tracks: List[UserTrack] = []
 
         for track in data['lovedtracks']['track']:
             track['loved'] = '1' # A bit of a hack since the API does not provide this field
-            tracks.append(UserTrack(track, self._http))
 
-        return tracks
+        tracks = self._http.build(lambda: [UserTrack(track, self._http) for track in data['lovedtracks']['track']])
+
+        return Page.from_attr(tracks, data['lovedtracks'].get('@attr'))
     
     async def get_library_artists(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[Artist]:
+    ) -> Page[Artist]:
         data = await self._http.get_library_artists(self.name, limit, page)
-        return [Artist(artist, self._http) for artist in data['artists']['artist']]
+        items = self._http.build(lambda: [Artist(artist, self._http) for artist in data['artists']['artist']])
+        return Page.from_attr(items, data['artists'].get('@attr'))
     
     async def get_friends(
         self, *, limit: Optional[int] = None, page: Optional[int] = None
-    ) -> List[User]:
+    ) -> Page[User]:
         data = await self._http.get_user_friends(self.name, limit, page)
-        return [User(user, self._http) for user in data['friends']['user']]
+        items = self._http.build(lambda: [User(user, self._http) for user in data['friends']['user']])
+        return Page.from_attr(items, data['friends'].get('@attr'))
+
+    def iter_loved_tracks(self, *, limit: int = 50, **options: Any) -> Paginator[UserTrack]:
+        return Paginator(self.get_loved_tracks, limit=limit, **options)
+
+    def iter_library_artists(self, *, limit: int = 50, **options: Any) -> Paginator[Artist]:
+        return Paginator(self.get_library_artists, limit=limit, **options)
+
+    def iter_friends(self, *, limit: int = 50, **options: Any) -> Paginator[User]:
+        return Paginator(self.get_friends, limit=limit, **options)
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+import asyncio
+import json
+import os
+
+from .errors import RETRYABLE_ERRORS, CircuitOpen, HTTPException
+from .ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .http import HTTPClient
+    from .track import Track
+    from .album import Album, PartialAlbum
+    from .artist import Artist
+
+__all__ = ('WriteOperation', 'WriteResult', 'WritePipeline', 'WriteQueue')
+
+class WriteOperation(NamedTuple):
+    method: str
+    params: Dict[str, Any]
+
+    @classmethod
+    def love_track(cls, artist: str, track: str) -> WriteOperation:
+        return cls('track.love', {'artist': artist, 'track': track})
+
+    @classmethod
+    def unlove_track(cls, artist: str, track: str) -> WriteOperation:
+        return cls('track.unlove', {'artist': artist, 'track': track})
+
+    @classmethod
+    def add_track_tags(cls, artist: str, track: str, tags: Sequence[str]) -> WriteOperation:
+        return cls('track.addTags', {'artist': artist, 'track': track, 'tags': ','.join(tags)})
+
+    @classmethod
+    def remove_track_tag(cls, artist: str, track: str, tag: str) -> WriteOperation:
+        return cls('track.removeTag', {'artist': artist, 'track': track, 'tag': tag})
+
+    @classmethod
+    def add_album_tags(cls, artist: str, album: str, tags: Sequence[str]) -> WriteOperation:
+        return cls('album.addTags', {'artist': artist, 'album': album, 'tags': ','.join(tags)})
+
+    @classmethod
+    def remove_album_tag(cls, artist: str, album: str, tag: str) -> WriteOperation:
+        return cls('album.removeTag', {'artist': artist, 'album': album, 'tag': tag})
+
+    @classmethod
+    def add_artist_tags(cls, artist: str, tags: Sequence[str]) -> WriteOperation:
+        return cls('artist.addTags', {'artist': artist, 'tags': ','.join(tags)})
+
+    @classmethod
+    def remove_artist_tag(cls, artist: str, tag: str) -> WriteOperation:
+        return cls('artist.removeTag', {'artist': artist, 'tag': tag})
+
+class WriteResult(NamedTuple):
+    operation: WriteOperation
+    error: Optional[Exception] = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class WritePipeline:
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        concurrency: int = 4,
+        rate: float = 5.0,
+        retries: int = 3,
+        backoff: float = 1.0
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be greater than 0')
+
+        self.http = http
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.backoff = backoff
+
+    def __repr__(self) -> str:
+        return f'<WritePipeline concurrency={self.concurrency} rate={self.limiter.rate}>'
+
+    async def execute(self, operation: WriteOperation) -> WriteResult:
+        attempts = 0
+        while True:
+            attempts += 1
+            await self.limiter.acquire()
+
+            try:
+                await self.http.post(operation.method, operation.params)
+            except HTTPException as exc:
+                if exc.error not in RETRYABLE_ERRORS or attempts > self.retries:
+                    return WriteResult(operation, exc, attempts)
+
+                await asyncio.sleep(self.backoff * 2 ** (attempts - 1))
+            except CircuitOpen as exc:
+                # Nothing was sent, the operation waits for the circuit instead of failing with it.
+                if attempts > self.retries:
+                    return WriteResult(operation, exc, attempts)
+
+                await asyncio.sleep(exc.retry_after)
+            except Exception as exc:
+                return WriteResult(operation, exc, attempts)
+            else:
+                return WriteResult(operation, None, attempts)
+
+    async def _worker(self, operations: Iterator[WriteOperation], results: asyncio.Queue[Any]) -> None:
+        try:
+            for operation in operations:
+                await results.put(await self.execute(operation))
+        except Exception as exc:
+            await results.put(exc)
+        else:
+            await results.put(None)
+
+    async def run(self, operations: Iterable[WriteOperation]) -> AsyncIterator[WriteResult]:
+        # Workers share one iterator, so operations are pulled lazily and never all held in memory.
+        iterator = iter(operations)
+        results: asyncio.Queue[Any] = asyncio.Queue(self.concurrency)
+
+        workers = [asyncio.ensure_future(self._worker(iterator, results)) for _ in range(self.concurrency)]
+        remaining = len(workers)
+
+        try:
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                    continue
+                elif isinstance(result, Exception):
+                    raise result
+
+                yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+class _PendingWrites:
+    __slots__ = ('loved', 'add', 'remove')
+
+    def __init__(self, loved: Optional[bool] = None, add: Optional[List[str]] = None, remove: Optional[List[str]] = None) -> None:
+        self.loved = loved
+        self.add: List[str] = add or []
+        self.remove: List[str] = remove or []
+
+    def __bool__(self) -> bool:
+        return self.loved is not None or bool(self.add) or bool(self.remove)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'loved': self.loved, 'add': self.add, 'remove': self.remove}
+
+def _discard(tags: List[str], tag: str) -> bool:
+    lowered = tag.lower()
+    for i, existing in enumerate(tags):
+        if existing.lower() == lowered:
+            del tags[i]
+            return True
+
+    return False
+
+def _contains(tags: List[str], tag: str) -> bool:
+    lowered = tag.lower()
+    return any(existing.lower() == lowered for existing in tags)
+
+class WriteQueue:
+    MAX_TAGS = 10
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        path: Optional[str] = None,
+        interval: float = 5.0,
+        pipeline: Optional[WritePipeline] = None
+    ) -> None:
+        self.http = http
+        self.path = path
+        self.interval = interval
+        self.pipeline = pipeline or WritePipeline(http)
+
+        self._pending: Dict[Tuple[str, ...], _PendingWrites] = {}
+        self._inflight: List[WriteOperation] = []
+        self._task: Optional[asyncio.Task[None]] = None
+        # Created on first flush, inside the loop that uses it.
+        self._lock: Optional[asyncio.Lock] = None
+
+        # Operations that failed permanently, with the error message, kept until they are requeued.
+        self.failed: List[Tuple[WriteOperation, str]] = []
+
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __repr__(self) -> str:
+        return f'<WriteQueue pending={len(self)} interval={self.interval}>'
+
+    def __len__(self) -> int:
+        return len(self._inflight) + sum(1 for _ in self.operations())
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    def _key(self, entity: Union[Track, Album, PartialAlbum, Artist]) -> Tuple[str, ...]:
+        from .track import Track
+        from .album import Album, PartialAlbum
+        from .artist import Artist
+
+        if isinstance(entity, Track):
+            return ('track', entity.artist.name, entity.name)
+        elif isinstance(entity, (Album, PartialAlbum)):
+            if not entity.artist:
+                raise ValueError('Album does not have an artist')
+
+            return ('album', entity.artist, entity.name)
+        elif isinstance(entity, Artist):
+            return ('artist', entity.name)
+
+        raise TypeError(f'Expected a Track, Album or Artist, got {type(entity).__name__}')
+
+    def _get(self, key: Tuple[str, ...]) -> _PendingWrites:
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingWrites()
+
+        return pending
+
+    def _update(self, key: Tuple[str, ...]) -> None:
+        if not self._pending[key]:
+            del self._pending[key]
+
+        self.save()
+
+    # An operation that reverses one which is still pending cancels it out, since neither has reached
+    # the API yet. Anything else is merged into the entity's pending state.
+
+    def love(self, track: Track) -> None:
+        key = self._key(track)
+        if key[0] != 'track':
+            raise TypeError(f'Only tracks can be loved, got {type(track).__name__}')
+        pending = self._get(key)
+
+        pending.loved = None if pending.loved is False else True
+        self._update(key)
+
+    def unlove(self, track: Track) -> None:
+        key = self._key(track)
+        if key[0] != 'track':
+            raise TypeError(f'Only tracks can be unloved, got {type(track).__name__}')
+        pending = self._get(key)
+
+        pending.loved = None if pending.loved is True else False
+        self._update(key)
+
+    def add_tags(self, entity: Union[Track, Album, PartialAlbum, Artist], *tags: str) -> None:
+        key = self._key(entity)
+        pending = self._get(key)
+
+        for tag in tags:
+            if not _discard(pending.remove, tag) and not _contains(pending.add, tag):
+                pending.add.append(tag)
+
+        self._update(key)
+
+    def remove_tag(self, entity: Union[Track, Album, PartialAlbum, Artist], tag: str) -> None:
+        key = self._key(entity)
+        pending = self._get(key)
+
+        if not _discard(pending.add, tag) and not _contains(pending.remove, tag):
+            pending.remove.append(tag)
+
+        self._update(key)
+
+    def operations(self) -> Iterator[WriteOperation]:
+        for key, pending in self._pending.items():
+            kind, *names = key
+            if pending.loved is not None:
+                method = WriteOperation.love_track if pending.loved else WriteOperation.unlove_track
+                yield method(*names)
+
+            if kind == 'track':
+                add, remove = WriteOperation.add_track_tags, WriteOperation.remove_track_tag
+            elif kind == 'album':
+                add, remove = WriteOperation.add_album_tags, WriteOperation.remove_album_tag
+            else:
+                add, remove = WriteOperation.add_artist_tags, WriteOperation.remove_artist_tag
+
+            for i in range(0, len(pending.add), self.MAX_TAGS):
+                yield add(*names, pending.add[i:i + self.MAX_TAGS])
+
+            for tag in pending.remove:
+                yield remove(*names, tag)
+
+    async def flush(self) -> List[WriteResult]:
+        # Operations stay on disk as in-flight until the pipeline is done with each of them, so a
+        # restart mid-flush sends the unfinished ones again rather than losing them. Every write here
+        # is idempotent.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._inflight.extend(self.operations())
+            self._pending.clear()
+            self.save()
+
+            results: List[WriteResult] = []
+            async for result in self.pipeline.run(list(self._inflight)):
+                self._inflight.remove(result.operation)
+                if not result.ok:
+                    self.failed.append((result.operation, str(result.error)))
+
+                results.append(result)
+                self.save()
+
+            return results
+
+    def requeue_failed(self) -> None:
+        # Sent again with the next flush.
+        self._inflight.extend(operation for operation, _ in self.failed)
+        self.failed.clear()
+        self.save()
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+
+        # Fails loudly outside a running loop instead of scheduling onto one that may never run.
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, *, flush: bool = True) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+            self._task = None
+
+        if flush and (self._pending or self._inflight):
+            await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            if self._pending or self._inflight:
+                await self.flush()
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        data = {
+            'pending': [{'key': list(key), **pending.to_dict()} for key, pending in self._pending.items()],
+            'inflight': [[operation.method, operation.params] for operation in self._inflight],
+            'failed': [[operation.method, operation.params, error] for operation, error in self.failed]
+        }
+
+        # Write to a temporary file first so a crash mid-write never leaves a truncated queue behind.
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        os.replace(tmp, self.path)
+
+    def load(self) -> None:
+        if self.path is None:
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        for entry in data['pending']:
+            self._pending[tuple(entry['key'])] = _PendingWrites(entry['loved'], entry['add'], entry['remove'])
+
+        self._inflight.extend(WriteOperation(method, params) for method, params in data['inflight'])
+        self.failed.extend((WriteOperation(method, params), error) for method, params, error in data.get('failed', []))
@@ -7,6 +7,13 @@ setup(
     packages=['lastfm'],
     python_requires='>=3.8',
     install_requires=['aiohttp'],
+    extras_require={
+        'msgpack': ['msgpack'],
+        'msgspec': ['msgspec'],
+        'parquet': ['pyarrow'],
+        'numpy': ['numpy'],
+        'scipy': ['numpy', 'scipy']
+    },
     package_data={ 'lastfm': ['py.typed'] },
     classifiers=[
         'Typing :: Typed'
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip('scipy')
+
+from lastfm.cooccurrence import TagMatrix
+from lastfm.tag import Tag
+
+def test_zero_weights_survive_merges():
+    matrix = TagMatrix()
+    matrix.add('a', [('rock', 0), ('pop', 50)])
+    matrix.matrix
+
+    matrix.add('b', [('rock', 10)])
+
+    assert matrix.vector('a') == {'rock': 0.0, 'pop': 50.0}
+    assert [name for name, _ in matrix.related('rock')] == ['pop']
+
+def test_tag_weights():
+    matrix = TagMatrix()
+    matrix.add('a', [Tag({'name': 'Rock', 'count': '0'}, None), Tag({'name': 'pop'}, None)])
+
+    assert matrix.vector('a') == {'rock': 0.0, 'pop': 100.0}
+
+def test_readding_replaces_tags():
+    matrix = TagMatrix()
+    matrix.add('a', [('rock', 5)])
+    matrix.add('b', [('rock', 1)])
+    matrix.add('a', [('jazz', 3)])
+    matrix.add('a', [('jazz', 4)])
+
+    assert matrix.vector('a') == {'jazz': 4.0}
+    assert matrix.vector('b') == {'rock': 1.0}
+    assert matrix.cooccurrence()[matrix.tags.get('rock'), matrix.tags.get('rock')] == 1
+
+def test_batches_merge_into_one_matrix():
+    matrix = TagMatrix()
+    matrix.add('a', [('rock', 1), ('Rock', 2)])
+    matrix.matrix
+
+    matrix.add('b', [('rock', 3), ('pop', 4)])
+    matrix.add(('TUYU', 'Doctor'), [('pop', 5)])
+
+    assert matrix.matrix.shape == (3, 2)
+    assert matrix.vector('a') == {'rock': 3.0}
+    assert matrix.vector('b') == {'rock': 3.0, 'pop': 4.0}
+    assert matrix.vector(('TUYU', 'Doctor')) == {'pop': 5.0}
+    assert matrix.cooccurrence().diagonal().tolist() == [2, 2]
+
+def test_save_and_load_keep_entries(tmp_path):
+    matrix = TagMatrix()
+    matrix.add('a', [('rock', 0), ('pop', 2)])
+    matrix.add(('TUYU', 'Doctor'), [('pop', 1)])
+
+    path = str(tmp_path / 'tags.npz')
+    matrix.save(path)
+    loaded = TagMatrix.load(path)
+
+    assert loaded.vector('a') == {'rock': 0.0, 'pop': 2.0}
+    assert loaded.vector(('TUYU', 'Doctor')) == {'pop': 1.0}
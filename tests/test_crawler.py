@@ -0,0 +1,37 @@
+import asyncio
+
+from lastfm.crawler import CrawlEventType, FriendCrawler
+
+FRIENDS = {'a': ['b', 'c'], 'b': ['a'], 'c': []}
+
+def profile(name):
+    return {
+        'name': name, 'realname': '', 'url': '', 'country': '', 'gender': 'n', 'age': '0', 'playcount': '0',
+        'artist_count': '0', 'album_count': '0', 'track_count': '0', 'bootstrap': '0', 'subscriber': '0',
+    }
+
+class FakeHTTP:
+    async def get_user_friends(self, user, limit=None, page=None):
+        return {'friends': {'user': [{'name': name} for name in FRIENDS[user]], '@attr': {'totalPages': '1'}}}
+
+    async def get_user_info(self, user):
+        return {'user': profile(user)}
+
+async def collect(crawler):
+    return [event async for event in crawler]
+
+def test_crawler_runs_across_event_loops():
+    # Built outside any loop and crawled from two different ones.
+    crawler = FriendCrawler(FakeHTTP(), ['a'], max_depth=1, rate=1000)
+
+    events = asyncio.run(collect(crawler))
+    edges = sorted(event.friend for event in events if event.type is CrawlEventType.Edge)
+    profiles = sorted(event.user for event in events if event.type is CrawlEventType.Profile)
+
+    assert edges == ['b', 'c']
+    assert profiles == ['a', 'b', 'c']
+
+    crawler.max_depth = 2
+    events = asyncio.run(collect(crawler))
+
+    assert [(event.user, event.friend) for event in events] == [('b', 'a')]
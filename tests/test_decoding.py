@@ -0,0 +1,137 @@
+import typing
+
+import pytest
+
+from lastfm import decoding
+from lastfm.album import Album
+from lastfm.artist import Artist
+from lastfm.track import Track, UserTrack
+
+# StructDecoder skips every key its schemas don't list. These checks read every property of the
+# models built from list responses and fail if any key they look at would have been skipped.
+
+IMAGE = {'#text': 'https://example.com/a.png', 'size': 'small'}
+TAG = {'name': 'rock', 'url': '', 'count': '100'}
+WIKI = {'published': '', 'summary': '', 'content': ''}
+
+ARTIST = {
+    'name': 'TUYU',
+    'url': '',
+    'mbid': '',
+    'streamable': '0',
+    'ontour': '0',
+    'listeners': '1',
+    'playcount': '2',
+    'stats': {'listeners': '1', 'playcount': '2'},
+    'image': [IMAGE],
+    'tags': {'tag': [TAG]},
+    'similar': {'artist': [{'name': 'Zutomayo', 'url': '', 'image': [IMAGE]}]},
+    '@attr': {'rank': '1'},
+}
+
+TRACK = {
+    'name': 'Doctor',
+    'url': '',
+    'mbid': '',
+    'duration': '200',
+    'listeners': '1',
+    'playcount': '2',
+    'stats': {'listeners': '1', 'playcount': '2'},
+    'streamable': {'fulltrack': '0', '#text': '0'},
+    'loved': '0',
+    'artist': dict(ARTIST, **{'#text': 'TUYU'}),
+    'album': {'#text': 'Album', 'title': 'Album', 'mbid': '', 'artist': 'TUYU', 'image': [IMAGE]},
+    'image': [IMAGE],
+    'date': {'uts': '1600000000', '#text': ''},
+    'toptags': {'tag': [TAG]},
+    '@attr': {'nowplaying': 'true'},
+}
+
+ALBUM = {
+    'name': 'Album',
+    'url': '',
+    'mbid': '',
+    'listeners': '1',
+    'playcount': '2',
+    'artist': ARTIST,
+    'image': [IMAGE],
+    'wiki': WIKI,
+    'tags': {'tag': [TAG]},
+    'tracks': {'track': [TRACK]},
+    '@attr': {'rank': '1'},
+}
+
+class Recorder(dict):
+    # Records the path of every key looked up, found or not.
+    def __init__(self, data, path, reads):
+        super().__init__(data)
+        self.path = path
+        self.reads = reads
+
+    def __getitem__(self, key):
+        self.reads.add(self.path + (key,))
+        return wrap(super().__getitem__(key), self.path + (key,), self.reads)
+
+    def get(self, key, default=None):
+        self.reads.add(self.path + (key,))
+        return self[key] if dict.__contains__(self, key) else default
+
+    def __contains__(self, key):
+        self.reads.add(self.path + (key,))
+        return super().__contains__(key)
+
+def wrap(value, path, reads):
+    if isinstance(value, dict):
+        return Recorder(value, path, reads)
+    elif isinstance(value, list):
+        return [wrap(item, path + ('[]',), reads) for item in value]
+
+    return value
+
+def touch(value, depth=0):
+    if depth > 4:
+        return
+
+    if isinstance(value, list):
+        for item in value:
+            touch(item, depth + 1)
+
+        return
+
+    if not hasattr(type(value), '__slots__') or isinstance(value, (str, int, float, bool)):
+        return
+
+    for klass in type(value).__mro__:
+        for name, attribute in vars(klass).items():
+            if isinstance(attribute, property):
+                touch(getattr(value, name), depth + 1)
+
+def covered(schema, path):
+    if not path or schema is typing.Any:
+        return True
+
+    origin, args = typing.get_origin(schema), typing.get_args(schema)
+    if origin is dict:
+        return True
+    elif origin is list:
+        return path[0] == '[]' and covered(args[0], path[1:])
+    elif origin is typing.Union:
+        return any(covered(arg, path) for arg in args)
+    elif hasattr(schema, '__total__'):
+        fields = typing.get_type_hints(schema)
+        return path[0] in fields and covered(fields[path[0]], path[1:])
+
+    return False
+
+@pytest.mark.parametrize('schema, model, payload', [
+    (decoding._Track, Track, TRACK),
+    (decoding._Track, UserTrack, TRACK),
+    (decoding._Artist, Artist, ARTIST),
+    (decoding._Album, Album, ALBUM),
+])
+def test_schemas_cover_model_reads(schema, model, payload):
+    reads = set()
+    touch(model(wrap(payload, (), reads), None))
+
+    assert reads
+    assert sorted(path for path in reads if not covered(schema, path)) == []
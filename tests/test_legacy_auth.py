@@ -0,0 +1,52 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from lastfm.http import HTTPClient
+from lastfm.track import Track
+
+SIGNATURE = hashlib.md5(b'signature').hexdigest()
+
+class Recorder(HTTPClient):
+    def __init__(self):
+        super().__init__('key', None, secret='secret')
+        self.posts = []
+
+    async def post(self, method, params=None, *, api_sig=None, sk=None, **kwargs):
+        self.posts.append((method, api_sig, sk, kwargs))
+        return {}
+
+def make_track(http):
+    return Track({'name': 'Doctor', 'url': '', 'artist': {'name': 'TUYU'}}, http)
+
+def test_positional_auth_is_still_accepted():
+    async def main():
+        http = Recorder()
+        track = make_track(http)
+
+        with pytest.warns(DeprecationWarning):
+            await track.add_tags(SIGNATURE, 'session', 'rock', 'pop')
+
+        with pytest.warns(DeprecationWarning):
+            await track.love(SIGNATURE, 'session')
+
+        with pytest.warns(DeprecationWarning):
+            await http.remove_track_tag(SIGNATURE, 'session', 'TUYU', 'Doctor', 'rock')
+
+        assert http.posts == [
+            ('track.addTags', SIGNATURE, 'session', {'artist': 'TUYU', 'track': 'Doctor', 'tags': 'rock,pop'}),
+            ('track.love', SIGNATURE, 'session', {'artist': 'TUYU', 'track': 'Doctor'}),
+            ('track.removeTag', SIGNATURE, 'session', {'artist': 'TUYU', 'track': 'Doctor', 'tag': 'rock'}),
+        ]
+
+    asyncio.run(main())
+
+def test_keyword_auth():
+    async def main():
+        http = Recorder()
+        await make_track(http).add_tags('rock', 'pop', sk='session')
+
+        assert http.posts == [('track.addTags', None, 'session', {'artist': 'TUYU', 'track': 'Doctor', 'tags': 'rock,pop'})]
+
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from lastfm.paginator import MemoryCheckpointStore, MergedPaginator, Page, Paginator
+
+TOTAL = 200
+
+async def numbers(*, page, limit):
+    return Page(range((page - 1) * limit, min(page * limit, TOTAL)), total=TOTAL)
+
+async def identity(item):
+    await asyncio.sleep(0)
+    return item
+
+async def take(iterator, count):
+    items = []
+    async for item in iterator:
+        # Lets background fetches run, as a consumer doing any real work would.
+        await asyncio.sleep(0)
+
+        items.append(item)
+        if len(items) == count:
+            break
+
+    return items
+
+def test_map_concurrent_resume_does_not_skip_items():
+    async def main():
+        store = MemoryCheckpointStore()
+
+        paginator = Paginator(numbers, limit=50, checkpoint_store=store)
+        mapped = paginator.map_concurrent(identity, concurrency=4)
+        first = await take(mapped, 55)
+        await mapped.aclose()
+
+        assert first == list(range(55))
+        assert store.checkpoints[paginator.checkpoint_key]['offset'] <= 55
+
+        resumed = Paginator(numbers, limit=50, checkpoint_store=store)
+        rest = await resumed.map_concurrent(identity, concurrency=4, ordered=False).all()
+
+        assert set(first) | set(rest) == set(range(TOTAL))
+        assert paginator.checkpoint_key not in store.checkpoints
+
+    asyncio.run(main())
+
+async def evens(*, page, limit):
+    return Page(range((page - 1) * limit * 2, min(page * limit, TOTAL // 2) * 2, 2), total=TOTAL // 2)
+
+async def odds(*, page, limit):
+    return Page(range((page - 1) * limit * 2 + 1, min(page * limit, TOTAL // 2) * 2, 2), total=TOTAL // 2)
+
+def test_merged_resume_does_not_skip_items():
+    async def main():
+        store = MemoryCheckpointStore()
+
+        def sources():
+            return [Paginator(fn, limit=20, checkpoint_store=store) for fn in (evens, odds)]
+
+        merged = MergedPaginator(*sources(), key=lambda item: item)
+        first = await take(merged, 55)
+        await merged.aclose()
+
+        assert first == list(range(55))
+
+        rest = await MergedPaginator(*sources(), key=lambda item: item).all()
+        assert set(first) | set(rest) == set(range(TOTAL))
+
+    asyncio.run(main())
+
+def test_final_page_is_fitted_within_the_page_size():
+    async def main():
+        requests = []
+
+        async def deep(*, page, limit):
+            requests.append((page, limit))
+            return Page(range((page - 1) * limit, page * limit), total=100_000)
+
+        items = await Paginator(deep, limit=50, max=60, offset=49950).all()
+
+        assert items == list(range(49950, 50010))
+        assert requests == [(1000, 50), (5001, 10)]
+
+        requests.clear()
+        items = await Paginator(deep, limit=30, max=31).all()
+
+        assert items == list(range(31))
+        assert requests == [(1, 30), (31, 1)]
+
+    asyncio.run(main())
+
+def test_offset_starts_mid_page():
+    async def main():
+        items = await Paginator(numbers, limit=50, offset=120).all()
+        assert items == list(range(120, TOTAL))
+
+    asyncio.run(main())
+
+def test_max_limits_items_and_page_size():
+    async def main():
+        paginator = Paginator(numbers, limit=50, max=70)
+        assert await paginator.all() == list(range(70))
+
+        paginator = Paginator(numbers, limit=50, max=20)
+        assert paginator.limit == 20
+        assert await paginator.all() == list(range(20))
+
+    asyncio.run(main())
+
+def test_reverse_walks_from_the_end():
+    async def main():
+        assert await Paginator(numbers, limit=50, reverse=True).all() == list(range(TOTAL - 1, -1, -1))
+        assert await Paginator(numbers, limit=50, reverse=True, offset=10, max=5).all() == [189, 188, 187, 186, 185]
+
+    asyncio.run(main())
+
+def test_max_pages_caps_requests():
+    class Capped(Paginator):
+        MAX_PAGES = 2
+
+    async def main():
+        assert await Capped(numbers, limit=50, offset=20).all() == list(range(20, 100))
+
+    asyncio.run(main())
+
+def test_restore_resumes_from_checkpoint():
+    async def main():
+        paginator = Paginator(numbers, limit=50)
+        await paginator.fetch()
+        state = paginator.checkpoint()
+
+        resumed = Paginator(numbers, limit=50)
+        resumed.restore(state)
+        assert await resumed.all() == list(range(50, TOTAL))
+
+        with pytest.raises(ValueError):
+            Paginator(numbers, limit=50, reverse=True).restore(state)
+
+        with pytest.raises(ValueError):
+            Paginator(evens, limit=50).restore(state)
+
+    asyncio.run(main())
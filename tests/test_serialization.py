@@ -0,0 +1,34 @@
+import pickle
+
+import lastfm
+from lastfm.track import UserTrack
+
+TRACK = {
+    'name': 'Doctor',
+    'url': '',
+    'mbid': '',
+    'streamable': '0',
+    'artist': {'mbid': '', '#text': 'TUYU'},
+    'album': {'mbid': '', '#text': 'Album'},
+    'date': {'uts': '1600000000', '#text': ''},
+}
+
+def test_to_dict_stores_only_the_payload():
+    track = UserTrack(TRACK, None)
+
+    assert track.to_dict() == {'type': 'UserTrack', 'data': TRACK}
+
+def test_round_trip_rebuilds_parsed_fields():
+    track = UserTrack(TRACK, None)
+
+    for loaded in (lastfm.loads(track.to_dict()), pickle.loads(pickle.dumps(track))):
+        assert type(loaded) is UserTrack
+        assert loaded.name == 'Doctor'
+        assert loaded.artist.name == 'TUYU'
+        assert loaded.date.uts == track.date.uts
+
+def test_partial_album_keeps_its_artist():
+    album = UserTrack(TRACK, None).album
+    loaded = pickle.loads(pickle.dumps(album))
+
+    assert (loaded.name, loaded.artist) == (album.name, album.artist) == ('Album', 'TUYU')
@@ -0,0 +1,37 @@
+import asyncio
+import json
+
+from lastfm.artist import Artist
+from lastfm.http import HTTPClient
+from lastfm.tracing import RecordingTracer
+
+class FakeClient(HTTPClient):
+    def __init__(self, responses):
+        super().__init__('key', object(), tracer=RecordingTracer())
+        self.responses = list(responses)
+
+    async def _send(self, session, verb, params):
+        return self.responses.pop(0)
+
+def response(data):
+    return 200, 0.0, json.dumps(data).encode('utf-8')
+
+def test_model_builds_are_linked_to_their_request():
+    async def main():
+        similar = {'similarartists': {'artist': [{'name': 'A'}, {'name': 'B'}]}}
+        http = FakeClient([(429, 0.0, b''), response(similar)])
+
+        artists = await Artist({'name': 'TUYU'}, http).get_similar()
+        assert [artist.name for artist in artists] == ['A', 'B']
+
+        spans = {span.name: span for span in http.tracer.spans}
+        request, build = spans['lastfm.request'], spans['lastfm.build']
+
+        assert 'lastfm.retry_wait' in spans
+        assert spans['lastfm.retry_wait'].parent == 'lastfm.request'
+        assert build.attributes['lastfm.items'] == 2
+        assert build.attributes['lastfm.model'] == 'Artist'
+        assert build.attributes['lastfm.method'] == request.attributes['lastfm.method'] == 'artist.getSimilar'
+        assert build.attributes['lastfm.params_digest'] == request.attributes['lastfm.params_digest']
+
+    asyncio.run(main())
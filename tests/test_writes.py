@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from lastfm.artist import Artist
+from lastfm.track import Track
+from lastfm.writes import WriteOperation, WriteQueue
+
+def make_track():
+    return Track({'name': 'Doctor', 'url': '', 'artist': {'name': 'TUYU'}, 'album': {'#text': 'Album', 'mbid': ''}}, None)
+
+def test_partial_albums_are_keyed_as_albums():
+    queue = WriteQueue(None)
+    queue.add_tags(make_track().album, 'j-rock')
+
+    assert list(queue.operations()) == [WriteOperation.add_album_tags('TUYU', 'Album', ['j-rock'])]
+
+def test_unknown_entities_are_rejected():
+    queue = WriteQueue(None)
+
+    with pytest.raises(TypeError):
+        queue.add_tags('TUYU', 'j-rock')
+
+    with pytest.raises(TypeError):
+        queue.love(Artist({'name': 'TUYU'}, None))
+
+    assert not queue
+
+class FakeHTTP:
+    def __init__(self):
+        self.posts = []
+
+    async def post(self, method, params):
+        self.posts.append((method, params))
+
+def test_queue_flushes_from_any_loop():
+    http = FakeHTTP()
+    queue = WriteQueue(http)
+
+    # Built outside any loop, then used from two different ones.
+    queue.love(make_track())
+    asyncio.run(queue.flush())
+
+    queue.unlove(make_track())
+    asyncio.run(queue.flush())
+
+    assert [method for method, _ in http.posts] == ['track.love', 'track.unlove']
+
+    with pytest.raises(RuntimeError):
+        queue.start()
+
+def test_reversed_operations_cancel_out():
+    queue = WriteQueue(None)
+    track = make_track()
+
+    queue.love(track)
+    queue.unlove(track)
+    queue.add_tags(track, 'j-rock')
+    queue.remove_tag(track, 'J-Rock')
+
+    assert not queue
+    assert list(queue.operations()) == []
+
+def test_tags_are_coalesced_and_chunked():
+    queue = WriteQueue(None)
+    track = make_track()
+
+    queue.remove_tag(track, 'pop')
+    queue.add_tags(track, *[f'tag{i}' for i in range(12)], 'TAG0', 'pop')
+    queue.love(track)
+
+    assert list(queue.operations()) == [
+        WriteOperation.love_track('TUYU', 'Doctor'),
+        WriteOperation.add_track_tags('TUYU', 'Doctor', [f'tag{i}' for i in range(10)]),
+        WriteOperation.add_track_tags('TUYU', 'Doctor', ['tag10', 'tag11']),
+    ]
+
+def test_pending_writes_survive_a_restart(tmp_path):
+    path = str(tmp_path / 'writes.json')
+
+    queue = WriteQueue(None, path=path)
+    queue.love(make_track())
+    queue.add_tags(Artist({'name': 'TUYU'}, None), 'j-rock')
+
+    loaded = WriteQueue(None, path=path)
+    assert list(loaded.operations()) == list(queue.operations())